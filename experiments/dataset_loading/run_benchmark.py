@@ -0,0 +1,86 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from neuralforecast.tsdataset import TimeSeriesDataset, TimeSeriesLoader
+
+
+class PerItemTimeSeriesDataset(TimeSeriesDataset):
+    # Disables the batched fetch, the loader calls __getitem__ for every serie
+    __getitems__ = None
+
+
+def make_panel(n_series, min_size, max_size, long_size, n_exog, seed=0):
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(min_size, max_size, size=n_series)
+    sizes[0] = long_size
+    df = pd.DataFrame(
+        {
+            "unique_id": np.repeat(np.arange(n_series), sizes),
+            "ds": np.hstack([np.arange(size) for size in sizes]),
+            "y": rng.normal(size=sizes.sum()).astype(np.float32),
+        }
+    )
+    for i in range(n_exog):
+        df[f"x{i}"] = rng.normal(size=len(df)).astype(np.float32)
+    return df
+
+
+def items_per_second(dataset, batch_size, n_batches):
+    loader = TimeSeriesLoader(dataset, batch_size=batch_size, shuffle=True)
+    n_items = 0
+    start = time.perf_counter()
+    while n_items < n_batches * batch_size:
+        for batch in loader:
+            n_items += batch["temporal"].shape[0]
+            if n_items >= n_batches * batch_size:
+                break
+    return n_items / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=1_000)
+    parser.add_argument("--min_size", type=int, default=100)
+    parser.add_argument("--max_size", type=int, default=500)
+    parser.add_argument("--long_size", type=int, default=20_000)
+    parser.add_argument("--n_exog", type=int, default=2)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--n_batches", type=int, default=200)
+    args = parser.parse_args()
+
+    df = make_panel(
+        args.n_series, args.min_size, args.max_size, args.long_size, args.n_exog
+    )
+    configs = {
+        "per item (__getitem__)": (PerItemTimeSeriesDataset, 0),
+        "batched scatter": (TimeSeriesDataset, 0),
+        "padded store": (TimeSeriesDataset, 1),
+        "bucketed store (8)": (TimeSeriesDataset, 8),
+    }
+    results = []
+    for name, (dataset_cls, padded_buckets) in configs.items():
+        dataset, *_ = TimeSeriesDataset.from_df(df)
+        dataset.__class__ = dataset_cls
+        if padded_buckets:
+            dataset.padded_buckets = padded_buckets
+            start = time.perf_counter()
+            dataset._build_padded_store()
+            build_time = time.perf_counter() - start
+            store_mb = sum(x.nelement() for x in dataset._padded_store) * 4 / 2**20
+        else:
+            build_time = 0.0
+            store_mb = 0.0
+        speed = items_per_second(dataset, args.batch_size, args.n_batches)
+        results.append(
+            dict(
+                storage=name,
+                items_per_second=round(speed),
+                build_time_s=round(build_time, 3),
+                store_mb=round(store_mb, 1),
+            )
+        )
+    results = pd.DataFrame(results)
+    print(results.to_markdown(index=False))
@@ -0,0 +1,128 @@
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import pandas as pd
+import torch
+
+from neuralforecast.losses.pytorch import GMM, NBMM, PMM, DistributionLoss
+
+MIXTURES = dict(PMM=PMM, GMM=GMM, NBMM=NBMM)
+N_COMPONENTS = 5
+
+
+def distr_args(distribution, batch_size, h, generator):
+    if distribution in MIXTURES:
+        size = (batch_size, h, N_COMPONENTS)
+        if distribution == "PMM":
+            return (100 * torch.rand(size, generator=generator),)
+        if distribution == "GMM":
+            loc = 100 * torch.randn(size, generator=generator)
+            return (loc, 10 * torch.rand(size, generator=generator) + 0.1)
+        total_count = 10 * torch.rand(size, generator=generator) + 0.5
+        return (total_count, 0.9 * torch.rand(size, generator=generator) + 0.05)
+    loc = 100 * torch.randn(batch_size, h, generator=generator)
+    scale = 10 * torch.rand(batch_size, h, generator=generator) + 0.1
+    if distribution == "Normal":
+        return (loc, scale)
+    if distribution == "StudentT":
+        df = 2 + 20 * torch.rand(batch_size, h, generator=generator)
+        return (df, loc, scale)
+    return (100 * torch.rand(batch_size, h, generator=generator),)
+
+
+def run(distribution, method, n_series, batch_size, h, max_sample_bytes):
+    # Quantiles of `n_series` series predicted in batches of `batch_size` series
+    if distribution in MIXTURES:
+        loss = MIXTURES[distribution](
+            n_components=N_COMPONENTS,
+            level=[80, 90],
+            exact_quantiles=method == "exact",
+            max_sample_bytes=max_sample_bytes,
+        )
+    else:
+        loss = DistributionLoss(
+            distribution,
+            level=[80, 90],
+            exact_quantiles=method == "exact",
+            max_sample_bytes=max_sample_bytes,
+        )
+    generator = torch.Generator().manual_seed(0)
+    batches = [
+        distr_args(distribution, batch_size, h, generator)
+        for _ in range(min(4, n_series // batch_size))
+    ]
+    n_batches = n_series // batch_size
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with torch.inference_mode():
+        for i in range(n_batches):
+            args = batches[i % len(batches)]
+            loss.predict_quantiles(distr_args=args)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    return n_batches * batch_size / elapsed, peak / 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_series", type=int, default=1_000_000)
+    parser.add_argument("--n_series_sample", type=int, default=20_480)
+    parser.add_argument("--batch_size", type=int, default=1024)
+    parser.add_argument("--h", type=int, default=48)
+    parser.add_argument("--max_sample_bytes", type=int)
+    parser.add_argument(
+        "--distributions",
+        nargs="+",
+        default=["Normal", "StudentT", "Poisson", *MIXTURES],
+    )
+    parser.add_argument("--worker", nargs=2)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        distribution, method = args.worker
+        # sampling is too slow to go through the whole panel, its throughput
+        # is measured on a part of it
+        n_series = args.n_series if method == "exact" else args.n_series_sample
+        throughput, peak = run(
+            distribution,
+            method,
+            n_series,
+            args.batch_size,
+            args.h,
+            args.max_sample_bytes,
+        )
+        print(f"{throughput},{peak}")
+        sys.exit()
+
+    results = []
+    for distribution in args.distributions:
+        for method in ["sample", "exact"]:
+            # every configuration in its own process to measure its peak memory
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    *sys.argv[1:],
+                    "--worker",
+                    distribution,
+                    method,
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            throughput, peak = map(float, out.strip().splitlines()[-1].split(","))
+            results.append(
+                dict(
+                    distribution=distribution,
+                    method=method,
+                    series_per_second=round(throughput),
+                    time_1M_series_s=round(1_000_000 / throughput, 1),
+                    peak_memory_mb=round(peak),
+                )
+            )
+            print(results[-1])
+    print(pd.DataFrame(results).to_markdown(index=False))
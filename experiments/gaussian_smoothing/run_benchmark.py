@@ -0,0 +1,133 @@
+import argparse
+import time
+
+import pandas as pd
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from neuralforecast.common._modules import GaussianSmoothing
+from neuralforecast.losses.pytorch import MAE
+from neuralforecast.models import HiTransformer, HSOFTS
+
+
+class LoopSmoothing(nn.Module):
+    # Former smoothing of the models: one conv1d per series, and per window
+    # for HiTransformer, every stage filtered separately
+    def __init__(self, kernel_size, sigma, per_window=False):
+        super().__init__()
+        self.kernel_size = kernel_size
+        self.sigmas = sigma if isinstance(sigma, list) else [sigma]
+        self.per_window = per_window
+
+    def filter(self, data, sigma):
+        kernel = torch.arange(self.kernel_size, dtype=torch.float32)
+        kernel = torch.exp(-0.5 * ((kernel - (self.kernel_size - 1) / 2) / sigma) ** 2)
+        kernel = (kernel / kernel.sum()).view(1, 1, -1)
+        padding = self.kernel_size // 2
+        if not self.per_window:
+            return torch.cat(
+                [
+                    F.conv1d(data[:, :, j].unsqueeze(1), kernel, padding=padding)
+                    for j in range(data.size(2))
+                ],
+                dim=1,
+            ).permute(0, 2, 1)
+        result = torch.zeros_like(data)
+        for i in range(data.size(0)):
+            for j in range(data.size(2)):
+                result[i, :, j] = F.conv1d(
+                    data[i, :, j].view(1, 1, -1), kernel, padding=padding
+                ).view(-1)
+        return result
+
+    def forward(self, data):
+        if len(self.sigmas) == 1:
+            return self.filter(data, self.sigmas[0])
+        data = data.clone()
+        stage_size = data.size(1) // len(self.sigmas)
+        for i, sigma in enumerate(self.sigmas):
+            start = i * stage_size
+            end = data.size(1) if i == len(self.sigmas) - 1 else start + stage_size
+            data[:, start:end] = self.filter(data[:, start:end], sigma)
+        return data
+
+
+def use_loops(model):
+    if isinstance(model, HiTransformer):
+        model.staging_smoothing = LoopSmoothing(3, [1.0, 0.5, 0.2, 0.1], True)
+    else:
+        model.decomposition.smooth_filter = LoopSmoothing(3, 2.75)
+        model.decomposition.residual_filter = LoopSmoothing(3, 1.75)
+
+
+def steps_per_second(step, n_steps):
+    step()  # warm up
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        step()
+    return n_steps / (time.perf_counter() - start)
+
+
+def model_steps(name, smoothing, args):
+    # forward, backward and optimizer step on one batch of windows
+    torch.manual_seed(0)
+    model_cls = dict(HiTransformer=HiTransformer, HSOFTS=HSOFTS)[name]
+    model = model_cls(
+        h=args.h, input_size=args.input_size, n_series=args.n_series, loss=MAE()
+    )
+    if smoothing == "loop":
+        use_loops(model)
+    optimizer = torch.optim.Adam(model.parameters())
+    x = torch.randn(args.batch_size, args.input_size, args.n_series)
+    y = torch.randn(args.batch_size, args.h, args.n_series)
+
+    def step():
+        optimizer.zero_grad()
+        loss = (model(dict(insample_y=x)) - y).abs().mean()
+        loss.backward()
+        optimizer.step()
+
+    return steps_per_second(step, args.n_steps)
+
+
+def smoothing_steps(smoothing, args):
+    # HPatchTST_backbone smoothing stage, forward and backward, on one batch of
+    # univariate windows
+    if smoothing == "loop":
+        filters = LoopSmoothing(3, 2.75), LoopSmoothing(3, 1.75)
+    else:
+        filters = GaussianSmoothing(3, 2.75), GaussianSmoothing(3, 1.75)
+    z = torch.randn(args.windows_batch_size, args.input_size, 1, requires_grad=True)
+
+    def step():
+        smoothed = filters[0](z)
+        residual = filters[1](z - smoothed)
+        (smoothed + residual).sum().backward()
+
+    return steps_per_second(step, args.n_steps)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--h", type=int, default=24)
+    parser.add_argument("--input_size", type=int, default=96)
+    parser.add_argument("--n_series", type=int, default=32)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--windows_batch_size", type=int, default=1024)
+    parser.add_argument("--n_steps", type=int, default=20)
+    args = parser.parse_args()
+    torch.set_num_threads(1)
+
+    results = []
+    for name in ["HiTransformer", "HSOFTS", "HPatchTST smoothing"]:
+        for smoothing in ["loop", "grouped"]:
+            if name.startswith("HPatchTST"):
+                throughput = smoothing_steps(smoothing, args)
+            else:
+                throughput = model_steps(name, smoothing, args)
+            results.append(
+                dict(model=name, smoothing=smoothing, steps_per_second=throughput)
+            )
+            print(results[-1])
+    print(pd.DataFrame(results).round(1).to_markdown(index=False))
@@ -0,0 +1,67 @@
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from neuralforecast import NeuralForecast
+from neuralforecast.models import LSTM, NHITS
+from neuralforecast.utils import generate_series
+
+
+def request_latencies(nf, df, n_requests, trainer_free):
+    nf.predict(df=df, trainer_free=trainer_free)  # warm up
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        nf.predict(df=df, trainer_free=trainer_free)
+        latencies.append(time.perf_counter() - start)
+    return 1000 * np.array(latencies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n_requests", type=int, default=100)
+    parser.add_argument("--n_requests_1k", type=int, default=20)
+    parser.add_argument("--h", type=int, default=24)
+    parser.add_argument("--input_size", type=int, default=96)
+    args = parser.parse_args()
+    logging.getLogger("pytorch_lightning").setLevel(logging.ERROR)
+
+    train_df = generate_series(100, min_length=200, max_length=300, seed=0)
+    common = dict(
+        h=args.h,
+        input_size=args.input_size,
+        max_steps=10,
+        accelerator="cpu",
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+    )
+    results = []
+    for model in [NHITS(**common), LSTM(**common)]:
+        nf = NeuralForecast(models=[model], freq="D")
+        nf.fit(train_df)
+        for n_series in [1, 1_000]:
+            # Each request sends the recent history of its series
+            df = generate_series(
+                n_series,
+                min_length=2 * args.input_size,
+                max_length=2 * args.input_size + 1,
+                seed=1,
+            )
+            n_requests = args.n_requests if n_series == 1 else args.n_requests_1k
+            for trainer_free in [False, True]:
+                latencies = request_latencies(nf, df, n_requests, trainer_free)
+                results.append(
+                    dict(
+                        model=type(model).__name__,
+                        n_series=n_series,
+                        trainer_free=trainer_free,
+                        p50_ms=round(np.percentile(latencies, 50), 1),
+                        p99_ms=round(np.percentile(latencies, 99), 1),
+                    )
+                )
+    results = pd.DataFrame(results)
+    print(results.to_markdown(index=False))
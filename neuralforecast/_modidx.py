@@ -156,6 +156,8 @@ d = { 'settings': { 'branch': 'main',
             'neuralforecast.core': { 'neuralforecast.core.NeuralForecast': ('core.html#neuralforecast', 'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.__init__': ( 'core.html#neuralforecast.__init__',
                                                                                       'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._append_to_dataset': ( 'core.html#neuralforecast._append_to_dataset',
+                                                                                                'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._check_nan': ( 'core.html#neuralforecast._check_nan',
                                                                                         'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._get_model_names': ( 'core.html#neuralforecast._get_model_names',
@@ -166,6 +168,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._no_refit_cross_validation': ( 'core.html#neuralforecast._no_refit_cross_validation',
                                                                                                         'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._parallel_refit_windows': ( 'core.html#neuralforecast._parallel_refit_windows',
+                                                                                                     'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._predict_distributed': ( 'core.html#neuralforecast._predict_distributed',
                                                                                                   'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit': ( 'core.html#neuralforecast._prepare_fit',
@@ -174,6 +178,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._prepare_fit_for_local_files': ( 'core.html#neuralforecast._prepare_fit_for_local_files',
                                                                                                           'neuralforecast/core.py'),
+                                     'neuralforecast.core.NeuralForecast._refit_window': ( 'core.html#neuralforecast._refit_window',
+                                                                                           'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._reset_models': ( 'core.html#neuralforecast._reset_models',
                                                                                            'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast._scalers_fit_transform': ( 'core.html#neuralforecast._scalers_fit_transform',
@@ -195,9 +201,12 @@ d = { 'settings': { 'branch': 'main',
                                      'neuralforecast.core.NeuralForecast.predict_insample': ( 'core.html#neuralforecast.predict_insample',
                                                                                               'neuralforecast/core.py'),
                                      'neuralforecast.core.NeuralForecast.save': ('core.html#neuralforecast.save', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._cv_worker_windows': ('core.html#_cv_worker_windows', 'neuralforecast/core.py'),
                                      'neuralforecast.core._id_as_idx': ('core.html#_id_as_idx', 'neuralforecast/core.py'),
+                                     'neuralforecast.core._init_cv_worker': ('core.html#_init_cv_worker', 'neuralforecast/core.py'),
                                      'neuralforecast.core._insample_times': ('core.html#_insample_times', 'neuralforecast/core.py'),
                                      'neuralforecast.core._warn_id_as_idx': ('core.html#_warn_id_as_idx', 'neuralforecast/core.py')},
+            'neuralforecast.layers.kan': {},
             'neuralforecast.losses.numpy': { 'neuralforecast.losses.numpy._divide_no_nan': ( 'losses.numpy.html#_divide_no_nan',
                                                                                              'neuralforecast/losses/numpy.py'),
                                              'neuralforecast.losses.numpy._metric_protections': ( 'losses.numpy.html#_metric_protections',
@@ -280,6 +289,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.get_distribution': ( 'losses.pytorch.html#distributionloss.get_distribution',
                                                                                                                     'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.DistributionLoss.predict_quantiles': ( 'losses.pytorch.html#distributionloss.predict_quantiles',
+                                                                                                                     'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.DistributionLoss.sample': ( 'losses.pytorch.html#distributionloss.sample',
                                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM': ( 'losses.pytorch.html#gmm',
@@ -292,6 +303,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.neglog_likelihood': ( 'losses.pytorch.html#gmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.GMM.predict_quantiles': ( 'losses.pytorch.html#gmm.predict_quantiles',
+                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.sample': ( 'losses.pytorch.html#gmm.sample',
                                                                                              'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.GMM.scale_decouple': ( 'losses.pytorch.html#gmm.scale_decouple',
@@ -380,6 +393,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.neglog_likelihood': ( 'losses.pytorch.html#nbmm.neglog_likelihood',
                                                                                                          'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.NBMM.predict_quantiles': ( 'losses.pytorch.html#nbmm.predict_quantiles',
+                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.sample': ( 'losses.pytorch.html#nbmm.sample',
                                                                                               'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.NBMM.scale_decouple': ( 'losses.pytorch.html#nbmm.scale_decouple',
@@ -394,6 +409,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.neglog_likelihood': ( 'losses.pytorch.html#pmm.neglog_likelihood',
                                                                                                         'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.PMM.predict_quantiles': ( 'losses.pytorch.html#pmm.predict_quantiles',
+                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.sample': ( 'losses.pytorch.html#pmm.sample',
                                                                                              'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.PMM.scale_decouple': ( 'losses.pytorch.html#pmm.scale_decouple',
@@ -444,14 +461,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.Tweedie.variance': ( 'losses.pytorch.html#tweedie.variance',
                                                                                                    'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch._betainc': ( 'losses.pytorch.html#_betainc',
+                                                                                           'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch._divide_no_nan': ( 'losses.pytorch.html#_divide_no_nan',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch._icdf_dtype': ( 'losses.pytorch.html#_icdf_dtype',
+                                                                                              'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch._weighted_mean': ( 'losses.pytorch.html#_weighted_mean',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.bernoulli_domain_map': ( 'losses.pytorch.html#bernoulli_domain_map',
                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.bernoulli_scale_decouple': ( 'losses.pytorch.html#bernoulli_scale_decouple',
                                                                                                            'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.discrete_mixture_icdf': ( 'losses.pytorch.html#discrete_mixture_icdf',
+                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.est_alpha': ( 'losses.pytorch.html#est_alpha',
                                                                                             'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.est_beta': ( 'losses.pytorch.html#est_beta',
@@ -464,16 +487,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.level_to_outputs': ( 'losses.pytorch.html#level_to_outputs',
                                                                                                    'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.mixture_icdf': ( 'losses.pytorch.html#mixture_icdf',
+                                                                                               'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_domain_map': ( 'losses.pytorch.html#nbinomial_domain_map',
                                                                                                        'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.nbinomial_scale_decouple': ( 'losses.pytorch.html#nbinomial_scale_decouple',
                                                                                                            'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.normal_domain_map': ( 'losses.pytorch.html#normal_domain_map',
                                                                                                     'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.normal_icdf': ( 'losses.pytorch.html#normal_icdf',
+                                                                                              'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.normal_mixture_icdf': ( 'losses.pytorch.html#normal_mixture_icdf',
+                                                                                                      'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.normal_scale_decouple': ( 'losses.pytorch.html#normal_scale_decouple',
                                                                                                         'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.poisson_domain_map': ( 'losses.pytorch.html#poisson_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.poisson_icdf': ( 'losses.pytorch.html#poisson_icdf',
+                                                                                               'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.poisson_scale_decouple': ( 'losses.pytorch.html#poisson_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.quantiles_to_outputs': ( 'losses.pytorch.html#quantiles_to_outputs',
@@ -490,8 +521,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.sCRPS.__init__': ( 'losses.pytorch.html#scrps.__init__',
                                                                                                  'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.sample_in_chunks': ( 'losses.pytorch.html#sample_in_chunks',
+                                                                                                   'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.student_domain_map': ( 'losses.pytorch.html#student_domain_map',
                                                                                                      'neuralforecast/losses/pytorch.py'),
+                                               'neuralforecast.losses.pytorch.student_icdf': ( 'losses.pytorch.html#student_icdf',
+                                                                                               'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.student_scale_decouple': ( 'losses.pytorch.html#student_scale_decouple',
                                                                                                          'neuralforecast/losses/pytorch.py'),
                                                'neuralforecast.losses.pytorch.tweedie_domain_map': ( 'losses.pytorch.html#tweedie_domain_map',
@@ -764,6 +799,224 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'neuralforecast/models/hint.py'),
                                             'neuralforecast.models.hint.get_mintrace_wls_P': ( 'models.hint.html#get_mintrace_wls_p',
                                                                                                'neuralforecast/models/hint.py')},
+            'neuralforecast.models.hitransformer': { 'neuralforecast.models.hitransformer.DataEmbedding_inverted': ( 'models.hitransformer.html#dataembedding_inverted',
+                                                                                                                     'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.DataEmbedding_inverted.__init__': ( 'models.hitransformer.html#dataembedding_inverted.__init__',
+                                                                                                                              'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.DataEmbedding_inverted.forward': ( 'models.hitransformer.html#dataembedding_inverted.forward',
+                                                                                                                             'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.FullAttention': ( 'models.hitransformer.html#fullattention',
+                                                                                                            'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.FullAttention.__init__': ( 'models.hitransformer.html#fullattention.__init__',
+                                                                                                                     'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.FullAttention.forward': ( 'models.hitransformer.html#fullattention.forward',
+                                                                                                                    'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer': ( 'models.hitransformer.html#hitransformer',
+                                                                                                            'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.__init__': ( 'models.hitransformer.html#hitransformer.__init__',
+                                                                                                                     'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.ewma': ( 'models.hitransformer.html#hitransformer.ewma',
+                                                                                                                 'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.forecast': ( 'models.hitransformer.html#hitransformer.forecast',
+                                                                                                                     'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.forward': ( 'models.hitransformer.html#hitransformer.forward',
+                                                                                                                    'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.gaussian_filter': ( 'models.hitransformer.html#hitransformer.gaussian_filter',
+                                                                                                                            'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.multi_ewma': ( 'models.hitransformer.html#hitransformer.multi_ewma',
+                                                                                                                       'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.HiTransformer.staging_gauss': ( 'models.hitransformer.html#hitransformer.staging_gauss',
+                                                                                                                          'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.TriangularCausalMask': ( 'models.hitransformer.html#triangularcausalmask',
+                                                                                                                   'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.TriangularCausalMask.__init__': ( 'models.hitransformer.html#triangularcausalmask.__init__',
+                                                                                                                            'neuralforecast/models/hitransformer.py'),
+                                                     'neuralforecast.models.hitransformer.TriangularCausalMask.mask': ( 'models.hitransformer.html#triangularcausalmask.mask',
+                                                                                                                        'neuralforecast/models/hitransformer.py')},
+            'neuralforecast.models.hitransformer_bkp': { 'neuralforecast.models.hitransformer_bkp.DataEmbedding_inverted': ( 'models.hitransformer.html#dataembedding_inverted',
+                                                                                                                             'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.DataEmbedding_inverted.__init__': ( 'models.hitransformer.html#dataembedding_inverted.__init__',
+                                                                                                                                      'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.DataEmbedding_inverted.forward': ( 'models.hitransformer.html#dataembedding_inverted.forward',
+                                                                                                                                     'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.FullAttention': ( 'models.hitransformer.html#fullattention',
+                                                                                                                    'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.FullAttention.__init__': ( 'models.hitransformer.html#fullattention.__init__',
+                                                                                                                             'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.FullAttention.forward': ( 'models.hitransformer.html#fullattention.forward',
+                                                                                                                            'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.HiTransformer': ( 'models.hitransformer.html#hitransformer',
+                                                                                                                    'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.HiTransformer.__init__': ( 'models.hitransformer.html#hitransformer.__init__',
+                                                                                                                             'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.HiTransformer.forecast': ( 'models.hitransformer.html#hitransformer.forecast',
+                                                                                                                             'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.HiTransformer.forward': ( 'models.hitransformer.html#hitransformer.forward',
+                                                                                                                            'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.TriangularCausalMask': ( 'models.hitransformer.html#triangularcausalmask',
+                                                                                                                           'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.TriangularCausalMask.__init__': ( 'models.hitransformer.html#triangularcausalmask.__init__',
+                                                                                                                                    'neuralforecast/models/hitransformer_bkp.py'),
+                                                         'neuralforecast.models.hitransformer_bkp.TriangularCausalMask.mask': ( 'models.hitransformer.html#triangularcausalmask.mask',
+                                                                                                                                'neuralforecast/models/hitransformer_bkp.py')},
+            'neuralforecast.models.hitransformer_bkp_2': { 'neuralforecast.models.hitransformer_bkp_2.DataEmbedding_inverted': ( 'models.hitransformer.html#dataembedding_inverted',
+                                                                                                                                 'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.DataEmbedding_inverted.__init__': ( 'models.hitransformer.html#dataembedding_inverted.__init__',
+                                                                                                                                          'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.DataEmbedding_inverted.forward': ( 'models.hitransformer.html#dataembedding_inverted.forward',
+                                                                                                                                         'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.FullAttention': ( 'models.hitransformer.html#fullattention',
+                                                                                                                        'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.FullAttention.__init__': ( 'models.hitransformer.html#fullattention.__init__',
+                                                                                                                                 'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.FullAttention.forward': ( 'models.hitransformer.html#fullattention.forward',
+                                                                                                                                'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.HiTransformer': ( 'models.hitransformer.html#hitransformer',
+                                                                                                                        'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.HiTransformer.__init__': ( 'models.hitransformer.html#hitransformer.__init__',
+                                                                                                                                 'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.HiTransformer.forecast': ( 'models.hitransformer.html#hitransformer.forecast',
+                                                                                                                                 'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.HiTransformer.forward': ( 'models.hitransformer.html#hitransformer.forward',
+                                                                                                                                'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.TriangularCausalMask': ( 'models.hitransformer.html#triangularcausalmask',
+                                                                                                                               'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.TriangularCausalMask.__init__': ( 'models.hitransformer.html#triangularcausalmask.__init__',
+                                                                                                                                        'neuralforecast/models/hitransformer_bkp_2.py'),
+                                                           'neuralforecast.models.hitransformer_bkp_2.TriangularCausalMask.mask': ( 'models.hitransformer.html#triangularcausalmask.mask',
+                                                                                                                                    'neuralforecast/models/hitransformer_bkp_2.py')},
+            'neuralforecast.models.hpatchtst': { 'neuralforecast.models.hpatchtst.Coord1dPosEncoding': ( 'models.hpatchtst.html#coord1dposencoding',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.Coord2dPosEncoding': ( 'models.hpatchtst.html#coord2dposencoding',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.DataEmbedding_inverted': ( 'models.hpatchtst.html#dataembedding_inverted',
+                                                                                                             'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.DataEmbedding_inverted.__init__': ( 'models.hpatchtst.html#dataembedding_inverted.__init__',
+                                                                                                                      'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.DataEmbedding_inverted.calculate_slope_embedding': ( 'models.hpatchtst.html#dataembedding_inverted.calculate_slope_embedding',
+                                                                                                                                       'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.DataEmbedding_inverted.forward': ( 'models.hpatchtst.html#dataembedding_inverted.forward',
+                                                                                                                     'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.Flatten_Head': ( 'models.hpatchtst.html#flatten_head',
+                                                                                                   'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.Flatten_Head.__init__': ( 'models.hpatchtst.html#flatten_head.__init__',
+                                                                                                            'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.Flatten_Head.forward': ( 'models.hpatchtst.html#flatten_head.forward',
+                                                                                                           'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST': ( 'models.hpatchtst.html#hpatchtst',
+                                                                                                'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST.__init__': ( 'models.hpatchtst.html#hpatchtst.__init__',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST.forward': ( 'models.hpatchtst.html#hpatchtst.forward',
+                                                                                                        'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST_backbone': ( 'models.hpatchtst.html#hpatchtst_backbone',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST_backbone.__init__': ( 'models.hpatchtst.html#hpatchtst_backbone.__init__',
+                                                                                                                  'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST_backbone.create_pretrain_head': ( 'models.hpatchtst.html#hpatchtst_backbone.create_pretrain_head',
+                                                                                                                              'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST_backbone.forward': ( 'models.hpatchtst.html#hpatchtst_backbone.forward',
+                                                                                                                 'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HPatchTST_backbone.gaussian_filter': ( 'models.hpatchtst.html#hpatchtst_backbone.gaussian_filter',
+                                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTSTiEncoder': ( 'models.hpatchtst.html#htstiencoder',
+                                                                                                   'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTSTiEncoder.__init__': ( 'models.hpatchtst.html#htstiencoder.__init__',
+                                                                                                            'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTSTiEncoder.forward': ( 'models.hpatchtst.html#htstiencoder.forward',
+                                                                                                           'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTranspose': ( 'models.hpatchtst.html#htranspose',
+                                                                                                 'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTranspose.__init__': ( 'models.hpatchtst.html#htranspose.__init__',
+                                                                                                          'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.HTranspose.forward': ( 'models.hpatchtst.html#htranspose.forward',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.PositionalEncoding': ( 'models.hpatchtst.html#positionalencoding',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN': ( 'models.hpatchtst.html#revin',
+                                                                                            'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN.__init__': ( 'models.hpatchtst.html#revin.__init__',
+                                                                                                     'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN._denormalize': ( 'models.hpatchtst.html#revin._denormalize',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN._get_statistics': ( 'models.hpatchtst.html#revin._get_statistics',
+                                                                                                            'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN._init_params': ( 'models.hpatchtst.html#revin._init_params',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN._normalize': ( 'models.hpatchtst.html#revin._normalize',
+                                                                                                       'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.RevIN.forward': ( 'models.hpatchtst.html#revin.forward',
+                                                                                                    'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoder': ( 'models.hpatchtst.html#tstencoder',
+                                                                                                 'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoder.__init__': ( 'models.hpatchtst.html#tstencoder.__init__',
+                                                                                                          'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoder.forward': ( 'models.hpatchtst.html#tstencoder.forward',
+                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoderLayer': ( 'models.hpatchtst.html#tstencoderlayer',
+                                                                                                      'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoderLayer.__init__': ( 'models.hpatchtst.html#tstencoderlayer.__init__',
+                                                                                                               'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.TSTEncoderLayer.forward': ( 'models.hpatchtst.html#tstencoderlayer.forward',
+                                                                                                              'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._MultiheadAttention': ( 'models.hpatchtst.html#_multiheadattention',
+                                                                                                          'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._MultiheadAttention.__init__': ( 'models.hpatchtst.html#_multiheadattention.__init__',
+                                                                                                                   'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._MultiheadAttention.forward': ( 'models.hpatchtst.html#_multiheadattention.forward',
+                                                                                                                  'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._ScaledDotProductAttention': ( 'models.hpatchtst.html#_scaleddotproductattention',
+                                                                                                                 'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._ScaledDotProductAttention.__init__': ( 'models.hpatchtst.html#_scaleddotproductattention.__init__',
+                                                                                                                          'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst._ScaledDotProductAttention.forward': ( 'models.hpatchtst.html#_scaleddotproductattention.forward',
+                                                                                                                         'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.get_activation_fn': ( 'models.hpatchtst.html#get_activation_fn',
+                                                                                                        'neuralforecast/models/hpatchtst.py'),
+                                                 'neuralforecast.models.hpatchtst.positional_encoding': ( 'models.hpatchtst.html#positional_encoding',
+                                                                                                          'neuralforecast/models/hpatchtst.py')},
+            'neuralforecast.models.hsofts': { 'neuralforecast.models.hsofts.DataEmbedding_inverted': ( 'models.hsofts.html#dataembedding_inverted',
+                                                                                                       'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted.__init__': ( 'models.hsofts.html#dataembedding_inverted.__init__',
+                                                                                                                'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted.calculate_slope_embedding': ( 'models.hsofts.html#dataembedding_inverted.calculate_slope_embedding',
+                                                                                                                                 'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted.forward': ( 'models.hsofts.html#dataembedding_inverted.forward',
+                                                                                                               'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted_orig': ( 'models.hsofts.html#dataembedding_inverted_orig',
+                                                                                                            'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted_orig.__init__': ( 'models.hsofts.html#dataembedding_inverted_orig.__init__',
+                                                                                                                     'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.DataEmbedding_inverted_orig.forward': ( 'models.hsofts.html#dataembedding_inverted_orig.forward',
+                                                                                                                    'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS': ( 'models.hsofts.html#hsofts',
+                                                                                       'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.__init__': ( 'models.hsofts.html#hsofts.__init__',
+                                                                                                'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.estimate_frequency': ( 'models.hsofts.html#hsofts.estimate_frequency',
+                                                                                                          'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.forecast': ( 'models.hsofts.html#hsofts.forecast',
+                                                                                                'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.forward': ( 'models.hsofts.html#hsofts.forward',
+                                                                                               'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.gaussian_filter': ( 'models.hsofts.html#hsofts.gaussian_filter',
+                                                                                                       'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.min_max_rescale': ( 'models.hsofts.html#hsofts.min_max_rescale',
+                                                                                                       'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.HSOFTS.normalize_frequencies': ( 'models.hsofts.html#hsofts.normalize_frequencies',
+                                                                                                             'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.PositionalEncoding': ( 'models.hsofts.html#positionalencoding',
+                                                                                                   'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.PositionalEncoding.__init__': ( 'models.hsofts.html#positionalencoding.__init__',
+                                                                                                            'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.PositionalEncoding.forward': ( 'models.hsofts.html#positionalencoding.forward',
+                                                                                                           'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.STAD': ( 'models.hsofts.html#stad',
+                                                                                     'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.STAD.__init__': ( 'models.hsofts.html#stad.__init__',
+                                                                                              'neuralforecast/models/hsofts.py'),
+                                              'neuralforecast.models.hsofts.STAD.forward': ( 'models.hsofts.html#stad.forward',
+                                                                                             'neuralforecast/models/hsofts.py')},
             'neuralforecast.models.informer': { 'neuralforecast.models.informer.ConvLayer': ( 'models.informer.html#convlayer',
                                                                                               'neuralforecast/models/informer.py'),
                                                 'neuralforecast.models.informer.ConvLayer.__init__': ( 'models.informer.html#convlayer.__init__',
@@ -1409,8 +1662,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getitem__': ( 'tsdataset.html#localfilestimeseriesdataset.__getitem__',
                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getitems__': ( 'tsdataset.html#localfilestimeseriesdataset.__getitems__',
+                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__getstate__': ( 'tsdataset.html#localfilestimeseriesdataset.__getstate__',
+                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.__init__': ( 'tsdataset.html#localfilestimeseriesdataset.__init__',
                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._item_temporal_cols': ( 'tsdataset.html#localfilestimeseriesdataset._item_temporal_cols',
+                                                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._map': ( 'tsdataset.html#localfilestimeseriesdataset._map',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._padded_temporal': ( 'tsdataset.html#localfilestimeseriesdataset._padded_temporal',
+                                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset._read_serie': ( 'tsdataset.html#localfilestimeseriesdataset._read_serie',
+                                                                                                                'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.LocalFilesTimeSeriesDataset.from_data_directories': ( 'tsdataset.html#localfilestimeseriesdataset.from_data_directories',
                                                                                                                           'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule': ( 'tsdataset.html#timeseriesdatamodule',
@@ -1429,26 +1694,58 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__getitem__': ( 'tsdataset.html#timeseriesdataset.__getitem__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getitems__': ( 'tsdataset.html#timeseriesdataset.__getitems__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__getstate__': ( 'tsdataset.html#timeseriesdataset.__getstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__init__': ( 'tsdataset.html#timeseriesdataset.__init__',
                                                                                                    'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.__repr__': ( 'tsdataset.html#timeseriesdataset.__repr__',
                                                                                                    'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.__setstate__': ( 'tsdataset.html#timeseriesdataset.__setstate__',
+                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._build_padded_store': ( 'tsdataset.html#timeseriesdataset._build_padded_store',
+                                                                                                              'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._compute_valid_windows': ( 'tsdataset.html#timeseriesdataset._compute_valid_windows',
+                                                                                                                 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._mark_modified': ( 'tsdataset.html#timeseriesdataset._mark_modified',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._mmap_path': ( 'tsdataset.html#timeseriesdataset._mmap_path',
+                                                                                                     'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._open_temporal': ( 'tsdataset.html#timeseriesdataset._open_temporal',
+                                                                                                         'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._padded_temporal': ( 'tsdataset.html#timeseriesdataset._padded_temporal',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset._scatter_temporal': ( 'tsdataset.html#timeseriesdataset._scatter_temporal',
+                                                                                                            'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.align': ( 'tsdataset.html#timeseriesdataset.align',
                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.append': ( 'tsdataset.html#timeseriesdataset.append',
                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.from_df': ( 'tsdataset.html#timeseriesdataset.from_df',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.load': ( 'tsdataset.html#timeseriesdataset.load',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.save': ( 'tsdataset.html#timeseriesdataset.save',
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.subset_dataset': ( 'tsdataset.html#timeseriesdataset.subset_dataset',
+                                                                                                         'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.trim_dataset': ( 'tsdataset.html#timeseriesdataset.trim_dataset',
                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataset.update_dataset': ( 'tsdataset.html#timeseriesdataset.update_dataset',
                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataset.valid_windows': ( 'tsdataset.html#timeseriesdataset.valid_windows',
+                                                                                                        'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader': ( 'tsdataset.html#timeseriesloader',
                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader.__init__': ( 'tsdataset.html#timeseriesloader.__init__',
                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesLoader.__iter__': ( 'tsdataset.html#timeseriesloader.__iter__',
+                                                                                                  'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesLoader._collate_fn': ( 'tsdataset.html#timeseriesloader._collate_fn',
                                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._BatchIdxs': ( 'tsdataset.html#_batchidxs',
+                                                                                   'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule': ( 'tsdataset.html#_distributedtimeseriesdatamodule',
                                                                                                          'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._DistributedTimeSeriesDataModule.__init__': ( 'tsdataset.html#_distributedtimeseriesdatamodule.__init__',
@@ -1458,7 +1755,46 @@ d = { 'settings': { 'branch': 'main',
                                           'neuralforecast.tsdataset._FilesDataset': ( 'tsdataset.html#_filesdataset',
                                                                                       'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset._FilesDataset.__init__': ( 'tsdataset.html#_filesdataset.__init__',
-                                                                                               'neuralforecast/tsdataset.py')},
+                                                                                               'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LRUCache': ('tsdataset.html#_lrucache', 'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LRUCache.__init__': ( 'tsdataset.html#_lrucache.__init__',
+                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LRUCache.get': ( 'tsdataset.html#_lrucache.get',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LRUCache.put': ( 'tsdataset.html#_lrucache.put',
+                                                                                      'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LengthBucketBatchSampler': ( 'tsdataset.html#_lengthbucketbatchsampler',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LengthBucketBatchSampler.__init__': ( 'tsdataset.html#_lengthbucketbatchsampler.__init__',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LengthBucketBatchSampler.__iter__': ( 'tsdataset.html#_lengthbucketbatchsampler.__iter__',
+                                                                                                           'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LengthBucketBatchSampler.__len__': ( 'tsdataset.html#_lengthbucketbatchsampler.__len__',
+                                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._LengthBucketBatchSampler._pad_size': ( 'tsdataset.html#_lengthbucketbatchsampler._pad_size',
+                                                                                                            'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator': ( 'tsdataset.html#_prefetchiterator',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__del__': ( 'tsdataset.html#_prefetchiterator.__del__',
+                                                                                                  'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__init__': ( 'tsdataset.html#_prefetchiterator.__init__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__iter__': ( 'tsdataset.html#_prefetchiterator.__iter__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator.__next__': ( 'tsdataset.html#_prefetchiterator.__next__',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator._produce': ( 'tsdataset.html#_prefetchiterator._produce',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator._request': ( 'tsdataset.html#_prefetchiterator._request',
+                                                                                                   'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._PrefetchIterator._stop': ( 'tsdataset.html#_prefetchiterator._stop',
+                                                                                                'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._from_index_entry': ( 'tsdataset.html#_from_index_entry',
+                                                                                          'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._scan_directory': ( 'tsdataset.html#_scan_directory',
+                                                                                        'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset._to_index_entry': ( 'tsdataset.html#_to_index_entry',
+                                                                                        'neuralforecast/tsdataset.py')},
             'neuralforecast.utils': { 'neuralforecast.utils.DayOfMonth': ('utils.html#dayofmonth', 'neuralforecast/utils.py'),
                                       'neuralforecast.utils.DayOfMonth.__call__': ( 'utils.html#dayofmonth.__call__',
                                                                                     'neuralforecast/utils.py'),
@@ -88,6 +88,8 @@ class AutoRNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
         """Auto RNN
 
@@ -113,6 +115,8 @@ class AutoRNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -163,6 +167,8 @@ class AutoLSTM(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -184,6 +190,8 @@ class AutoLSTM(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -234,6 +242,8 @@ class AutoGRU(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -255,6 +265,8 @@ class AutoGRU(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -304,6 +316,8 @@ class AutoTCN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -325,6 +339,8 @@ class AutoTCN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -377,6 +393,8 @@ class AutoDeepAR(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -398,6 +416,8 @@ class AutoDeepAR(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -447,6 +467,8 @@ class AutoDilatedRNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -468,6 +490,8 @@ class AutoDilatedRNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -517,6 +541,8 @@ class AutoBiTCN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -538,6 +564,8 @@ class AutoBiTCN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -585,6 +613,8 @@ class AutoMLP(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -606,6 +636,8 @@ class AutoMLP(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -651,6 +683,8 @@ class AutoNBEATS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -672,6 +706,8 @@ class AutoNBEATS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -717,6 +753,8 @@ class AutoNBEATSx(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -738,6 +776,8 @@ class AutoNBEATSx(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -796,6 +836,8 @@ class AutoNHITS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -817,6 +859,8 @@ class AutoNHITS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -863,6 +907,8 @@ class AutoDLinear(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -884,6 +930,8 @@ class AutoDLinear(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -929,6 +977,8 @@ class AutoNLinear(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -950,6 +1000,8 @@ class AutoNLinear(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1003,6 +1055,8 @@ class AutoTiDE(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1024,6 +1078,8 @@ class AutoTiDE(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1072,6 +1128,8 @@ class AutoDeepNPTS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1093,6 +1151,8 @@ class AutoDeepNPTS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1141,6 +1201,8 @@ class AutoKAN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1162,6 +1224,8 @@ class AutoKAN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1209,6 +1273,8 @@ class AutoTFT(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1230,6 +1296,8 @@ class AutoTFT(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1277,6 +1345,8 @@ class AutoVanillaTransformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1298,6 +1368,8 @@ class AutoVanillaTransformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1345,6 +1417,8 @@ class AutoInformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1366,6 +1440,8 @@ class AutoInformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1413,6 +1489,8 @@ class AutoAutoformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1434,6 +1512,8 @@ class AutoAutoformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1480,6 +1560,8 @@ class AutoFEDformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1501,6 +1583,8 @@ class AutoFEDformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1550,6 +1634,8 @@ class AutoPatchTST(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1571,6 +1657,8 @@ class AutoPatchTST(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1619,6 +1707,8 @@ class AutoiTransformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1651,6 +1741,8 @@ class AutoiTransformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1703,6 +1795,8 @@ class AutoTimesNet(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1724,6 +1818,8 @@ class AutoTimesNet(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1772,6 +1868,8 @@ class AutoStemGNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1804,6 +1902,8 @@ class AutoStemGNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -1844,6 +1944,8 @@ class AutoHINT(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         super(AutoHINT, self).__init__(
@@ -1861,6 +1963,8 @@ class AutoHINT(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
         if backend == "optuna":
             raise Exception("Optuna is not supported for AutoHINT.")
@@ -1930,6 +2034,8 @@ class AutoTSMixer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -1962,6 +2068,8 @@ class AutoTSMixer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -2016,6 +2124,8 @@ class AutoTSMixerx(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -2048,6 +2158,8 @@ class AutoTSMixerx(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -2101,6 +2213,8 @@ class AutoMLPMultivariate(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -2133,6 +2247,8 @@ class AutoMLPMultivariate(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -2186,6 +2302,8 @@ class AutoSOFTS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -2218,6 +2336,8 @@ class AutoSOFTS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
@@ -2272,6 +2392,8 @@ class AutoTimeMixer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
 
         # Define search space, input/output sizes
@@ -2304,6 +2426,8 @@ class AutoTimeMixer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            fidelities=fidelities,
         )
 
     @classmethod
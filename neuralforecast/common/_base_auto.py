@@ -4,17 +4,27 @@
 __all__ = ['BaseAuto']
 
 # %% ../../nbs/common.base_auto.ipynb 5
+import inspect
+import math
+import os
+import shutil
+import tempfile
 import warnings
+from contextlib import contextmanager
 from copy import deepcopy
 from os import cpu_count
 
+import numpy as np
 import torch
 import pytorch_lightning as pl
 
+import ray
 from ray import air, tune
 from ray.tune.integration.pytorch_lightning import TuneReportCallback
 from ray.tune.search.basic_variant import BasicVariantGenerator
 
+from ..tsdataset import TimeSeriesDataset
+
 # %% ../../nbs/common.base_auto.ipynb 6
 class MockTrial:
     def suggest_int(*args, **kwargs):
@@ -36,6 +46,33 @@ class MockTrial:
             return "quantized_loguniform"
         return "float"
 
+
+# key of the promoted configs in the param_space of ray
+_PROMOTED_CONFIG = "_promoted_config"
+
+
+def _dir_nbytes(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class _OptunaPruningCallback(pl.Callback):
+    """Reports the validation losses of a trial to optuna and stops its training
+    at the next validation once the pruner decides to prune it."""
+
+    def __init__(self, trial):
+        self.trial = trial
+        self.pruned = False
+
+    def on_validation_end(self, trainer, pl_module):
+        # the loss is recorded by `BaseModel.on_validation_epoch_end`
+        if trainer.sanity_checking or not pl_module.valid_trajectories:
+            return
+        step, loss = pl_module.valid_trajectories[-1]
+        self.trial.report(loss, step)
+        if self.trial.should_prune():
+            self.pruned = True
+            trainer.should_stop = True
+
 # %% ../../nbs/common.base_auto.ipynb 7
 class BaseAuto(pl.LightningModule):
     """
@@ -82,8 +119,22 @@ class BaseAuto(pl.LightningModule):
         List of functions to call during the optimization process.
         ray reference: https://docs.ray.io/en/latest/tune/tutorials/tune-metrics.html
         optuna reference: https://optuna.readthedocs.io/en/stable/tutorial/20_recipes/007_optuna_callback.html
+    scheduler : ray.tune.schedulers variant or optuna.pruners variant, optional (default=None)
+        Early stopping of the worst trials (e.g. `ASHAScheduler` or `SuccessiveHalvingPruner`),
+        driven by the validation loss reported at every validation (see `val_check_steps`).
+        For ray see https://docs.ray.io/en/latest/tune/api/schedulers.html
+        For optuna see https://optuna.readthedocs.io/en/stable/reference/pruners.html
+    fidelities : list of (float, float), optional (default=None)
+        Multi-fidelity search, every `(series_fraction, steps_fraction)` is a rung that trains
+        its configs on a sample of the series (stratified by length and scale) for a fraction
+        of `max_steps`. The first rung explores `num_samples` configs, the best third of every
+        rung is promoted to the next one and the last rung trains them on the whole dataset.
+        Multivariate models (with `n_series`) only support `series_fraction=1`.
     """
 
+    # fraction of the configs of a rung promoted to the next one is 1 / factor
+    FIDELITY_REDUCTION_FACTOR = 3
+
     def __init__(
         self,
         cls_model,
@@ -100,6 +151,8 @@ class BaseAuto(pl.LightningModule):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        fidelities=None,
     ):
         super(BaseAuto, self).__init__()
         with warnings.catch_warnings(record=False):
@@ -125,6 +178,23 @@ class BaseAuto(pl.LightningModule):
             raise ValueError(
                 f"Unknown backend {backend}. The supported backends are 'ray' and 'optuna'."
             )
+        if fidelities is not None and not all(
+            0 < series_fraction <= 1 and 0 < steps_fraction <= 1
+            for series_fraction, steps_fraction in fidelities
+        ):
+            raise ValueError(
+                "`fidelities` must be a list of (series_fraction, steps_fraction) "
+                "with both fractions in (0, 1]."
+            )
+        if (
+            fidelities is not None
+            and "n_series" in config_base
+            and any(series_fraction < 1 for series_fraction, _ in fidelities)
+        ):
+            raise ValueError(
+                "Multivariate models are trained on all the series, their `fidelities` "
+                "must have `series_fraction=1`."
+            )
         if config_base.get("h", None) is not None:
             raise Exception("Please use `h` init argument instead of `config['h']`.")
         if config_base.get("loss", None) is not None:
@@ -176,6 +246,8 @@ class BaseAuto(pl.LightningModule):
         self.alias = alias
         self.backend = backend
         self.callbacks = callbacks
+        self.scheduler = scheduler
+        self.fidelities = fidelities
 
         # Base Class attributes
         self.SAMPLING_TYPE = cls_model.SAMPLING_TYPE
@@ -183,7 +255,16 @@ class BaseAuto(pl.LightningModule):
     def __repr__(self):
         return type(self).__name__ if self.alias is None else self.alias
 
-    def _train_tune(self, config_step, cls_model, dataset, val_size, test_size):
+    def _train_tune(
+        self,
+        config_step,
+        cls_model,
+        dataset,
+        val_size,
+        test_size,
+        trial_store=None,
+        max_steps_fraction=1.0,
+    ):
         """BaseAuto._train_tune
 
         Internal function that instantiates a NF class model, then automatically
@@ -196,7 +277,10 @@ class BaseAuto(pl.LightningModule):
         `dataset`: NeuralForecast dataset, to fit the model.<br>
         `val_size`: int, validation size for temporal cross-validation.<br>
         `test_size`: int, test size for temporal cross-validation.<br>
+        `trial_store`: str, optional directory where the trained model is saved.<br>
+        `max_steps_fraction`: float, fraction of the config's `max_steps` to train.<br>
         """
+        config_step = config_step.get(_PROMOTED_CONFIG, config_step)
         metrics = {"loss": "ptl/val_loss", "train_loss": "train_loss"}
         callbacks = [TuneReportCallback(metrics, on="validation_end")]
         if "callbacks" in config_step.keys():
@@ -211,13 +295,17 @@ class BaseAuto(pl.LightningModule):
 
         # Tune session receives validation signal
         # from the specialized PL TuneReportCallback
-        _ = self._fit_model(
+        model = self._fit_model(
             cls_model=cls_model,
             config=config_step,
             dataset=dataset,
             val_size=val_size,
             test_size=test_size,
+            max_steps_fraction=max_steps_fraction,
         )
+        if trial_store is not None:
+            trial_id = tune.get_context().get_trial_id()
+            self._save_trial(model, f"{trial_store}/{trial_id}.pt")
 
     def _tune_model(
         self,
@@ -231,6 +319,10 @@ class BaseAuto(pl.LightningModule):
         num_samples,
         search_alg,
         config,
+        scheduler=None,
+        trial_store=None,
+        max_steps_fraction=1.0,
+        promoted=None,
     ):
         train_fn_with_parameters = tune.with_parameters(
             self._train_tune,
@@ -238,7 +330,14 @@ class BaseAuto(pl.LightningModule):
             dataset=dataset,
             val_size=val_size,
             test_size=test_size,
+            trial_store=trial_store,
+            max_steps_fraction=max_steps_fraction,
         )
+        if promoted is not None:
+            # train the given configs, points_to_evaluate can't hold list values
+            config = {_PROMOTED_CONFIG: tune.grid_search(promoted)}
+            num_samples = 1
+            search_alg = None
 
         # Device
         if gpus > 0:
@@ -263,6 +362,7 @@ class BaseAuto(pl.LightningModule):
                 mode="min",
                 num_samples=num_samples,
                 search_alg=search_alg,
+                scheduler=scheduler,
                 trial_dirname_creator=trial_dirname_creator,
             ),
             param_space=config,
@@ -270,6 +370,33 @@ class BaseAuto(pl.LightningModule):
         results = tuner.fit()
         return results
 
+    @staticmethod
+    @contextmanager
+    def _shared_dataset(dataset, single_node=True):
+        """Memory-mapped, read-only view of `dataset` for the trials.
+
+        The dataset is saved with `TimeSeriesDataset.save` to a temporary directory
+        (unless it is already memory-mapped from disk and wasn't modified) and
+        reopened memory-mapped, when pickled for a trial only its file, `indptr` and
+        metadata are sent and all trials share the pages of the temporal data. Yields the dataset and the
+        bytes it takes on disk, or None if it is used as is.
+        """
+        if not isinstance(dataset, TimeSeriesDataset) or not single_node:
+            yield dataset, None
+            return
+        mmap_file = dataset._mmap_path()
+        if mmap_file is not None:
+            path = os.path.dirname(mmap_file)
+            yield dataset, _dir_nbytes(path)
+            return
+        path = tempfile.mkdtemp(prefix="neuralforecast_auto_")
+        try:
+            dataset.save(path)
+            shared = TimeSeriesDataset.load(path, padded_buckets=dataset.padded_buckets)
+            yield shared, _dir_nbytes(path)
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
     @staticmethod
     def _ray_config_to_optuna(ray_config):
         def optuna_config(trial):
@@ -316,12 +443,19 @@ class BaseAuto(pl.LightningModule):
         search_alg,
         config,
         distributed_config,
+        scheduler=None,
+        trial_store=None,
+        max_steps_fraction=1.0,
+        promoted=None,
     ):
         import optuna
 
         def objective(trial):
             user_cfg = config(trial)
             cfg = deepcopy(user_cfg)
+            if distributed_config is None:
+                pruning_callback = _OptunaPruningCallback(trial)
+                cfg["callbacks"] = [pruning_callback, *cfg.get("callbacks", [])]
             model = self._fit_model(
                 cls_model=cls_model,
                 config=cfg,
@@ -329,7 +463,14 @@ class BaseAuto(pl.LightningModule):
                 val_size=val_size,
                 test_size=test_size,
                 distributed_config=distributed_config,
+                max_steps_fraction=max_steps_fraction,
             )
+            if distributed_config is None and pruning_callback.pruned:
+                raise optuna.TrialPruned(
+                    f"Trial pruned at step {model.valid_trajectories[-1][0]}."
+                )
+            if trial_store is not None:
+                self._save_trial(model, f"{trial_store}/{trial.number}.pt")
             trial.set_user_attr("ALL_PARAMS", user_cfg)
             metrics = model.metrics
             trial.set_user_attr(
@@ -345,8 +486,17 @@ class BaseAuto(pl.LightningModule):
             sampler = search_alg
         else:
             sampler = None
+        # optuna's default pruner is the MedianPruner, only prune when requested
+        if scheduler is None:
+            scheduler = optuna.pruners.NopPruner()
 
-        study = optuna.create_study(sampler=sampler, direction="minimize")
+        study = optuna.create_study(
+            sampler=sampler, pruner=scheduler, direction="minimize"
+        )
+        if promoted is not None:
+            for params in promoted:
+                study.enqueue_trial(params)
+            num_samples = len(promoted)
         study.optimize(
             objective,
             n_trials=num_samples,
@@ -355,9 +505,164 @@ class BaseAuto(pl.LightningModule):
         )
         return study
 
+    def _search(
+        self,
+        dataset,
+        val_size,
+        test_size,
+        distributed_config,
+        trial_store,
+        max_steps_fraction,
+        promoted,
+    ):
+        # Runs the trials of a rung with the backend, returns its results and
+        # the size on disk of the dataset shared by the trials
+        search_alg = deepcopy(self.search_alg)
+        scheduler = deepcopy(self.scheduler)
+        if self.backend == "ray":
+            # the trials can only share a local file if they all run on this node
+            single_node = (
+                not ray.is_initialized()
+                or sum(node["Alive"] for node in ray.nodes()) == 1
+            )
+            with self._shared_dataset(dataset, single_node) as (
+                trials_dataset,
+                dataset_nbytes,
+            ):
+                results = self._tune_model(
+                    cls_model=self.cls_model,
+                    dataset=trials_dataset,
+                    val_size=val_size,
+                    test_size=test_size,
+                    cpus=self.cpus,
+                    gpus=self.gpus,
+                    verbose=self.verbose,
+                    num_samples=self.num_samples,
+                    search_alg=search_alg,
+                    config=self.config,
+                    scheduler=scheduler,
+                    trial_store=trial_store,
+                    max_steps_fraction=max_steps_fraction,
+                    promoted=promoted,
+                )
+                del trials_dataset
+        else:
+            with self._shared_dataset(dataset) as (trials_dataset, dataset_nbytes):
+                results = self._optuna_tune_model(
+                    cls_model=self.cls_model,
+                    dataset=trials_dataset,
+                    val_size=val_size,
+                    test_size=test_size,
+                    verbose=self.verbose,
+                    num_samples=self.num_samples,
+                    search_alg=search_alg,
+                    config=self.config,
+                    distributed_config=distributed_config,
+                    scheduler=scheduler,
+                    trial_store=trial_store,
+                    max_steps_fraction=max_steps_fraction,
+                    promoted=promoted,
+                )
+                del trials_dataset
+            results.set_user_attr("dataset_nbytes", dataset_nbytes)
+        return results, dataset_nbytes
+
+    def _ranked_trials(self, results):
+        # Finished trials from best to worst as (trial id, model config, params to
+        # train it again) and the training seconds of all the trials
+        if self.backend == "ray":
+            finished = [
+                result
+                for result in results
+                if result.error is None and "loss" in result.metrics
+            ]
+            finished.sort(key=lambda result: result.metrics["loss"])
+            ranked = []
+            for result in finished:
+                config = result.config.get(_PROMOTED_CONFIG, result.config)
+                ranked.append((result.metrics["trial_id"], config, config))
+            seconds = sum(
+                (result.metrics or {}).get("time_total_s", 0.0) for result in results
+            )
+        else:
+            import optuna
+
+            finished = results.get_trials(states=[optuna.trial.TrialState.COMPLETE])
+            finished.sort(key=lambda trial: trial.value)
+            ranked = [
+                (trial.number, trial.user_attrs["ALL_PARAMS"], trial.params)
+                for trial in finished
+            ]
+            seconds = sum(
+                trial.duration.total_seconds()
+                for trial in results.trials
+                if trial.duration is not None
+            )
+        return ranked, seconds
+
+    @staticmethod
+    def _stratified_series(dataset, fraction, seed=0):
+        # Sample of the series stratified by their length and scale (quartiles of
+        # the sizes and of the mean absolute target), with at least one serie of
+        # every stratum
+        sizes = np.diff(dataset.indptr)
+        y = np.nan_to_num(np.abs(dataset.temporal[:, dataset.y_idx].numpy()))
+        scales = np.add.reduceat(y, dataset.indptr[:-1]) / sizes
+        strata = 0
+        for values in (sizes, scales):
+            quartiles = np.quantile(values, [0.25, 0.5, 0.75])
+            strata = 4 * strata + np.searchsorted(quartiles, values, side="right")
+        rng = np.random.default_rng(seed)
+        idxs = []
+        for stratum in np.unique(strata):
+            members = np.flatnonzero(strata == stratum)
+            n = math.ceil(fraction * members.size)
+            idxs.append(rng.choice(members, size=n, replace=False))
+        return np.sort(np.concatenate(idxs))
+
+    @staticmethod
+    def _save_trial(model, path):
+        # weights and training results of a trial, to reuse the best one
+        torch.save(
+            dict(
+                state_dict=model.state_dict(),
+                metrics=dict(model.metrics),
+                train_trajectories=model.train_trajectories,
+                valid_trajectories=model.valid_trajectories,
+            ),
+            path,
+        )
+
+    @staticmethod
+    def _load_trial(cls_model, config, path, val_size, test_size):
+        content = torch.load(path, map_location="cpu")
+        model = cls_model(**config)
+        model.load_state_dict(content.pop("state_dict"))
+        for attr, value in content.items():
+            setattr(model, attr, value)
+        model.val_size = val_size
+        model.test_size = test_size
+        return model
+
     def _fit_model(
-        self, cls_model, config, dataset, val_size, test_size, distributed_config=None
+        self,
+        cls_model,
+        config,
+        dataset,
+        val_size,
+        test_size,
+        distributed_config=None,
+        max_steps_fraction=1.0,
     ):
+        if max_steps_fraction < 1:
+            max_steps = config.get(
+                "max_steps",
+                inspect.signature(cls_model).parameters["max_steps"].default,
+            )
+            config = {
+                **config,
+                "max_steps": max(1, int(max_steps * max_steps_fraction)),
+            }
         model = cls_model(**config)
         model = model.fit(
             dataset,
@@ -390,51 +695,92 @@ class BaseAuto(pl.LightningModule):
         `random_seed`: int=None, random_seed for hyperparameter exploration algorithms, not yet implemented.<br>
         **Returns:**<br>
         `self`: fitted instance of `BaseAuto` with best hyperparameters and results<br>.
+
+        The trials read a single memory-mapped copy of the dataset, stored in a
+        temporary directory (see `tempfile.gettempdir`) for the duration of the search.
+        Its size in bytes is kept in `dataset_nbytes` (and in the `dataset_nbytes`
+        user attribute of the optuna study).
+
+        The trials save their weights, with `refit_with_val=True` the best model is
+        trained on the same split as its trial so those weights are loaded instead
+        of training it again.
+
+        The training seconds of the trials of every rung (a single one without
+        `fidelities`) are kept in `trial_seconds`, each ray trial holds `gpus` (or
+        `cpus`) devices for that time. `standard_seconds` estimates the training
+        seconds of the same search without `fidelities`: `num_samples` trials taking
+        the mean seconds of the trials of the last rung, which train on the whole
+        dataset for the whole `max_steps` (without `fidelities` it is the measured
+        time of the search).
         """
         # we need val_size > 0 to perform
         # hyperparameter selection.
-        search_alg = deepcopy(self.search_alg)
         val_size = val_size if val_size > 0 else self.h
-        if self.backend == "ray":
-            if distributed_config is not None:
-                raise ValueError(
-                    "distributed training is not supported for the ray backend."
-                )
-            results = self._tune_model(
-                cls_model=self.cls_model,
-                dataset=dataset,
-                val_size=val_size,
-                test_size=test_size,
-                cpus=self.cpus,
-                gpus=self.gpus,
-                verbose=self.verbose,
-                num_samples=self.num_samples,
-                search_alg=search_alg,
-                config=self.config,
-            )
-            best_config = results.get_best_result().config
-        else:
-            results = self._optuna_tune_model(
-                cls_model=self.cls_model,
-                dataset=dataset,
-                val_size=val_size,
-                test_size=test_size,
-                verbose=self.verbose,
-                num_samples=self.num_samples,
-                search_alg=search_alg,
-                config=self.config,
-                distributed_config=distributed_config,
+        if self.backend == "ray" and distributed_config is not None:
+            raise ValueError(
+                "distributed training is not supported for the ray backend."
             )
-            best_config = results.best_trial.user_attrs["ALL_PARAMS"]
-        self.model = self._fit_model(
-            cls_model=self.cls_model,
-            config=best_config,
-            dataset=dataset,
-            val_size=val_size * self.refit_with_val,
-            test_size=test_size,
-            distributed_config=distributed_config,
-        )
+        if self.fidelities is not None and not isinstance(dataset, TimeSeriesDataset):
+            raise ValueError("`fidelities` require a `TimeSeriesDataset`.")
+        # the last rung trains the promoted configs with the whole dataset
+        rungs = [*(self.fidelities or []), (1.0, 1.0)]
+        promoted = None
+        trial_seconds = []
+        trial_store = tempfile.mkdtemp(prefix="neuralforecast_auto_trials_")
+        try:
+            for i, (series_fraction, steps_fraction) in enumerate(rungs):
+                last_rung = i == len(rungs) - 1
+                rung_dataset = dataset
+                if series_fraction < 1:
+                    rung_dataset = TimeSeriesDataset.subset_dataset(
+                        dataset, self._stratified_series(dataset, series_fraction)
+                    )
+                results, dataset_nbytes = self._search(
+                    dataset=rung_dataset,
+                    val_size=val_size,
+                    test_size=test_size,
+                    distributed_config=distributed_config,
+                    trial_store=trial_store if last_rung else None,
+                    max_steps_fraction=steps_fraction,
+                    promoted=promoted,
+                )
+                ranked, seconds = self._ranked_trials(results)
+                if not ranked:
+                    raise RuntimeError("None of the trials finished.")
+                trial_seconds.append(seconds)
+                if last_rung:
+                    n_trials = self.num_samples if promoted is None else len(promoted)
+                    standard_seconds = seconds / n_trials * self.num_samples
+                n_promoted = max(1, len(ranked) // self.FIDELITY_REDUCTION_FACTOR)
+                promoted = [params for _, _, params in ranked[:n_promoted]]
+            best_trial, best_config, _ = ranked[0]
+            # the best trial was trained on the same split as the refit when the
+            # validation set is kept, its weights are reused instead of retraining.
+            # Trials that ran on other nodes didn't save to this one.
+            best_path = f"{trial_store}/{best_trial}.pt"
+            if self.refit_with_val and os.path.exists(best_path):
+                self.model = self._load_trial(
+                    cls_model=self.cls_model,
+                    config=best_config,
+                    path=best_path,
+                    val_size=val_size,
+                    test_size=test_size,
+                )
+            else:
+                self.model = self._fit_model(
+                    cls_model=self.cls_model,
+                    config=best_config,
+                    dataset=dataset,
+                    val_size=val_size * self.refit_with_val,
+                    test_size=test_size,
+                    distributed_config=distributed_config,
+                )
+        finally:
+            shutil.rmtree(trial_store, ignore_errors=True)
         self.results = results
+        self.dataset_nbytes = dataset_nbytes
+        self.trial_seconds = trial_seconds
+        self.standard_seconds = standard_seconds
 
         # Added attributes for compatibility with NeuralForecast core
         self.futr_exog_list = self.model.futr_exog_list
@@ -460,6 +806,10 @@ class BaseAuto(pl.LightningModule):
     def set_test_size(self, test_size):
         self.model.set_test_size(test_size)
 
+    def _shared_inference_key(self):
+        # The best model is predicted on its own through `BaseAuto.predict`
+        return None
+
     def get_test_size(self):
         return self.model.test_size
 
@@ -17,6 +17,7 @@ import torch
 import torch.nn as nn
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
+from pytorch_lightning.utilities import move_data_to_device
 from neuralforecast.tsdataset import (
     TimeSeriesDataModule,
     BaseTimeSeriesDataset,
@@ -66,6 +67,8 @@ class BaseModel(pl.LightningModule):
     EXOGENOUS_FUTR = True
     EXOGENOUS_HIST = True
     EXOGENOUS_STAT = True
+    # Predict without Lightning's `Trainer` when `predict`'s `trainer_free` is None
+    TRAINER_FREE_PREDICT = False
 
     def __init__(
         self,
@@ -215,6 +218,62 @@ class BaseModel(pl.LightningModule):
             random_seed = self.random_seed
         torch.manual_seed(random_seed)
 
+    def _inference_device(self):
+        # Device of the inference without Lightning's `Trainer`. None if the
+        # `trainer_kwargs` need it (other accelerators or precisions).
+        if str(self.trainer_kwargs.get("precision", "32-true")) not in (
+            "32",
+            "32-true",
+        ):
+            return None
+        accelerator = self.trainer_kwargs.get("accelerator", "auto")
+        if accelerator == "auto":
+            if torch.cuda.is_available():
+                accelerator = "gpu"
+            elif torch.backends.mps.is_available():
+                return None
+            else:
+                accelerator = "cpu"
+        if accelerator == "cpu":
+            return torch.device("cpu")
+        if accelerator in ("gpu", "cuda") and torch.cuda.is_available():
+            devices = self.trainer_kwargs.get("devices", None)
+            index = devices[0] if isinstance(devices, (list, tuple)) else 0
+            return torch.device("cuda", index)
+        return None
+
+    def _predict_batches(self, datamodule, trainer_free=None):
+        # Outputs of `predict_step` for the batches of the datamodule, moved to cpu.
+        # `trainer_free` runs them in a plain `torch.inference_mode` loop.
+        if trainer_free is None:
+            trainer_free = self.TRAINER_FREE_PREDICT
+        device = self._inference_device() if trainer_free else None
+        if device is None:
+            # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
+            pred_trainer_kwargs = self.trainer_kwargs.copy()
+            if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
+                torch.cuda.device_count() > 1
+            ):
+                pred_trainer_kwargs["devices"] = [0]
+
+            trainer = pl.Trainer(**pred_trainer_kwargs)
+            return trainer.predict(self, datamodule=datamodule)
+
+        training = self.training
+        fcsts = []
+        with torch.inference_mode():
+            self.to(device).eval()
+            for batch_idx, batch in enumerate(datamodule.predict_dataloader()):
+                batch = move_data_to_device(batch, device)
+                fcsts.append(self.predict_step(batch, batch_idx).cpu())
+        self.cpu().train(training)
+        return fcsts
+
+    def _shared_inference_key(self):
+        # Models with the same (not None) key are predicted together in a single
+        # pass over the dataset, see `BaseWindows._shared_inference_key`.
+        return None
+
     def _get_temporal_exogenous_cols(self, temporal_cols):
         return list(
             set(temporal_cols.tolist()) & set(self.hist_exog_list + self.futr_exog_list)
@@ -311,6 +370,11 @@ class BaseModel(pl.LightningModule):
         )
         return model
 
+    def _bucket_kwargs(self):
+        # Padding arguments of the length bucketed train batches,
+        # see `_LengthBucketBatchSampler`.
+        return {}
+
     def _fit(
         self,
         dataset,
@@ -339,6 +403,8 @@ class BaseModel(pl.LightningModule):
             num_workers=self.num_workers_loader,
             drop_last=self.drop_last_loader,
             shuffle_train=shuffle_train,
+            bucket_by_length=getattr(self, "bucket_by_length", False),
+            bucket_kwargs=self._bucket_kwargs(),
         )
 
         if self.val_check_steps > self.max_steps:
@@ -346,13 +412,17 @@ class BaseModel(pl.LightningModule):
                 "val_check_steps is greater than max_steps, "
                 "setting val_check_steps to max_steps."
             )
-        val_check_interval = min(self.val_check_steps, self.max_steps)
+        max_steps = self.max_steps
+        warm_start = getattr(self, "_warm_start_state", None)
+        if warm_start is not None and "optimizers" in warm_start:
+            max_steps = warm_start["max_steps"]
+        val_check_interval = min(self.val_check_steps, max_steps)
         self.trainer_kwargs["val_check_interval"] = int(val_check_interval)
         self.trainer_kwargs["check_val_every_n_epoch"] = None
 
         if is_local:
             model = self
-            trainer = pl.Trainer(**model.trainer_kwargs)
+            trainer = pl.Trainer(**{**model.trainer_kwargs, "max_steps": max_steps})
             trainer.fit(model, datamodule=datamodule)
             model.metrics = trainer.callback_metrics
             model.__dict__.pop("_trainer", None)
@@ -370,6 +440,40 @@ class BaseModel(pl.LightningModule):
         np.random.seed(self.random_seed)
         random.seed(self.random_seed)
 
+    @contextmanager
+    def _warm_start(self, max_steps):
+        # Every fit inside the context after the first one continues the
+        # optimization of the previous fit (weights, optimizer and lr scheduler
+        # states) for `max_steps` steps, instead of the model's `max_steps`.
+        self._warm_start_state = dict(max_steps=max_steps)
+        try:
+            yield
+        finally:
+            del self._warm_start_state
+
+    def on_train_start(self):
+        warm_start = getattr(self, "_warm_start_state", None)
+        if warm_start is None or "optimizers" not in warm_start:
+            return
+        for optimizer, state in zip(self.trainer.optimizers, warm_start["optimizers"]):
+            optimizer.load_state_dict(state)
+        for config, state in zip(
+            self.trainer.lr_scheduler_configs, warm_start["lr_schedulers"]
+        ):
+            config.scheduler.load_state_dict(state)
+
+    def on_train_end(self):
+        warm_start = getattr(self, "_warm_start_state", None)
+        if warm_start is None:
+            return
+        warm_start["optimizers"] = [
+            optimizer.state_dict() for optimizer in self.trainer.optimizers
+        ]
+        warm_start["lr_schedulers"] = [
+            config.scheduler.state_dict()
+            for config in self.trainer.lr_scheduler_configs
+        ]
+
     def configure_optimizers(self):
         if self.optimizer:
             optimizer_signature = inspect.signature(self.optimizer)
@@ -7,7 +7,6 @@ __all__ = ['BaseMultivariate']
 import numpy as np
 import torch
 import torch.nn as nn
-import pytorch_lightning as pl
 import neuralforecast.losses.pytorch as losses
 
 from ._base_model import BaseModel
@@ -561,6 +560,7 @@ class BaseMultivariate(BaseModel):
         test_size=None,
         step_size=1,
         random_seed=None,
+        trainer_free=None,
         **data_module_kwargs,
     ):
         """Predict.
@@ -571,6 +571,7 @@ class BaseMultivariate(BaseModel):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
+        `trainer_free`: bool=None, predict in a `torch.inference_mode` loop without PL's `Trainer`, defaults to `TRAINER_FREE_PREDICT`.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -586,15 +587,7 @@ class BaseMultivariate(BaseModel):
             **data_module_kwargs,
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_batches(datamodule, trainer_free=trainer_free)
         fcsts = torch.vstack(fcsts).numpy()
 
         fcsts = np.transpose(fcsts, (2, 0, 1))
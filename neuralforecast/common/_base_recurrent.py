@@ -7,7 +7,6 @@ __all__ = ['BaseRecurrent']
 import numpy as np
 import torch
 import torch.nn as nn
-import pytorch_lightning as pl
 import neuralforecast.losses.pytorch as losses
 
 from ._base_model import BaseModel
@@ -48,6 +47,7 @@ class BaseRecurrent(BaseModel):
         stat_exog_list=None,
         num_workers_loader=0,
         drop_last_loader=False,
+        bucket_by_length=False,
         random_seed=1,
         alias=None,
         optimizer=None,
@@ -119,6 +119,7 @@ class BaseRecurrent(BaseModel):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.bucket_by_length = bucket_by_length
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
         self.alias = alias
@@ -411,7 +412,7 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.predict_quantiles(distr_args=distr_args)
 
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
@@ -489,7 +490,7 @@ class BaseRecurrent(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.predict_quantiles(distr_args=distr_args)
             y_hat = torch.concat((sample_mean, quants), axis=2)
             y_hat = y_hat.view(B, T, H, -1)
 
@@ -542,7 +543,14 @@ class BaseRecurrent(BaseModel):
             distributed_config=distributed_config,
         )
 
-    def predict(self, dataset, step_size=1, random_seed=None, **data_module_kwargs):
+    def predict(
+        self,
+        dataset,
+        step_size=1,
+        random_seed=None,
+        trainer_free=None,
+        **data_module_kwargs,
+    ):
         """Predict.
 
         Neural network prediction with PL's `Trainer` execution of `predict_step`.
@@ -551,6 +559,7 @@ class BaseRecurrent(BaseModel):
         `dataset`: NeuralForecast's `TimeSeriesDataset`, see [documentation](https://nixtla.github.io/neuralforecast/tsdataset.html).<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `trainer_free`: bool=None, predict in a `torch.inference_mode` loop without PL's `Trainer`, defaults to `TRAINER_FREE_PREDICT`.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -561,22 +570,13 @@ class BaseRecurrent(BaseModel):
             raise Exception("Recurrent models do not support step_size > 1")
 
         # fcsts (window, batch, h)
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-
         datamodule = TimeSeriesDataModule(
             dataset=dataset,
             valid_batch_size=self.valid_batch_size,
             num_workers=self.num_workers_loader,
             **data_module_kwargs,
         )
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_batches(datamodule, trainer_free=trainer_free)
         if self.test_size > 0:
             # Remove warmup windows (from train and validation)
             # [N,T,H,output], avoid indexing last dim for univariate output compatibility
@@ -8,6 +8,7 @@ import numpy as np
 import torch
 import torch.nn as nn
 import pytorch_lightning as pl
+from pytorch_lightning.utilities import move_data_to_device
 
 from ._base_model import BaseModel
 from ._scalers import TemporalNorm
@@ -51,6 +52,7 @@ class BaseWindows(BaseModel):
         exclude_insample_y=False,
         num_workers_loader=0,
         drop_last_loader=False,
+        bucket_by_length=False,
         random_seed=1,
         alias=None,
         optimizer=None,
@@ -130,10 +132,124 @@ class BaseWindows(BaseModel):
         # DataModule arguments
         self.num_workers_loader = num_workers_loader
         self.drop_last_loader = drop_last_loader
+        self.bucket_by_length = bucket_by_length
         # used by on_validation_epoch_end hook
         self.validation_step_outputs = []
         self.alias = alias
 
+    def _train_windows_condition(self, available_mask):
+        # Receives the padded available mask [B, T] and returns a boolean
+        # [B, Ws] with the windows that have at least one available value
+        # in the input and (if h > 0) in the output.
+        # Window sums are differences of a prefix sum, so no window is materialized.
+        window_size = self.input_size + self.h
+        cumsum = torch.cumsum((available_mask > 0).int(), dim=1)
+        cumsum = nn.functional.pad(cumsum, (1, 0), value=0)
+        starts = torch.arange(
+            0,
+            available_mask.shape[1] - window_size + 1,
+            self.step_size,
+            device=available_mask.device,
+        )
+        insample_end = starts + self.input_size
+        available_condition = cumsum[:, insample_end] - cumsum[:, starts]
+        final_condition = available_condition > 0
+        if self.h > 0:
+            sample_condition = (
+                cumsum[:, insample_end + self.h] - cumsum[:, insample_end]
+            )
+            final_condition = (sample_condition > 0) & (available_condition > 0)
+        return final_condition
+
+    def _bucket_kwargs(self):
+        # Length bucketed batches keep every valid window of their series:
+        # without start padding a window may begin input_size - 1 steps before
+        # its serie, and the train frame must fit at least one window.
+        left_padding = self.input_size - 1 if self.start_padding_enabled else 0
+        return dict(
+            min_padding=self.input_size - 1 - left_padding,
+            min_size=self.input_size + self.val_size + self.test_size - left_padding,
+            padding_step=self.step_size,
+        )
+
+    def _train_windows_index(self, batch):
+        # Cached index of the valid windows of the training dataset, available
+        # when the batch comes from a `TimeSeriesDataset`. Returns the index and
+        # the offset of the batch's temporal, shorter than `max_size` for length
+        # bucketed batches.
+        if "idx" not in batch or self._trainer is None:
+            return None
+        dataset = getattr(self._trainer.datamodule, "dataset", None)
+        if not hasattr(dataset, "valid_windows"):
+            return None
+        offset = dataset.max_size - batch["temporal"].shape[-1]
+        if offset < 0 or offset % self.step_size != 0:
+            return None
+        windows_indptr, valid_windows = dataset.valid_windows(
+            input_size=self.input_size,
+            h=self.h,
+            val_size=self.val_size,
+            test_size=self.test_size,
+            step_size=self.step_size,
+            start_padding_enabled=self.start_padding_enabled,
+        )
+        return windows_indptr, valid_windows, offset
+
+    def _sample_train_windows(self, batch, temporal):
+        # Receives the padded train temporal [B, C, T] and returns the serie
+        # and the start of the `windows_batch_size` sampled windows.
+        # Windows are enumerated serie by serie in unfold order, so both paths
+        # draw the same windows for a given numpy seed.
+        windows_index = self._train_windows_index(batch)
+        if windows_index is None:
+            # Valid windows [B, Ws], computed from the available mask only
+            available_idx = batch["temporal_cols"].get_loc("available_mask")
+            final_condition = self._train_windows_condition(
+                temporal[:, available_idx, :]
+            )
+            # Flat index b * Ws + w of the valid windows
+            valid_idxs = torch.nonzero(final_condition.flatten()).flatten()
+            n_windows = len(valid_idxs)
+        else:
+            windows_indptr, valid_windows, offset = windows_index
+            serie_offsets = windows_indptr[batch["idx"]]
+            serie_sizes = windows_indptr[batch["idx"] + 1] - serie_offsets
+            n_windows = serie_sizes.sum()
+
+        # Protection of empty windows
+        if n_windows == 0:
+            raise Exception("No windows available for training")
+
+        # Sample windows
+        if self.windows_batch_size is not None:
+            w_idxs = np.random.choice(
+                n_windows,
+                size=self.windows_batch_size,
+                replace=(n_windows < self.windows_batch_size),
+            )
+        else:
+            w_idxs = np.arange(n_windows)
+
+        if windows_index is None:
+            valid_idxs = valid_idxs[torch.as_tensor(w_idxs, device=valid_idxs.device)]
+            windows_per_serie = final_condition.shape[1]
+            serie_idxs = torch.div(valid_idxs, windows_per_serie, rounding_mode="floor")
+            start_idxs = (valid_idxs % windows_per_serie) * self.step_size
+        else:
+            # Locate the sampled windows in the series of the batch
+            serie_ends = np.cumsum(serie_sizes)
+            serie_idxs = np.searchsorted(serie_ends, w_idxs, side="right")
+            positions = (
+                serie_offsets[serie_idxs]
+                + w_idxs
+                - (serie_ends - serie_sizes)[serie_idxs]
+            )
+            start_idxs = valid_windows[positions].astype(np.int64) * self.step_size
+            start_idxs -= offset
+            serie_idxs = torch.as_tensor(serie_idxs, device=temporal.device)
+            start_idxs = torch.as_tensor(start_idxs, device=temporal.device)
+        return serie_idxs, start_idxs
+
     def _create_windows(self, batch, step, w_idxs=None):
         # Parse common data
         window_size = self.input_size + self.h
@@ -150,53 +266,20 @@ class BaseWindows(BaseModel):
                 raise Exception(
                     "Time series is too short for training, consider setting a smaller input size or set start_padding_enabled=True"
                 )
-            windows = temporal.unfold(
-                dimension=-1, size=window_size, step=self.step_size
-            )
 
-            # [B, C, Ws, L+H] 0, 1, 2, 3
-            # -> [B * Ws, L+H, C] 0, 2, 3, 1
-            windows_per_serie = windows.shape[2]
-            windows = windows.permute(0, 2, 3, 1).contiguous()
-            windows = windows.reshape(-1, window_size, len(temporal_cols))
+            serie_idxs, start_idxs = self._sample_train_windows(batch, temporal)
+
+            # Gather only the sampled windows
+            # [B, C, T] -> [N, L+H, C]
+            time_idxs = start_idxs.unsqueeze(1) + torch.arange(
+                window_size, device=temporal.device
+            )
+            windows = temporal[serie_idxs.unsqueeze(1), :, time_idxs]
 
-            # Sample and Available conditions
-            available_idx = temporal_cols.get_loc("available_mask")
-            available_condition = windows[:, : self.input_size, available_idx]
-            available_condition = torch.sum(available_condition, axis=1)
-            final_condition = available_condition > 0
-            if self.h > 0:
-                sample_condition = windows[:, self.input_size :, available_idx]
-                sample_condition = torch.sum(sample_condition, axis=1)
-                final_condition = (sample_condition > 0) & (available_condition > 0)
-            windows = windows[final_condition]
-
-            # Parse Static data to match windows
-            # [B, S_in] -> [B, Ws, S_in] -> [B*Ws, S_in]
             static = batch.get("static", None)
             static_cols = batch.get("static_cols", None)
             if static is not None:
-                static = torch.repeat_interleave(
-                    static, repeats=windows_per_serie, dim=0
-                )
-                static = static[final_condition]
-
-            # Protection of empty windows
-            if final_condition.sum() == 0:
-                raise Exception("No windows available for training")
-
-            # Sample windows
-            n_windows = len(windows)
-            if self.windows_batch_size is not None:
-                w_idxs = np.random.choice(
-                    n_windows,
-                    size=self.windows_batch_size,
-                    replace=(n_windows < self.windows_batch_size),
-                )
-                windows = windows[w_idxs]
-
-                if static is not None:
-                    static = static[w_idxs]
+                static = static[serie_idxs]
 
             # think about interaction available * sample mask
             # [B, C, Ws, L+H]
@@ -458,7 +541,7 @@ class BaseWindows(BaseModel):
             distr_args = self.loss.scale_decouple(
                 output=output, loc=y_loc, scale=y_scale
             )
-            _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
+            sample_mean, quants = self.loss.predict_quantiles(distr_args=distr_args)
 
             if str(type(self.valid_loss)) in [
                 "<class 'neuralforecast.losses.pytorch.sCRPS'>",
@@ -580,53 +663,78 @@ class BaseWindows(BaseModel):
             )
             windows = self._create_windows(batch, step="predict", w_idxs=w_idxs)
             windows = self._normalization(windows=windows, y_idx=y_idx)
+            y_hats.append(self._predict_windows(batch, windows))
+        y_hat = torch.cat(y_hats, dim=0)
+        return y_hat
 
-            # Parse windows
-            insample_y, insample_mask, _, _, hist_exog, futr_exog, stat_exog = (
-                self._parse_windows(batch, windows)
-            )
+    def _shared_inference_key(self):
+        # Models with equal input_size and scaler create and normalize the same
+        # predict windows (right padded only without future exogenous),
+        # `_predict_ensemble` builds them once for all of them.
+        overrides = any(
+            getattr(type(self), method) is not getattr(BaseWindows, method)
+            for method in ("predict_step", "_create_windows", "_normalization")
+        )
+        device = self._inference_device()
+        if overrides or device is None or self.scaler.scaler_type == "revin":
+            return None
+        return (
+            self.input_size,
+            self.h,
+            len(self.futr_exog_list) > 0,
+            self.scaler.scaler_type,
+            device,
+        )
 
-            windows_batch = dict(
-                insample_y=insample_y,  # [Ws, L]
-                insample_mask=insample_mask,  # [Ws, L]
-                futr_exog=futr_exog,  # [Ws, L + h, F]
-                hist_exog=hist_exog,  # [Ws, L, X]
-                stat_exog=stat_exog,
-            )  # [Ws, S]
+    def _predict_windows(self, batch, windows):
+        # Forecasts of normalized windows, uses the statistics of `self.scaler`
+        # to return them in the original scale.
+        y_idx = batch["y_idx"]
 
-            # Model Predictions
-            output_batch = self(windows_batch)
-            # Inverse normalization and sampling
-            if self.loss.is_distribution_output:
-                _, y_loc, y_scale = self._inv_normalization(
-                    y_hat=torch.empty(
-                        size=(insample_y.shape[0], self.h),
-                        dtype=output_batch[0].dtype,
-                        device=output_batch[0].device,
-                    ),
-                    temporal_cols=batch["temporal_cols"],
-                    y_idx=y_idx,
-                )
-                distr_args = self.loss.scale_decouple(
-                    output=output_batch, loc=y_loc, scale=y_scale
-                )
-                _, sample_mean, quants = self.loss.sample(distr_args=distr_args)
-                y_hat = torch.concat((sample_mean, quants), axis=2)
+        # Parse windows
+        insample_y, insample_mask, _, _, hist_exog, futr_exog, stat_exog = (
+            self._parse_windows(batch, windows)
+        )
 
-                if self.loss.return_params:
-                    distr_args = torch.stack(distr_args, dim=-1)
-                    distr_args = torch.reshape(
-                        distr_args, (len(windows["temporal"]), self.h, -1)
-                    )
-                    y_hat = torch.concat((y_hat, distr_args), axis=2)
-            else:
-                y_hat, _, _ = self._inv_normalization(
-                    y_hat=output_batch,
-                    temporal_cols=batch["temporal_cols"],
-                    y_idx=y_idx,
+        windows_batch = dict(
+            insample_y=insample_y,  # [Ws, L]
+            insample_mask=insample_mask,  # [Ws, L]
+            futr_exog=futr_exog,  # [Ws, L + h, F]
+            hist_exog=hist_exog,  # [Ws, L, X]
+            stat_exog=stat_exog,
+        )  # [Ws, S]
+
+        # Model Predictions
+        output_batch = self(windows_batch)
+        # Inverse normalization and sampling
+        if self.loss.is_distribution_output:
+            _, y_loc, y_scale = self._inv_normalization(
+                y_hat=torch.empty(
+                    size=(insample_y.shape[0], self.h),
+                    dtype=output_batch[0].dtype,
+                    device=output_batch[0].device,
+                ),
+                temporal_cols=batch["temporal_cols"],
+                y_idx=y_idx,
+            )
+            distr_args = self.loss.scale_decouple(
+                output=output_batch, loc=y_loc, scale=y_scale
+            )
+            sample_mean, quants = self.loss.predict_quantiles(distr_args=distr_args)
+            y_hat = torch.concat((sample_mean, quants), axis=2)
+
+            if self.loss.return_params:
+                distr_args = torch.stack(distr_args, dim=-1)
+                distr_args = torch.reshape(
+                    distr_args, (len(windows["temporal"]), self.h, -1)
                 )
-            y_hats.append(y_hat)
-        y_hat = torch.cat(y_hats, dim=0)
+                y_hat = torch.concat((y_hat, distr_args), axis=2)
+        else:
+            y_hat, _, _ = self._inv_normalization(
+                y_hat=output_batch,
+                temporal_cols=batch["temporal_cols"],
+                y_idx=y_idx,
+            )
         return y_hat
 
     def fit(
@@ -674,6 +782,7 @@ class BaseWindows(BaseModel):
         test_size=None,
         step_size=1,
         random_seed=None,
+        trainer_free=None,
         **data_module_kwargs,
     ):
         """Predict.
@@ -685,6 +794,7 @@ class BaseWindows(BaseModel):
         `test_size`: int=None, test size for temporal cross-validation.<br>
         `step_size`: int=1, Step size between each window.<br>
         `random_seed`: int=None, random_seed for pytorch initializer and numpy generators, overwrites model.__init__'s.<br>
+        `trainer_free`: bool=None, predict in a `torch.inference_mode` loop without PL's `Trainer`, defaults to `TRAINER_FREE_PREDICT`.<br>
         `**data_module_kwargs`: PL's TimeSeriesDataModule args, see [documentation](https://pytorch-lightning.readthedocs.io/en/1.6.1/extensions/datamodules.html#using-a-datamodule).
         """
         self._check_exog(dataset)
@@ -699,15 +809,7 @@ class BaseWindows(BaseModel):
             **data_module_kwargs,
         )
 
-        # Protect when case of multiple gpu. PL does not support return preds with multiple gpu.
-        pred_trainer_kwargs = self.trainer_kwargs.copy()
-        if (pred_trainer_kwargs.get("accelerator", None) == "gpu") and (
-            torch.cuda.device_count() > 1
-        ):
-            pred_trainer_kwargs["devices"] = [0]
-
-        trainer = pl.Trainer(**pred_trainer_kwargs)
-        fcsts = trainer.predict(self, datamodule=datamodule)
+        fcsts = self._predict_batches(datamodule, trainer_free=trainer_free)
         fcsts = torch.vstack(fcsts).numpy().flatten()
         fcsts = fcsts.reshape(-1, len(self.loss.output_names))
         return fcsts
@@ -740,3 +842,102 @@ class BaseWindows(BaseModel):
         fcsts = trainer.predict(self, datamodule=datamodule)
         self.decompose_forecast = False  # Default decomposition back to false
         return torch.vstack(fcsts).numpy()
+
+
+def _predict_ensemble(
+    models, dataset, step_size=1, random_seed=None, **data_module_kwargs
+):
+    """Predict with several `BaseWindows` models sharing `_shared_inference_key`.
+
+    The dataset is iterated once, the predict windows of each batch are created and
+    normalized once (on the union of the models' exogenous) and every model forecasts
+    them as in `model.predict(trainer_free=True)`. Each model keeps its own random
+    state, so the forecasts are the ones of `model.predict`. Returns one array per model.
+    """
+    lead = models[0]
+    device = lead._inference_device()
+    rng_states = []
+    for model in models:
+        model._check_exog(dataset)
+        kwargs = model._set_quantile_for_iqloss(**data_module_kwargs)
+        model.predict_step_size = step_size
+        model.decompose_forecast = False
+        model._restart_seed(random_seed)
+        # Draw of the DataLoader's base seed, as in the `Trainer`'s single pass
+        torch.empty((), dtype=torch.int64).random_()
+        rng_states.append(_get_rng_state(device))
+
+    datamodule = TimeSeriesDataModule(
+        dataset=dataset,
+        valid_batch_size=lead.valid_batch_size,
+        **kwargs,
+    )
+    exog_cols = set().union(*(m.hist_exog_list + m.futr_exog_list for m in models))
+    scaler = TemporalNorm(scaler_type=lead.scaler.scaler_type, dim=1)
+
+    training = [model.training for model in models]
+    y_hats = [[] for _ in models]
+    with torch.inference_mode():
+        for model in models:
+            model.to(device).eval()
+        for batch in datamodule.predict_dataloader():
+            batch = move_data_to_device(batch, device)
+            y_idx = batch["y_idx"]
+            windows = lead._create_windows(batch, step="predict")
+
+            # Normalize the windows once, as `BaseWindows._normalization`
+            temporal = windows["temporal"]
+            temporal_cols = windows["temporal_cols"]
+            data_idxs = get_indexer_raise_missing(
+                temporal_cols, [col for col in temporal_cols if col in exog_cols]
+            )
+            data_idxs = np.append(y_idx, data_idxs)
+            temporal_mask = temporal[:, :, temporal_cols.get_loc("available_mask")]
+            temporal_mask = temporal_mask.clone()
+            if lead.h > 0:
+                temporal_mask[:, -lead.h :] = 0.0
+            temporal[:, :, data_idxs] = scaler.transform(
+                x=temporal[:, :, data_idxs], mask=temporal_mask.unsqueeze(-1)
+            )
+
+            n_windows = len(temporal)
+            for i, model in enumerate(models):
+                _set_rng_state(device, rng_states[i])
+                windows_batch_size = model.inference_windows_batch_size
+                if windows_batch_size < 0:
+                    windows_batch_size = n_windows
+                for start in range(0, n_windows, windows_batch_size):
+                    w_idxs = slice(start, start + windows_batch_size)
+                    model.scaler.x_shift = scaler.x_shift[w_idxs]
+                    model.scaler.x_scale = scaler.x_scale[w_idxs]
+                    model_windows = dict(
+                        temporal=temporal[w_idxs],
+                        temporal_cols=temporal_cols,
+                        static=(
+                            None
+                            if windows["static"] is None
+                            else windows["static"][w_idxs]
+                        ),
+                        static_cols=windows["static_cols"],
+                    )
+                    y_hats[i].append(model._predict_windows(batch, model_windows).cpu())
+                rng_states[i] = _get_rng_state(device)
+
+    fcsts = []
+    for model, model_y_hats, model_training in zip(models, y_hats, training):
+        model.cpu().train(model_training)
+        model_fcsts = torch.vstack(model_y_hats).numpy().flatten()
+        fcsts.append(model_fcsts.reshape(-1, len(model.loss.output_names)))
+    return fcsts
+
+
+def _get_rng_state(device):
+    if device.type == "cuda":
+        return torch.get_rng_state(), torch.cuda.get_rng_state(device)
+    return torch.get_rng_state(), None
+
+
+def _set_rng_state(device, state):
+    torch.set_rng_state(state[0])
+    if device.type == "cuda":
+        torch.cuda.set_rng_state(state[1], device)
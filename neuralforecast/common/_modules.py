@@ -3,7 +3,8 @@
 # %% auto 0
 __all__ = ['ACTIVATIONS', 'MLP', 'Chomp1d', 'CausalConv1d', 'TemporalConvolutionEncoder', 'TransEncoderLayer', 'TransEncoder',
            'TransDecoderLayer', 'TransDecoder', 'AttentionLayer', 'PositionalEmbedding', 'TokenEmbedding',
-           'TimeFeatureEmbedding', 'FixedEmbedding', 'TemporalEmbedding', 'DataEmbedding', 'MovingAvg', 'SeriesDecomp']
+           'TimeFeatureEmbedding', 'FixedEmbedding', 'TemporalEmbedding', 'DataEmbedding', 'MovingAvg', 'SeriesDecomp',
+           'gaussian_kernels', 'GaussianSmoothing', 'SlopeEmbedding', 'EWMA', 'SmoothResidualDecomp', 'GroupedLinear']
 
 # %% ../../nbs/common.modules.ipynb 3
 import math
@@ -520,3 +521,230 @@ class SeriesDecomp(nn.Module):
         moving_mean = self.MovingAvg(x)
         res = x - moving_mean
         return res, moving_mean
+
+
+def gaussian_kernels(kernel_size, sigma):
+    """
+    Normalized Gaussian kernels of dimensions [len(sigma), kernel_size]
+    """
+    sigma = torch.as_tensor(sigma, dtype=torch.float32).reshape(-1, 1)
+    kernels = torch.arange(kernel_size, device=sigma.device) - (kernel_size - 1) / 2
+    kernels = torch.exp(-0.5 * (kernels / sigma) ** 2)
+    return kernels / kernels.sum(dim=1, keepdim=True)
+
+
+class GaussianSmoothing(nn.Module):
+    """
+    Gaussian smoothing of every series along the time dimension, with zero padding.
+    All the series are smoothed by a single grouped depthwise `conv1d`.
+
+    **Parameters:**<br>
+    `kernel_size`: int, size of the Gaussian kernels.<br>
+    `sigma`: float or float list, standard deviations of the kernels, precomputed as buffers.
+    With a list, the time dimension is split into as many consecutive stages, each smoothed
+    with its own kernel as an independent sequence (the last stage takes the remainder).<br>
+    """
+
+    def __init__(self, kernel_size, sigma=1.0):
+        super(GaussianSmoothing, self).__init__()
+        self.kernel_size = kernel_size
+        sigmas = sigma if isinstance(sigma, (list, tuple)) else [sigma]
+        self.register_buffer(
+            "kernels", gaussian_kernels(kernel_size, sigmas), persistent=False
+        )
+
+    def stage_masks(self, x):
+        # [stages, 1, time] indicator of the time steps of every stage
+        n_stages, time = len(self.kernels), x.size(1)
+        stage_size = time // n_stages
+        stage = torch.arange(time, device=x.device)
+        if stage_size > 0:
+            stage = torch.clamp(stage // stage_size, max=n_stages - 1)
+        else:
+            stage = torch.full_like(stage, n_stages - 1)
+        stages = torch.arange(n_stages, device=x.device)
+        return (stage == stages[:, None]).to(x.dtype)[:, None, :]
+
+    def forward(self, x, sigma=None):
+        """
+        **Parameters:**<br>
+        `x`: tensor, series of dimensions [Batch, Time, Variate].<br>
+        `sigma`: tensor, optional standard deviations of dimensions [Batch], overriding
+        the buffers with one kernel per sample.<br>
+
+        **Returns:**<br>
+        `x`: tensor, smoothed series of dimensions [Batch, Time, Variate].<br>
+        """
+        batch_size, time, n_series = x.shape
+        x = x.permute(0, 2, 1)  # [Batch, Variate, Time]
+        if sigma is not None:
+            # one group per sample and series
+            kernels = gaussian_kernels(self.kernel_size, sigma.detach().float())
+            weight = kernels.repeat_interleave(n_series, dim=0)
+            x = x.reshape(1, batch_size * n_series, time)
+            masks = None
+        elif len(self.kernels) > 1:
+            # one group per stage and series, on the series masked to the stage
+            masks = self.stage_masks(x.permute(0, 2, 1))
+            weight = self.kernels.repeat_interleave(n_series, dim=0)
+            x = (x[:, None] * masks).reshape(batch_size, -1, time)
+        else:
+            weight = self.kernels.expand(n_series, -1)
+            masks = None
+
+        weight = weight.to(x)[:, None, :]
+        x = F.conv1d(x, weight, padding=self.kernel_size // 2, groups=weight.size(0))
+        if masks is not None:
+            x = (x.view(batch_size, -1, n_series, time) * masks).sum(dim=1)
+        return x.reshape(batch_size, n_series, time).permute(0, 2, 1)
+
+
+class SlopeEmbedding(nn.Module):
+    """
+    Slope of every series from its first time step to each time step, along the
+    last dimension. The slope of the first time step is zero.
+    """
+
+    def __init__(self):
+        super(SlopeEmbedding, self).__init__()
+
+    def forward(self, x):
+        # x: [Batch, Variate, Time]
+        steps = torch.arange(x.size(-1), device=x.device, dtype=x.dtype)
+        return (x - x[..., :1]) / torch.clamp(steps, min=1)
+
+
+class EWMA(nn.Module):
+    """
+    Exponentially weighted moving average of every series along the time dimension,
+    starting from the first time step. The recurrence is computed as a parallel prefix
+    scan, in log2(Time) steps that each add the partial averages of twice as many
+    past time steps.
+
+    **Parameters:**<br>
+    `alpha`: float, smoothing factor, the weight of each new time step.<br>
+    """
+
+    def __init__(self, alpha):
+        super(EWMA, self).__init__()
+        self.alpha = alpha
+
+    def forward(self, x):
+        """
+        **Parameters:**<br>
+        `x`: tensor, series of dimensions [Batch, Time, Variate].<br>
+
+        **Returns:**<br>
+        `x`: tensor, averaged series of dimensions [Batch, Time, Variate].<br>
+        """
+        # every time step weighted by alpha, except the first one which starts the average
+        x = torch.cat([x[:, :1], self.alpha * x[:, 1:]], dim=1)
+        span = 1
+        while span < x.size(1):
+            # x[t] sums the decayed steps (t - 2 * span, t]
+            decayed = (1 - self.alpha) ** span * x[:, :-span]
+            x = torch.cat([x[:, :span], x[:, span:] + decayed], dim=1)
+            span *= 2
+        return x
+
+
+class SmoothResidualDecomp(nn.Module):
+    """
+    Decomposition of the series into their Gaussian smoothing and their smoothed
+    residual, rescaled to the min-max range of the raw residual. The range of each
+    residual is reduced once before and once after its smoothing.
+
+    **Parameters:**<br>
+    `kernel_size`: int, size of the Gaussian kernels.<br>
+    `smooth_sigma`: float, standard deviation of the kernel smoothing the series.<br>
+    `residual_sigma`: float, standard deviation of the kernel smoothing the residual.<br>
+    `eps`: float, added to the range of the smoothed residual.<br>
+    """
+
+    def __init__(self, kernel_size=3, smooth_sigma=2.75, residual_sigma=1.75, eps=1e-5):
+        super(SmoothResidualDecomp, self).__init__()
+        self.smooth_filter = GaussianSmoothing(kernel_size, smooth_sigma)
+        self.residual_filter = GaussianSmoothing(kernel_size, residual_sigma)
+        self.eps = eps
+
+    def forward(self, x):
+        """
+        **Parameters:**<br>
+        `x`: tensor, series of dimensions [Batch, Time, Variate].<br>
+
+        **Returns:**<br>
+        `smoothed`: tensor, smoothed series of dimensions [Batch, Time, Variate].<br>
+        `residual`: tensor, rescaled smoothed residual of dimensions [Batch, Time, Variate].<br>
+        """
+        smoothed = self.smooth_filter(x)
+        residual = x - smoothed
+        min_vals, max_vals = torch.aminmax(residual, dim=1, keepdim=True)
+
+        residual = self.residual_filter(residual)
+        min_smooth, max_smooth = torch.aminmax(residual, dim=1, keepdim=True)
+        scale = (max_vals - min_vals) / (max_smooth - min_smooth + self.eps)
+        residual = torch.addcmul(min_vals - min_smooth * scale, residual, scale)
+        return smoothed, residual
+
+
+class GroupedLinear(nn.Module):
+    """
+    Bank of `n_groups` linear layers stored in one stacked weight, evaluated by a
+    single matrix product. The layers either share their input, of dimensions
+    [..., in_features], or take one input each, of dimensions [..., n_groups, in_features].
+    The outputs have dimensions [..., n_groups, out_features].
+
+    The layers are initialized like `nn.Linear`, one after another, and the state dicts
+    of `nn.ModuleList`s of `nn.Linear` are converted on load.
+
+    **Parameters:**<br>
+    `n_groups`: int, number of linear layers.<br>
+    `in_features`: int, size of the inputs.<br>
+    `out_features`: int, size of the outputs.<br>
+    `bias`: bool, whether the layers learn an additive bias.<br>
+    `shared_input`: bool, whether all the layers take the same input.<br>
+    """
+
+    def __init__(
+        self, n_groups, in_features, out_features, bias=True, shared_input=False
+    ):
+        super(GroupedLinear, self).__init__()
+        self.n_groups = n_groups
+        self.in_features = in_features
+        self.out_features = out_features
+        self.shared_input = shared_input
+        self.weight = nn.Parameter(torch.empty(n_groups, out_features, in_features))
+        if bias:
+            self.bias = nn.Parameter(torch.empty(n_groups, out_features))
+        else:
+            self.register_parameter("bias", None)
+        self.reset_parameters()
+        self._register_load_state_dict_pre_hook(self._stack_linear_weights)
+
+    def reset_parameters(self):
+        bound = 1 / math.sqrt(self.in_features) if self.in_features > 0 else 0
+        for g in range(self.n_groups):
+            nn.init.kaiming_uniform_(self.weight[g], a=math.sqrt(5))
+            if self.bias is not None:
+                nn.init.uniform_(self.bias[g], -bound, bound)
+
+    def _stack_linear_weights(self, state_dict, prefix, *args):
+        # {prefix}{g}.weight of a ModuleList of nn.Linear -> {prefix}weight
+        for name in ["weight", "bias"]:
+            keys = [f"{prefix}{g}.{name}" for g in range(self.n_groups)]
+            if all(key in state_dict for key in keys):
+                state_dict[prefix + name] = torch.stack(
+                    [state_dict.pop(key) for key in keys]
+                )
+
+    def forward(self, x):
+        if self.shared_input:
+            weight = self.weight.flatten(0, 1)
+            bias = None if self.bias is None else self.bias.flatten()
+            x = F.linear(x, weight, bias)
+            return x.unflatten(-1, (self.n_groups, self.out_features))
+
+        x = torch.einsum("...gi,goi->...go", x, self.weight)
+        if self.bias is not None:
+            x = x + self.bias
+        return x
@@ -7,6 +7,7 @@ __all__ = ['NeuralForecast']
 import os
 import pickle
 import warnings
+from contextlib import ExitStack
 from copy import deepcopy
 from itertools import chain
 from typing import Any, Dict, List, Optional, Sequence, Union
@@ -28,6 +29,7 @@ from utilsforecast.compat import DataFrame, Series, pl_DataFrame, pl_Series
 from utilsforecast.validation import validate_freq
 
 from .common._base_model import DistributedConfig
+from .common._base_windows import _predict_ensemble
 from .compat import SparkDataFrame
 from neuralforecast.tsdataset import (
     _FilesDataset,
@@ -218,6 +220,35 @@ def _warn_id_as_idx():
     )
 
 # %% ../nbs/core.ipynb 10
+_cv_panel = None
+
+
+def _init_cv_worker(panel_path: str, num_threads: int) -> None:
+    global _cv_panel
+    import pyarrow as pa
+
+    torch.set_num_threads(num_threads)
+    _cv_panel = pa.ipc.open_file(pa.memory_map(panel_path)).read_all()
+
+
+def _cv_worker_windows(nf, windows, is_pandas, window_kwargs, return_nf):
+    # Fits `nf` on the first window and predicts all of them
+    def take(rows):
+        rows_table = _cv_panel.take(rows)
+        if is_pandas:
+            return rows_table.to_pandas()
+        return pl_DataFrame(rows_table)
+
+    results = []
+    for i_window, (cutoffs, train_rows, test_rows) in enumerate(windows):
+        train = take(train_rows)
+        fold_result = nf._refit_window(
+            cutoffs, train, take(test_rows), i_window == 0, train, **window_kwargs
+        )
+        results.append(fold_result)
+    return results, nf if return_nf else None
+
+
 class NeuralForecast:
 
     def __init__(
@@ -274,6 +305,7 @@ class NeuralForecast:
             ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
             self.scalers_[col] = _type2scaler[self.local_scaler_type]().fit(ga)
             dataset.temporal[:, i] = torch.from_numpy(self.scalers_[col].transform(ga))
+        dataset._mark_modified()
 
     def _scalers_transform(self, dataset: TimeSeriesDataset) -> None:
         if not self.scalers_:
@@ -284,6 +316,7 @@ class NeuralForecast:
                 continue
             ga = GroupedArray(dataset.temporal[:, i].numpy(), dataset.indptr)
             dataset.temporal[:, i] = torch.from_numpy(scaler.transform(ga))
+        dataset._mark_modified()
 
     def _scalers_target_inverse_transform(
         self, data: np.ndarray, indptr: np.ndarray
@@ -746,6 +779,8 @@ class NeuralForecast:
         sort_df: bool = True,
         verbose: bool = False,
         engine=None,
+        reuse_buffer: bool = False,
+        trainer_free: Optional[bool] = None,
         **data_kwargs,
     ):
         """Predict with core.NeuralForecast.
@@ -767,6 +802,13 @@ class NeuralForecast:
             Print processing steps.
         engine : spark session
             Distributed engine for inference. Only used if df is a spark dataframe or if fit was called on a spark dataframe.
+        reuse_buffer : bool (default=False)
+            Keep the temporal of the forecasting dataset built from the stored dataset and build the forecasting
+            datasets of the next calls in it instead of allocating new ones. Only used if `df` is None.
+        trainer_free : bool, optional (default=None)
+            Predict in a `torch.inference_mode` loop instead of Lightning's `Trainer`.
+            If None, uses each model's `TRAINER_FREE_PREDICT`. Trainer-free models that create the same
+            predict windows are predicted together in a single pass over the dataset.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -876,7 +918,30 @@ class NeuralForecast:
             target_col=self.target_col,
         )
         self._scalers_transform(futr_dataset)
-        dataset = dataset.append(futr_dataset)
+        dataset = dataset.append(futr_dataset, reuse_buffer=reuse_buffer and df is None)
+
+        # Trainer-free models that create the same predict windows are predicted
+        # together, the ones predicted by Lightning's `Trainer` go one by one
+        shared_models = {}
+        for model in self.models:
+            key = model._shared_inference_key()
+            if key is None:
+                continue
+            if trainer_free or (trainer_free is None and model.TRAINER_FREE_PREDICT):
+                shared_models.setdefault(key, []).append(model)
+        shared_fcsts = {}
+        for models in shared_models.values():
+            if len(models) < 2:
+                continue
+            old_test_sizes = [model.get_test_size() for model in models]
+            for model in models:
+                model.set_test_size(self.h)  # To predict h steps ahead
+            models_fcsts = _predict_ensemble(models, dataset=dataset, **data_kwargs)
+            for model, model_fcsts, old_test_size in zip(
+                models, models_fcsts, old_test_sizes
+            ):
+                shared_fcsts[id(model)] = model_fcsts
+                model.set_test_size(old_test_size)
 
         col_idx = 0
         fcsts = np.full(
@@ -885,7 +950,12 @@ class NeuralForecast:
         for model in self.models:
             old_test_size = model.get_test_size()
             model.set_test_size(self.h)  # To predict h steps ahead
-            model_fcsts = model.predict(dataset=dataset, **data_kwargs)
+            if id(model) in shared_fcsts:
+                model_fcsts = shared_fcsts[id(model)]
+            else:
+                model_fcsts = model.predict(
+                    dataset=dataset, trainer_free=trainer_free, **data_kwargs
+                )
             # Append predictions in memory placeholder
             output_length = len(model.loss.output_names)
             fcsts[:, col_idx : col_idx + output_length] = model_fcsts
@@ -909,6 +979,33 @@ class NeuralForecast:
             fcsts_df = fcsts_df.set_index(self.id_col)
         return fcsts_df
 
+    def _append_to_dataset(self, df, cutoffs, sort_df) -> bool:
+        # Appends the rows of `df` after the `cutoffs` to the stored dataset. Returns
+        # False if they don't extend the same series and columns.
+        new_df = ufp.join(df, cutoffs, on=self.id_col)
+        new_df = ufp.filter_with_mask(new_df, new_df[self.time_col] > new_df["cutoff"])
+        new_df = ufp.drop_columns(new_df, "cutoff")
+        if new_df.shape[0] == 0:
+            return False
+        self._check_nan(new_df, None, self.id_col, self.time_col, self.target_col)
+        futr_dataset, uids, last_dates, ds = TimeSeriesDataset.from_df(
+            df=new_df,
+            sort_df=sort_df,
+            id_col=self.id_col,
+            time_col=self.time_col,
+            target_col=self.target_col,
+        )
+        if not futr_dataset.temporal_cols.equals(
+            self.dataset.temporal_cols
+        ) or not np.array_equal(np.asarray(uids), np.asarray(self.uids)):
+            return False
+        self._scalers_transform(futr_dataset)
+        new_rows = np.repeat(self.dataset.indptr[1:], np.diff(futr_dataset.indptr))
+        self.ds = np.insert(self.ds, new_rows, ds)
+        self.dataset = self.dataset.append(futr_dataset)
+        self.last_dates = last_dates
+        return True
+
     def _reset_models(self):
         self.models = [deepcopy(model) for model in self.models_init]
         if self._fitted:
@@ -964,19 +1061,6 @@ class NeuralForecast:
                 model_name += str(count_names[model_name])
             cols += [model_name + n for n in model.loss.output_names]
 
-        fcsts_df = ufp.cv_times(
-            times=self.ds,
-            uids=self.uids,
-            indptr=self.dataset.indptr,
-            h=self.h,
-            test_size=test_size,
-            step_size=step_size,
-            id_col=id_col,
-            time_col=time_col,
-        )
-        # the cv_times is sorted by window and then id
-        fcsts_df = ufp.sort(fcsts_df, [id_col, "cutoff", time_col])
-
         col_idx = 0
         fcsts = np.full(
             (self.dataset.n_groups * self.h * n_windows, len(cols)),
@@ -994,46 +1078,56 @@ class NeuralForecast:
             output_length = len(model.loss.output_names)
             fcsts[:, col_idx : (col_idx + output_length)] = model_fcsts
             col_idx += output_length
-        # we may have allocated more space than needed
-        # each serie can produce at most (serie.size - 1) // self.h CV windows
-        effective_sizes = ufp.counts_by_id(fcsts_df, id_col)["counts"].to_numpy()
-        needs_trim = effective_sizes.sum() != fcsts.shape[0]
-        if self.scalers_ or needs_trim:
-            indptr = np.arange(
-                0,
-                n_windows * self.h * (self.dataset.n_groups + 1),
-                n_windows * self.h,
-                dtype=np.int32,
+        # we may have allocated more space than needed, each serie only keeps its
+        # last windows that start after the serie's first timestamp
+        indptr = self.dataset.indptr.astype(np.int64)
+        first_window = -((np.diff(indptr) - test_size - 1) // step_size)
+        first_window = np.clip(first_window, 0, n_windows)
+        effective_sizes = (n_windows - first_window) * self.h
+        cv_indptr = np.append(0, effective_sizes.cumsum()).astype(np.int32)
+        serie_idxs = np.repeat(np.arange(self.dataset.n_groups), effective_sizes)
+        sample_idxs = np.arange(cv_indptr[-1]) - cv_indptr[:-1][serie_idxs]
+        window_idxs, horizon_idxs = np.divmod(sample_idxs, self.h)
+        window_idxs += first_window[serie_idxs]
+        # rows of the samples in the predictions and in the dataset
+        fcsts_idxs = (serie_idxs * n_windows + window_idxs) * self.h + horizon_idxs
+        times_idxs = (
+            indptr[1:][serie_idxs] - test_size + window_idxs * step_size + horizon_idxs
+        )
+
+        fcsts = fcsts[fcsts_idxs]
+        if df is not None:
+            # original input df's y, in the order of the dataset
+            y = df[target_col].to_numpy()
+            sort_idxs = ufp.maybe_compute_sort_indices(df, id_col, time_col)
+            if sort_idxs is not None:
+                y = y[sort_idxs]
+            y = y[times_idxs]
+            fcsts = self._scalers_target_inverse_transform(fcsts, cv_indptr)
+        else:
+            # the stored dataset's y is transformed back with the predictions
+            y = self.dataset.temporal[:, self.dataset.y_idx].numpy()[times_idxs]
+            fcsts = self._scalers_target_inverse_transform(
+                np.hstack([fcsts, y[:, None]]), cv_indptr
             )
-            if self.scalers_:
-                fcsts = self._scalers_target_inverse_transform(fcsts, indptr)
-            if needs_trim:
-                # we keep only the effective samples of each serie from the cv results
-                trimmed = np.empty_like(
-                    fcsts, shape=(effective_sizes.sum(), fcsts.shape[1])
-                )
-                cv_indptr = np.append(0, effective_sizes).cumsum(dtype=np.int32)
-                for i in range(fcsts.shape[1]):
-                    ga = GroupedArray(fcsts[:, i], indptr)
-                    trimmed[:, i] = ga._tails(cv_indptr)
-                fcsts = trimmed
+            fcsts, y = fcsts[:, :-1], fcsts[:, -1]
 
         self._fitted = True
 
-        # Add predictions to forecasts DataFrame
+        # Add predictions and target to forecasts DataFrame
+        fcsts_df = {
+            id_col: ufp.repeat(self.uids, effective_sizes),
+            time_col: self.ds[times_idxs],
+            "cutoff": self.ds[times_idxs - horizon_idxs - 1],
+        }
         if isinstance(self.uids, pl_Series):
-            fcsts = pl_DataFrame(dict(zip(cols, fcsts.T)))
+            fcsts_df = pl_DataFrame(fcsts_df)
+            fcsts = pl_DataFrame({**dict(zip(cols, fcsts.T)), target_col: y})
         else:
-            fcsts = pd.DataFrame(fcsts, columns=cols)
+            fcsts_df = pd.DataFrame(fcsts_df)
+            fcsts = pd.DataFrame(fcsts, columns=cols, copy=False)
+            fcsts[target_col] = y
         fcsts_df = ufp.horizontal_concat([fcsts_df, fcsts])
-
-        # Add original input df's y to forecasts DataFrame
-        fcsts_df = ufp.join(
-            fcsts_df,
-            df[[id_col, time_col, target_col]],
-            how="left",
-            on=[id_col, time_col],
-        )
         if isinstance(fcsts_df, pd.DataFrame) and _id_as_idx():
             _warn_id_as_idx()
             fcsts_df = fcsts_df.set_index(id_col)
@@ -1054,6 +1148,8 @@ class NeuralForecast:
         id_col: str = "unique_id",
         time_col: str = "ds",
         target_col: str = "y",
+        warm_start_steps: Optional[int] = None,
+        n_jobs: int = 1,
         **data_kwargs,
     ) -> DataFrame:
         """Temporal Cross-Validation with core.NeuralForecast.
@@ -1092,6 +1188,19 @@ class NeuralForecast:
             Column that identifies each timestep, its values can be timestamps or integers.
         target_col : str (default='y')
             Column that contains the target.
+        warm_start_steps : int, optional (default=None)
+            Only used with `refit`. If int, the retrainings after the first window continue from
+            the weights and optimizer states of the previous one for `warm_start_steps` steps,
+            on the stored dataset extended with the new observations. The local scalers
+            keep the statistics of the first window.
+        n_jobs : int (default=1)
+            Only used with `refit`. Number of processes that fit and predict the windows, each
+            group of windows between refits is sent to a process with a copy of the initial
+            models and a memory-mapped view of `df`. If greater than 1, every group trains
+            from the initial models and the torch threads are split between the processes.
+            The forecasts after the first refit then differ from `n_jobs=1`, where every refit
+            continues from the weights of the previous one. Each group gives the forecasts of a
+            serial cross validation that starts at its first window.
         data_kwargs : kwargs
             Extra arguments to be passed to the dataset within each model.
 
@@ -1138,9 +1247,14 @@ class NeuralForecast:
             )
         if df is None:
             raise ValueError("Must specify `df` with `refit!=False`.")
+        if warm_start_steps is not None and not all(
+            hasattr(model, "_warm_start") for model in self.models
+        ):
+            raise ValueError("Auto models don't support `warm_start_steps`.")
+        if n_jobs > 1 and warm_start_steps is not None:
+            raise ValueError("`warm_start_steps` can't be used with `n_jobs > 1`.")
         validate_freq(df[time_col], self.freq)
-        splits = ufp.backtest_splits(
-            df,
+        splits_kwargs = dict(
             n_windows=n_windows,
             h=self.h,
             id_col=id_col,
@@ -1149,39 +1263,44 @@ class NeuralForecast:
             step_size=step_size,
             input_size=None,
         )
-        results = []
-        for i_window, (cutoffs, train, test) in enumerate(splits):
-            should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
-            if should_fit:
-                self.fit(
-                    df=train,
-                    static_df=static_df,
-                    val_size=val_size,
-                    sort_df=sort_df,
-                    use_init_models=False,
-                    verbose=verbose,
-                )
-                predict_df: Optional[DataFrame] = None
-            else:
-                predict_df = train
-            needed_futr_exog = self._get_needed_futr_exog()
-            if needed_futr_exog:
-                futr_df: Optional[DataFrame] = test
-            else:
-                futr_df = None
-            preds = self.predict(
-                df=predict_df,
-                static_df=static_df,
-                futr_df=futr_df,
-                sort_df=sort_df,
-                verbose=verbose,
-                **data_kwargs,
-            )
-            preds = ufp.join(preds, cutoffs, on=id_col, how="left")
-            fold_result = ufp.join(
-                preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
+        window_kwargs = dict(
+            static_df=static_df,
+            val_size=val_size,
+            sort_df=sort_df,
+            verbose=verbose,
+            id_col=id_col,
+            time_col=time_col,
+            target_col=target_col,
+            **data_kwargs,
+        )
+        if n_jobs > 1:
+            results = self._parallel_refit_windows(
+                df, splits_kwargs, refit, n_jobs, window_kwargs
             )
-            results.append(fold_result)
+        else:
+            splits = ufp.backtest_splits(df, **splits_kwargs)
+            results = []
+            fit_cutoffs = None
+            with ExitStack() as warm_start:
+                if warm_start_steps is not None:
+                    for model in self.models:
+                        warm_start.enter_context(model._warm_start(warm_start_steps))
+                for i_window, (cutoffs, train, test) in enumerate(splits):
+                    should_fit = i_window == 0 or (refit > 0 and i_window % refit == 0)
+                    # Warm started refits only append the new observations
+                    fit_df = train
+                    if (
+                        should_fit
+                        and fit_cutoffs is not None
+                        and self._append_to_dataset(train, fit_cutoffs, sort_df)
+                    ):
+                        fit_df = None
+                    fold_result = self._refit_window(
+                        cutoffs, train, test, should_fit, fit_df, **window_kwargs
+                    )
+                    results.append(fold_result)
+                    if should_fit and warm_start_steps is not None:
+                        fit_cutoffs = cutoffs
         out = ufp.vertical_concat(results, match_categories=False)
         out = ufp.drop_index_if_pandas(out)
         # match order of cv with no refit
@@ -1196,6 +1315,117 @@ class NeuralForecast:
             out = out.set_index(id_col)
         return out
 
+    def _refit_window(
+        self,
+        cutoffs,
+        train,
+        test,
+        fit,
+        fit_df,
+        static_df,
+        val_size,
+        sort_df,
+        verbose,
+        id_col,
+        time_col,
+        target_col,
+        **data_kwargs,
+    ):
+        # Predictions of a refit cross validation window joined with its test. If
+        # `fit`, the models are first fitted on `fit_df` (the stored dataset if None).
+        if fit:
+            self.fit(
+                df=fit_df,
+                static_df=static_df,
+                val_size=val_size,
+                sort_df=sort_df,
+                use_init_models=False,
+                verbose=verbose,
+            )
+            predict_df: Optional[DataFrame] = None
+        else:
+            predict_df = train
+        needed_futr_exog = self._get_needed_futr_exog()
+        if needed_futr_exog:
+            futr_df: Optional[DataFrame] = test
+        else:
+            futr_df = None
+        preds = self.predict(
+            df=predict_df,
+            static_df=static_df,
+            futr_df=futr_df,
+            sort_df=sort_df,
+            verbose=verbose,
+            **data_kwargs,
+        )
+        preds = ufp.join(preds, cutoffs, on=id_col, how="left")
+        return ufp.join(
+            preds, test[[id_col, time_col, target_col]], on=[id_col, time_col]
+        )
+
+    def _parallel_refit_windows(self, df, splits_kwargs, refit, n_jobs, window_kwargs):
+        # Sends each group of windows that starts with a refit to a process pool.
+        # The workers memory-map `df` and take the rows of their windows.
+        import multiprocessing
+        import tempfile
+        from concurrent.futures import ProcessPoolExecutor
+
+        import pyarrow as pa
+
+        rows_df = ufp.assign_columns(df, "_row", np.arange(df.shape[0]))
+        blocks = []
+        for i_window, (cutoffs, train, test) in enumerate(
+            ufp.backtest_splits(rows_df, **splits_kwargs)
+        ):
+            if i_window == 0 or (refit > 0 and i_window % refit == 0):
+                blocks.append([])
+            train_rows = train["_row"].to_numpy()
+            test_rows = test["_row"].to_numpy()
+            blocks[-1].append((cutoffs, train_rows, test_rows))
+        del rows_df
+
+        if isinstance(df, pd.DataFrame):
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        else:
+            table = df.to_arrow()
+        num_threads = max(1, torch.get_num_threads() // n_jobs)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            panel_path = os.path.join(tmpdir, "panel.arrow")
+            with pa.OSFile(panel_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            del table
+            with ProcessPoolExecutor(
+                max_workers=min(n_jobs, len(blocks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_cv_worker,
+                initargs=(panel_path, num_threads),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _cv_worker_windows,
+                        NeuralForecast(
+                            models=self.models_init,
+                            freq=self.freq,
+                            local_scaler_type=self.local_scaler_type,
+                        ),
+                        windows,
+                        isinstance(df, pd.DataFrame),
+                        window_kwargs,
+                        i_block == len(blocks) - 1,
+                    )
+                    for i_block, windows in enumerate(blocks)
+                ]
+                results = []
+                for future in futures:
+                    block_results, nf = future.result()
+                    results.extend(block_results)
+        # Keep the models and dataset of the last refit, as the serial windows
+        state = vars(nf)
+        state.pop("models_init")
+        self.__dict__.update(state)
+        return results
+
     def predict_insample(self, step_size: int = 1):
         """Predict insample with core.NeuralForecast.
 
@@ -1394,8 +1624,11 @@ class NeuralForecast:
                     "You can set `save_dataset=False` and use the `df` argument in the predict method after loading "
                     "this model to use it for inference."
                 )
-            with fsspec.open(f"{path}/dataset.pkl", "wb") as f:
-                pickle.dump(self.dataset, f)
+            if isinstance(self.dataset, TimeSeriesDataset):
+                self.dataset.save(f"{path}/dataset")
+            else:
+                with fsspec.open(f"{path}/dataset.pkl", "wb") as f:
+                    pickle.dump(self.dataset, f)
         elif save_dataset:
             raise Exception(
                 "You need to have a stored dataset to save it, \
@@ -1427,7 +1660,7 @@ class NeuralForecast:
             pickle.dump(config_dict, f)
 
     @staticmethod
-    def load(path, verbose=False, **kwargs):
+    def load(path, verbose=False, mmap_dataset=True, **kwargs):
         """Load NeuralForecast
 
         `core.NeuralForecast`'s method to load checkpoint from path.
@@ -1436,6 +1669,8 @@ class NeuralForecast:
         -----------
         path : str
             Directory with stored artifacts.
+        mmap_dataset : bool (default=True)
+            Memory-map the stored dataset instead of reading it, see `TimeSeriesDataset.load`.
         kwargs
             Additional keyword arguments to be passed to the function
             `load_from_checkpoint`.
@@ -1480,8 +1715,11 @@ class NeuralForecast:
             print(10 * "-" + " Loading dataset " + 10 * "-")
         # Load dataset
         try:
-            with fsspec.open(f"{path}/dataset.pkl", "rb") as f:
-                dataset = pickle.load(f)
+            if fs.exists(f"{path}/dataset/meta.json"):
+                dataset = TimeSeriesDataset.load(f"{path}/dataset", mmap=mmap_dataset)
+            else:
+                with fsspec.open(f"{path}/dataset.pkl", "rb") as f:
+                    dataset = pickle.load(f)
             if verbose:
                 print("Dataset loaded.")
         except FileNotFoundError:
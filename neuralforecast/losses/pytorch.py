@@ -1046,6 +1046,351 @@ def tweedie_scale_decouple(output, loc=None, scale=None):
         log_mu += torch.log(loc)  # TODO : rho scaling
     return (log_mu,)
 
+
+def _icdf_dtype(device):
+    # The quantile functions are solved in float64, except on the devices
+    # without float64 support (MPS) where they fall back to float32.
+    return torch.float32 if device.type == "mps" else torch.float64
+
+
+def _betainc(a, b, x, max_iter: int = 200, eps: float = 1e-12):
+    # Regularized incomplete beta function I_x(a, b), with the continued fraction
+    # of Numerical Recipes (6.4) evaluated by the modified Lentz method until all
+    # the fractions converge. The fraction converges quickly for
+    # x < (a + 1) / (a + b + 2), otherwise it is evaluated on
+    # I_x(a, b) = 1 - I_{1-x}(b, a).
+    swap = x > (a + 1) / (a + b + 2)
+    a, b, x = (
+        torch.where(swap, b, a),
+        torch.where(swap, a, b),
+        torch.where(swap, 1 - x, x),
+    )
+    tiny = torch.finfo(x.dtype).tiny
+    eps = max(eps, torch.finfo(x.dtype).eps)
+
+    def clamp(v):
+        return torch.where(v.abs() < tiny, torch.full_like(v, tiny), v)
+
+    c = torch.ones_like(x)
+    d = 1 / clamp(1 - (a + b) * x / (a + 1))
+    h = d
+    for m in range(1, max_iter + 1):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1 / clamp(1 + numerator * d)
+            c = clamp(1 + numerator / c)
+            delta = d * c
+            h = h * delta
+        # check the convergence every few iterations to limit synchronizations
+        if m % 4 == 0 and (delta - 1).abs().max() < eps:
+            break
+    log_front = (
+        a * torch.log(x)
+        + b * torch.log1p(-x)
+        - (torch.lgamma(a) + torch.lgamma(b) - torch.lgamma(a + b))
+    )
+    betainc = torch.exp(log_front) * h / a
+    return torch.where(swap, 1 - betainc, betainc)
+
+
+def normal_icdf(distr, quantiles):
+    """Normal Quantile Function
+
+    **Parameters:**<br>
+    `distr`: Normal distribution with batch shape [B,H].<br>
+    `quantiles`: tensor, quantiles of dimensions [Q,1,1].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [Q,B,H].<br>
+    """
+    return distr.icdf(quantiles)
+
+
+def student_icdf(distr, quantiles, n_newton: int = 1):
+    """StudentT Quantile Function
+
+    Hill's approximation (Algorithm 396, as implemented by R's `qt`) of the
+    standard StudentT quantiles, refined with Newton steps on the exact
+    distribution function (computed with the incomplete beta function).
+    A single step brings the relative error of the approximation from 1e-3
+    to 1e-6.
+
+    **Parameters:**<br>
+    `distr`: StudentT distribution with batch shape [B,H].<br>
+    `quantiles`: tensor, quantiles of dimensions [Q,1,1].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [Q,B,H].<br>
+    """
+    df = distr.df.to(_icdf_dtype(distr.df.device))
+    q = quantiles.to(df)
+    # two tailed probabilities, the upper quantiles are computed once for the
+    # symmetric levels and mirrored
+    P, inverse = torch.unique(2 * torch.minimum(q, 1 - q), return_inverse=True)
+    P = P.view(-1, *[1] * df.dim())
+    a = 1 / (df - 0.5)
+    b = 48 / (a * a)
+    c = ((20700 * a / b - 98) * a - 16) * a + 96.36
+    d = ((94.5 / (b + c) - 3) / b + 1) * torch.sqrt(a * math.pi / 2) * df
+    y = torch.pow(d * P, 2 / df)
+
+    # asymptotic inverse expansion about the normal
+    x = math.sqrt(2) * torch.erfinv(P - 1)
+    x2 = x * x
+    c_normal = torch.where(df < 5, c + 0.3 * (df - 4.5) * (x + 0.6), c)
+    c_normal = (((0.05 * d * x - 5) * x - 7) * x - 2) * x + b + c_normal
+    y_normal = (
+        ((((0.4 * x2 + 6.3) * x2 + 36) * x2 + 94.5) / c_normal - x2 - 3) / b + 1
+    ) * x
+    y_normal = torch.expm1(a * y_normal * y_normal)
+    # small P
+    y_tail = (
+        (
+            1 / (((df + 6) / (df * y) - 0.089 * d - 0.822) * (df + 2) * 3)
+            + 0.5 / (df + 4)
+        )
+        * y
+        - 1
+    ) * (df + 1) / (df + 2) + 1 / y
+    y = torch.where(((df < 2.1) & (P > 0.5)) | (y > 0.05 + a), y_normal, y_tail)
+    t = torch.sqrt(df * y)
+
+    # Newton steps on the upper tail, 0.5 * I_{df/(df+t^2)}(df/2, 1/2) = P/2
+    log_norm = (
+        torch.lgamma((df + 1) / 2)
+        - torch.lgamma(df / 2)
+        - 0.5 * torch.log(df * math.pi)
+    )
+    for _ in range(n_newton):
+        upper = 0.5 * _betainc(df / 2, torch.full_like(t, 0.5), df / (df + t * t))
+        log_pdf = log_norm - (df + 1) / 2 * torch.log1p(t * t / df)
+        t = torch.clamp(t + (upper - P / 2) / torch.exp(log_pdf), min=0)
+    t = t[inverse.flatten()]
+    t = torch.where(q < 0.5, -t, t)
+    return (distr.loc + distr.scale * t).to(distr.loc.dtype)
+
+
+def poisson_icdf(distr, quantiles):
+    """Poisson Quantile Function
+
+    Smallest count whose distribution function reaches the quantile, walked to
+    from the Cornish-Fisher approximation with `discrete_mixture_icdf`. The
+    0-quantile is 0 and the 1-quantile is infinite (0 for a null rate),
+    non-finite rates are returned as is.
+
+    **Parameters:**<br>
+    `distr`: Poisson distribution with batch shape [B,H].<br>
+    `quantiles`: tensor, quantiles of dimensions [Q,1,1].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [Q,B,H].<br>
+    """
+    rate = distr.rate.to(_icdf_dtype(distr.rate.device))
+    q = quantiles.to(rate)
+    z = math.sqrt(2) * torch.erfinv(2 * q - 1)
+    start = torch.floor(rate + torch.sqrt(rate) * z + (z * z - 1) / 6).clamp(min=0)
+    shape = start.shape
+    rate = rate.expand(shape).flatten()
+    q = q.expand(shape).flatten()
+
+    quants = torch.where((q >= 1) & (rate > 0), math.inf, 0.0).to(rate)
+    quants = torch.where(torch.isfinite(rate), quants, rate)
+    solve = torch.isfinite(rate) & (q > 0) & (q < 1)
+    rate = rate[solve]
+
+    def cdf(k, idx):
+        return torch.special.gammaincc(k + 1, rate[idx])
+
+    def pmf(k, idx):
+        return Poisson(rate[idx], validate_args=False).log_prob(k).exp()
+
+    quants[solve] = discrete_mixture_icdf(
+        cdf, pmf, quantiles=q[solve], start=start.flatten()[solve]
+    )
+    return quants.view(shape).to(distr.rate.dtype)
+
+
+def discrete_mixture_icdf(cdf, pmf, quantiles, start, max_iter: int = 10_000):
+    """Discrete Mixture Quantile Function
+
+    Smallest count whose mixture distribution function reaches the quantile.
+    The distribution function `cdf` is evaluated once at the `start` counts,
+    and then updated with the probability mass `pmf` of every count walked
+    to, one count at a time and only for the unsolved entries.
+
+    **Parameters:**<br>
+    `cdf`: callable, `cdf(k, idx)` mixture distribution function at the counts `k` of the entries `idx`.<br>
+    `pmf`: callable, `pmf(k, idx)` mixture probability mass at the counts `k` of the entries `idx`.<br>
+    `quantiles`: tensor, quantile of every entry, of dimensions [N].<br>
+    `start`: tensor, first guess of the counts, of dimensions [N].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [N].<br>
+    """
+    q = quantiles
+    k = start.clone()
+    idx = torch.arange(len(q), device=q.device)
+    F = cdf(k, idx)
+    descend = idx[F >= q]
+
+    # walk up while F(k) < q
+    for _ in range(max_iter):
+        idx = idx[F[idx] < q[idx]]
+        if len(idx) == 0:
+            break
+        k[idx] += 1
+        F[idx] += pmf(k[idx], idx)
+
+    # walk down while F(k - 1) = F(k) - pmf(k) >= q
+    idx = descend
+    mass = pmf(k[idx], idx)
+    for _ in range(max_iter):
+        keep = (k[idx] > 0) & (F[idx] - mass >= q[idx])
+        idx, mass = idx[keep], mass[keep]
+        if len(idx) == 0:
+            break
+        F[idx] -= mass
+        k[idx] -= 1
+        mass = pmf(k[idx], idx)
+    return k
+
+
+def mixture_icdf(
+    cdf,
+    pdf,
+    quantiles,
+    lower,
+    upper,
+    start=None,
+    max_iter: int = 100,
+    eps: float = 1e-6,
+):
+    """Mixture Quantile Function
+
+    Value where the mixture distribution function `cdf` reaches the quantile,
+    solved in batch from the brackets `lower` and `upper` with Newton steps on
+    the mixture density `pdf`, bisecting whenever a step leaves the bracket.
+    The steps start from `start`, or from the middle of the brackets.
+    Only the unsolved entries are evaluated at every step.
+
+    **Parameters:**<br>
+    `cdf`: callable, `cdf(x, idx)` mixture distribution function at the values `x` of the entries `idx`.<br>
+    `pdf`: callable, `pdf(x, idx)` mixture density at the values `x` of the entries `idx`.<br>
+    `quantiles`: tensor, quantile of every entry, of dimensions [N].<br>
+    `lower`: tensor, lower brackets of dimensions [N].<br>
+    `upper`: tensor, upper brackets of dimensions [N].<br>
+    `start`: tensor, optional first guess of dimensions [N].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [N].<br>
+    """
+    q = quantiles
+    lower, upper = lower.clone(), upper.clone()
+    if start is None:
+        x = (lower + upper) / 2
+    else:
+        x = torch.minimum(torch.maximum(start, lower), upper)
+    idx = torch.arange(len(q), device=q.device)
+    for _ in range(max_iter):
+        x_idx, lower_idx, upper_idx = x[idx], lower[idx], upper[idx]
+        F = cdf(x_idx, idx)
+        below = F < q[idx]
+        lower_idx = torch.where(below, x_idx, lower_idx)
+        upper_idx = torch.where(below, upper_idx, x_idx)
+        x_new = x_idx - (F - q[idx]) / pdf(x_idx, idx)
+        # also catches the nan steps of vanishing densities
+        inside = (x_new > lower_idx) & (x_new < upper_idx)
+        x_new = torch.where(inside, x_new, (lower_idx + upper_idx) / 2)
+        x[idx], lower[idx], upper[idx] = x_new, lower_idx, upper_idx
+        idx = idx[(x_new - x_idx).abs() > eps * (1 + x_idx.abs())]
+        if len(idx) == 0:
+            break
+    return x
+
+
+def normal_mixture_icdf(loc, scale, quantiles, eps: float = 1e-6):
+    """Normal Mixture Quantile Function
+
+    Quantiles of equally weighted mixtures of Normal components, solved with
+    `mixture_icdf` between the smallest and largest quantiles of the components,
+    from the quantiles of the Normal with the mixture's mean and variance.
+
+    **Parameters:**<br>
+    `loc`: tensor, components' means of dimensions [N,K].<br>
+    `scale`: tensor, components' standard deviations of dimensions [N,K].<br>
+    `quantiles`: tensor, quantile of every mixture, of dimensions [N].<br>
+
+    **Returns:**<br>
+    `quants`: tensor, of dimensions [N].<br>
+    """
+    z = math.sqrt(2) * torch.erfinv(2 * quantiles - 1)
+    components = loc + scale * z.unsqueeze(-1)
+    mean = loc.mean(dim=-1)
+    var = (scale**2 + loc**2).mean(dim=-1) - mean**2
+
+    def standardize(x, idx):
+        return (x.unsqueeze(-1) - loc[idx]) / scale[idx]
+
+    def cdf(x, idx):
+        return (0.5 * torch.erfc(-standardize(x, idx) / math.sqrt(2))).mean(dim=-1)
+
+    def pdf(x, idx):
+        density = torch.exp(-0.5 * standardize(x, idx) ** 2) / scale[idx]
+        return density.mean(dim=-1) / math.sqrt(2 * math.pi)
+
+    return mixture_icdf(
+        cdf,
+        pdf,
+        quantiles=quantiles,
+        lower=components.amin(dim=-1),
+        upper=components.amax(dim=-1),
+        start=mean + torch.sqrt(var.clamp(min=0)) * z,
+        eps=eps,
+    )
+
+
+def sample_in_chunks(loss, distr_args, num_samples=None):
+    """Chunked Empirical Quantiles
+
+    Mean and empirical quantiles of `loss.sample`, drawing the samples of a
+    few windows at a time so that at most `loss.max_sample_bytes` of samples
+    are held at once. The means and quantiles of every chunk are written into
+    preallocated outputs. The chunks are sampled in order from the same random
+    generator, so a fixed seed gives identical results, and a batch within the
+    budget is sampled in a single call.
+
+    **Parameters:**<br>
+    `loss`: DistributionLoss, PMM, GMM or NBMM, with the `sample` method.<br>
+    `distr_args`: Constructor arguments for the underlying Distribution type, with the windows in the first dimension.<br>
+    `num_samples`: int, optional overwrite of `loss.num_samples`.<br>
+
+    **Returns:**<br>
+    `mean`: tensor, shape [B,H,1].<br>
+    `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+    """
+    if num_samples is None:
+        num_samples = loss.num_samples
+    B, H = distr_args[0].shape[:2]
+    window_bytes = H * num_samples * distr_args[0].element_size()
+    # no budget, or losses pickled before it, sample in a single chunk
+    max_sample_bytes = getattr(loss, "max_sample_bytes", None)
+    if max_sample_bytes is None or B * window_bytes <= max_sample_bytes:
+        _, sample_mean, quants = loss.sample(distr_args, num_samples=num_samples)
+        return sample_mean, quants
+
+    chunk_size = max(1, max_sample_bytes // window_bytes)
+    sample_mean = distr_args[0].new_empty((B, H, 1))
+    quants = distr_args[0].new_empty((B, H, len(loss.quantiles)))
+    for start in range(0, B, chunk_size):
+        end = start + chunk_size
+        chunk_args = tuple(arg[start:end] for arg in distr_args)
+        _, sample_mean[start:end], quants[start:end] = loss.sample(
+            chunk_args, num_samples=num_samples
+        )
+    return sample_mean, quants
+
 # %% ../../nbs/losses.pytorch.ipynb 67
 # Code adapted from: https://github.com/awslabs/gluonts/blob/61133ef6e2d88177b32ace4afc6843ab9a7bc8cd/src/gluonts/torch/distributions/isqf.py
 
@@ -1860,8 +2205,10 @@ class DistributionLoss(torch.nn.Module):
     `distribution`: str, identifier of a torch.distributions.Distribution class.<br>
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
-    `num_samples`: int=500, number of samples for the empirical quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `num_samples`: int=500, number of samples for the empirical quantiles (not used by the predictions of Normal, StudentT and Poisson, whose quantiles are exact).<br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `exact_quantiles`: bool=True, wether or not predict the exact quantiles of Normal, StudentT and Poisson, otherwise they are sampled.<br>
+    `max_sample_bytes`: int=2**30, memory budget of the samples drawn at once by the sampled predictions, in bytes (None draws them all at once).<br><br>
 
     **References:**<br>
     - [PyTorch Probability Distributions Package: StudentT.](https://pytorch.org/docs/stable/distributions.html#studentt)<br>
@@ -1878,6 +2225,8 @@ class DistributionLoss(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        exact_quantiles=True,
+        max_sample_bytes=2**30,
         **distribution_kwargs,
     ):
         super(DistributionLoss, self).__init__()
@@ -1925,6 +2274,12 @@ class DistributionLoss(torch.nn.Module):
             Tweedie=tweedie_scale_decouple,
             ISQF=isqf_scale_decouple,
         )
+        # Distributions whose quantiles are computed without sampling
+        icdfs = dict(
+            Normal=normal_icdf,
+            Poisson=poisson_icdf,
+            StudentT=student_icdf,
+        )
         param_names = dict(
             Bernoulli=["-logits"],
             Normal=["-loc", "-scale"],
@@ -1944,6 +2299,9 @@ class DistributionLoss(torch.nn.Module):
         self._base_distribution = available_distributions[distribution]
         self.domain_map = domain_maps[distribution]
         self.scale_decouple = scale_decouples[distribution]
+        self.icdf = icdfs.get(distribution)
+        self.exact_quantiles = exact_quantiles
+        self.max_sample_bytes = max_sample_bytes
         self.distribution_kwargs = distribution_kwargs
         self.num_samples = num_samples
         self.param_names = param_names[distribution]
@@ -2016,6 +2374,29 @@ class DistributionLoss(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(self, distr_args: torch.Tensor):
+        """
+        Mean and quantiles defined by `level` of the estimated Distribution.
+        They are computed exactly with the quantile function of Normal, StudentT
+        and Poisson, and empirically with `sample_in_chunks` for the rest.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        # losses pickled before the exact quantiles keep sampling
+        icdf = getattr(self, "icdf", None)
+        if icdf is None or not getattr(self, "exact_quantiles", True):
+            return sample_in_chunks(self, distr_args=distr_args)
+        distr = self.get_distribution(distr_args=distr_args, **self.distribution_kwargs)
+        quantiles_device = self.quantiles.to(distr_args[0].device)
+        quantiles_device = quantiles_device.view(-1, *[1] * distr_args[0].dim())
+        quants = icdf(distr, quantiles_device).movedim(0, -1)
+        return distr.mean.unsqueeze(-1), quants
+
     def __call__(
         self,
         y: torch.Tensor,
@@ -2068,6 +2449,8 @@ class PMM(torch.nn.Module):
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
     `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `exact_quantiles`: bool=True, wether or not predict the exact quantiles of the mixture, otherwise they are sampled.<br>
+    `max_sample_bytes`: int=2**30, memory budget of the samples drawn at once by the sampled predictions, in bytes (None draws them all at once).<br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2084,6 +2467,8 @@ class PMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        exact_quantiles=True,
+        max_sample_bytes=2**30,
     ):
         super(PMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2096,6 +2481,8 @@ class PMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.exact_quantiles = exact_quantiles
+        self.max_sample_bytes = max_sample_bytes
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
 
@@ -2200,6 +2587,47 @@ class PMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(self, distr_args):
+        """
+        Mean and quantiles defined by `level` of the estimated mixture. The mean
+        is the average of the components' means, and the quantiles are solved
+        on the mixture's distribution function.
+        With `exact_quantiles=False` both are computed empirically with
+        `sample_in_chunks`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if not getattr(self, "exact_quantiles", True):
+            return sample_in_chunks(self, distr_args=distr_args)
+
+        lambdas = distr_args[0]
+        B, H, K = lambdas.size()
+        Q = len(self.quantiles)
+        # one entry per quantile, series and horizon
+        dtype = _icdf_dtype(lambdas.device)
+        q = self.quantiles.to(lambdas.device, dtype).repeat_interleave(B * H)
+        rates = lambdas.to(dtype).reshape(1, B * H, K).expand(Q, -1, -1).reshape(-1, K)
+
+        def cdf(k, idx):
+            return torch.special.gammaincc(k.unsqueeze(-1) + 1, rates[idx]).mean(dim=-1)
+
+        def pmf(k, idx):
+            distr = Poisson(rates[idx], validate_args=False)
+            return distr.log_prob(k.unsqueeze(-1)).exp().mean(dim=-1)
+
+        # walk from the quantiles of the Normal approximation
+        std = torch.sqrt(rates).clamp(min=0.5)
+        start = normal_mixture_icdf(rates - 0.5, std, quantiles=q, eps=1e-3)
+        start = torch.ceil(start.clamp(min=0))
+        quants = discrete_mixture_icdf(cdf, pmf, quantiles=q, start=start)
+        quants = quants.view(Q, B, H).movedim(0, -1).to(lambdas.dtype)
+        return lambdas.mean(dim=-1, keepdim=True), quants
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2268,7 +2696,9 @@ class GMM(torch.nn.Module):
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
     `return_params`: bool=False, wether or not return the Distribution parameters.<br>
     `batch_correlation`: bool=False, wether or not model batch correlations.<br>
-    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br><br>
+    `horizon_correlation`: bool=False, wether or not model horizon correlations.<br>
+    `exact_quantiles`: bool=True, wether or not predict the exact quantiles of the mixture, otherwise they are sampled.<br>
+    `max_sample_bytes`: int=2**30, memory budget of the samples drawn at once by the sampled predictions, in bytes (None draws them all at once).<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2285,6 +2715,8 @@ class GMM(torch.nn.Module):
         return_params=False,
         batch_correlation=False,
         horizon_correlation=False,
+        exact_quantiles=True,
+        max_sample_bytes=2**30,
     ):
         super(GMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2297,6 +2729,8 @@ class GMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.exact_quantiles = exact_quantiles
+        self.max_sample_bytes = max_sample_bytes
         self.batch_correlation = batch_correlation
         self.horizon_correlation = horizon_correlation
 
@@ -2408,6 +2842,36 @@ class GMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(self, distr_args):
+        """
+        Mean and quantiles defined by `level` of the estimated mixture. The mean
+        is the average of the components' means, and the quantiles are solved
+        on the mixture's distribution function.
+        With `exact_quantiles=False` both are computed empirically with
+        `sample_in_chunks`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if not getattr(self, "exact_quantiles", True):
+            return sample_in_chunks(self, distr_args=distr_args)
+
+        means, stds = distr_args
+        B, H, K = means.size()
+        Q = len(self.quantiles)
+        # one entry per quantile, series and horizon
+        dtype = _icdf_dtype(means.device)
+        q = self.quantiles.to(means.device, dtype).repeat_interleave(B * H)
+        mu = means.to(dtype).reshape(1, B * H, K).expand(Q, -1, -1).reshape(-1, K)
+        sigma = stds.to(dtype).reshape(1, B * H, K).expand(Q, -1, -1).reshape(-1, K)
+        quants = normal_mixture_icdf(mu, sigma, quantiles=q)
+        quants = quants.view(Q, B, H).movedim(0, -1).to(means.dtype)
+        return means.mean(dim=-1, keepdim=True), quants
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -2473,7 +2937,9 @@ class NBMM(torch.nn.Module):
     `n_components`: int=10, the number of mixture components.<br>
     `level`: float list [0,100], confidence levels for prediction intervals.<br>
     `quantiles`: float list [0,1], alternative to level list, target quantiles.<br>
-    `return_params`: bool=False, wether or not return the Distribution parameters.<br><br>
+    `return_params`: bool=False, wether or not return the Distribution parameters.<br>
+    `exact_quantiles`: bool=True, wether or not predict the exact quantiles of the mixture, otherwise they are sampled.<br>
+    `max_sample_bytes`: int=2**30, memory budget of the samples drawn at once by the sampled predictions, in bytes (None draws them all at once).<br><br>
 
     **References:**<br>
     [Kin G. Olivares, O. Nganba Meetei, Ruijun Ma, Rohan Reddy, Mengfei Cao, Lee Dicker.
@@ -2488,6 +2954,8 @@ class NBMM(torch.nn.Module):
         quantiles=None,
         num_samples=1000,
         return_params=False,
+        exact_quantiles=True,
+        max_sample_bytes=2**30,
     ):
         super(NBMM, self).__init__()
         # Transform level to MQLoss parameters
@@ -2500,6 +2968,8 @@ class NBMM(torch.nn.Module):
             qs = torch.Tensor(quantiles)
         self.quantiles = torch.nn.Parameter(qs, requires_grad=False)
         self.num_samples = num_samples
+        self.exact_quantiles = exact_quantiles
+        self.max_sample_bytes = max_sample_bytes
 
         # If True, predict_step will return Distribution's parameters
         self.return_params = return_params
@@ -2619,6 +3089,54 @@ class NBMM(torch.nn.Module):
 
         return samples, sample_mean, quants
 
+    def predict_quantiles(self, distr_args):
+        """
+        Mean and quantiles defined by `level` of the estimated mixture. The mean
+        is the average of the components' means, and the quantiles are solved
+        on the mixture's distribution function.
+        With `exact_quantiles=False` both are computed empirically with
+        `sample_in_chunks`.
+
+        **Parameters**<br>
+        `distr_args`: Constructor arguments for the underlying Distribution type.<br>
+
+        **Returns**<br>
+        `mean`: tensor, shape [B,H,1].<br>
+        `quantiles`: tensor, quantiles defined by `levels`, shape [B,H,Q].<br>
+        """
+        if not getattr(self, "exact_quantiles", True):
+            return sample_in_chunks(self, distr_args=distr_args)
+
+        total_count, probs = distr_args
+        B, H, K = total_count.size()
+        Q = len(self.quantiles)
+        # one entry per quantile, series and horizon
+        dtype = _icdf_dtype(probs.device)
+        q = self.quantiles.to(probs.device, dtype).repeat_interleave(B * H)
+        r = total_count.to(dtype).reshape(1, B * H, K).expand(Q, -1, -1).reshape(-1, K)
+        p = probs.to(dtype).reshape(1, B * H, K).expand(Q, -1, -1).reshape(-1, K)
+
+        def cdf(k, idx):
+            # P(X <= k) = I_{1-p}(r, k + 1)
+            k = k.unsqueeze(-1).expand(-1, K)
+            return _betainc(r[idx], k + 1, 1 - p[idx]).mean(dim=-1)
+
+        def pmf(k, idx):
+            distr = NegativeBinomial(
+                total_count=r[idx], probs=p[idx], validate_args=False
+            )
+            return distr.log_prob(k.unsqueeze(-1)).exp().mean(dim=-1)
+
+        # walk from the quantiles of the Normal approximation
+        means = r * p / (1 - p)
+        std = torch.sqrt(means / (1 - p)).clamp(min=0.5)
+        start = normal_mixture_icdf(means - 0.5, std, quantiles=q, eps=1e-3)
+        start = torch.ceil(start.clamp(min=0))
+        quants = discrete_mixture_icdf(cdf, pmf, quantiles=q, start=start)
+        quants = quants.view(Q, B, H).movedim(0, -1).to(probs.dtype)
+        mean = (total_count * probs / (1 - probs)).mean(dim=-1, keepdim=True)
+        return mean, quants
+
     def neglog_likelihood(
         self,
         y: torch.Tensor,
@@ -253,8 +253,10 @@ class HINT:
         # Mysterious parsing associated to default [mean,quantiles] output
         quantiles_old = self.model.loss.quantiles
         names_old = self.model.loss.output_names
+        exact_quantiles_old = getattr(self.model.loss, "exact_quantiles", True)
         self.model.loss.quantiles = self.sample_quantiles
         self.model.loss.output_names = ["1"] * (1 + num_samples)
+        self.model.loss.exact_quantiles = False
         samples = self.model.predict(
             dataset=dataset,
             step_size=step_size,
@@ -264,6 +266,7 @@ class HINT:
         samples = samples[:, 1:]  # Eliminate mean from quantiles
         self.model.loss.quantiles = quantiles_old
         self.model.loss.output_names = names_old
+        self.model.loss.exact_quantiles = exact_quantiles_old
 
         # Hack requires to break quantiles correlations between samples
         idxs = np.random.choice(num_samples, size=samples.shape, replace=True)
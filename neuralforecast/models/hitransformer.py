@@ -6,7 +6,6 @@ __all__ = ['TriangularCausalMask', 'FullAttention', 'DataEmbedding_inverted', 'H
 # %% ../../nbs/models.hitransformer.ipynb 6
 import torch
 import torch.nn as nn
-import torch.nn.functional as F
 
 import numpy as np
 
@@ -19,6 +18,9 @@ from neuralforecast.common._modules import (
     TransEncoder,
     TransEncoderLayer,
     AttentionLayer,
+    GaussianSmoothing,
+    EWMA,
+    GroupedLinear,
 )
 
 # %% ../../nbs/models.hitransformer.ipynb 9
@@ -225,6 +227,12 @@ class HiTransformer(BaseMultivariate):
         self.dropout = dropout
         self.use_norm = use_norm
 
+        # Staged Gaussian smoothing, one sigma per quarter of the input
+        self.staging_smoothing = GaussianSmoothing(kernel_size=3, sigma=[1.0, 0.5, 0.2, 0.1])
+
+        # Gaussian filters of `gaussian_filter`, built once for each kernel size and sigma
+        self.gaussian_filters = nn.ModuleDict()
+
         # Architecture
         self.enc_embedding = DataEmbedding_inverted(
             input_size, self.hidden_size, self.dropout
@@ -237,22 +245,17 @@ class HiTransformer(BaseMultivariate):
 
         self.projector = nn.Linear(self.hidden_size, h, bias=True)
 
-        # Define a list of projectors, one for each segment
-        self.projectors = nn.ModuleList([nn.Linear(self.hidden_size, h, bias=True) for _ in range(self.projectors_num)])
+        # Define a bank of projectors, one for each segment
+        self.projectors = GroupedLinear(self.projectors_num, self.hidden_size, h, shared_input=True)
 
         # Final Linear layer
         self.final = nn.Linear(h * self.projectors_num, h, bias=True)
 
         # Define additional projectors after final
-        self.additional_projectors = nn.ModuleList(
-            [nn.Linear(h, h // self.projectors_num, bias=True) for _ in range(self.projectors_num)])
+        self.additional_projectors = GroupedLinear(self.projectors_num, h, h // self.projectors_num, shared_input=True)
 
     def ewma(self, data, alpha):
-        result = torch.zeros_like(data)
-        result[:, 0, :] = data[:, 0, :]
-        for t in range(1, data.size(1)):
-            result[:, t, :] = alpha * data[:, t, :] + (1 - alpha) * result[:, t - 1, :]
-        return result
+        return EWMA(alpha)(data)
 
     def multi_ewma(self, data, base_alpha, iterations):
         for i in range(iterations):
@@ -261,44 +264,16 @@ class HiTransformer(BaseMultivariate):
         return data
 
     def staging_gauss(self, data):
-        # Determine the size of each stage
-        sigmas = [1.0, 0.5, 0.2, 0.1]  # For 4 stages, for example
-
-        num_stages = len(sigmas)
-        length = data.size(1)
-        stage_size = length // num_stages
-
-        # Apply Gaussian filter for each stage using the specified sigma values
-        for i in range(num_stages):
-            start_idx = i * stage_size
-            # Handle the last stage by including any remaining data (in case the data doesn't divide evenly)
-            if i == num_stages - 1:
-                end_idx = length
-            else:
-                end_idx = (i + 1) * stage_size
-
-            # Apply the Gaussian filter for the current stage
-            data[:, start_idx:end_idx, :] = self.gaussian_filter(data[:, start_idx:end_idx, :], sigma=sigmas[i])
-
-        return data
+        # Each stage is smoothed with its own sigma as an independent sequence,
+        # the last stage includes any remaining data
+        return self.staging_smoothing(data)
 
     def gaussian_filter(self, data, kernel_size=3, sigma=0.2):
-        # Create a 1D Gaussian kernel
-        kernel = torch.arange(kernel_size, device=data.device) - (kernel_size - 1) / 2
-        kernel = torch.exp(-0.5 * (kernel / sigma) ** 2)
-        kernel = kernel / kernel.sum()  # Normalize kernel
-
-        # Reshape kernel for 1D convolution
-        kernel = kernel.view(1, 1, -1)
-
         # Apply the Gaussian filter along the time dimension (dim=1)
-        result = torch.zeros_like(data)
-        for i in range(data.size(0)):  # Iterate over the batch
-            for j in range(data.size(2)):  # Iterate over the feature dimension
-                # Ensure data and kernel are on the same device
-                result[i, :, j] = F.conv1d(data[i, :, j].unsqueeze(0).unsqueeze(0),
-                                           kernel, padding=kernel_size // 2).squeeze(0).squeeze(0)
-        return result
+        key = f"{kernel_size}_{sigma}".replace(".", "_")
+        if key not in self.gaussian_filters:
+            self.gaussian_filters[key] = GaussianSmoothing(kernel_size, sigma).to(data.device)
+        return self.gaussian_filters[key](data)
 
 
     def forecast(self, x_enc):
@@ -324,23 +299,15 @@ class HiTransformer(BaseMultivariate):
         # Zamenjeni enkoder
         enc_out = self.encoder(enc_out)
 
-        # Generate predictions from each segment using corresponding projectors
-        dec_outs = []
-        for i, projector in enumerate(self.projectors):
-            dec_outs.append(projector(enc_out))
-
-        # Concatenate the outputs from all projectors
-        dec_out = torch.cat(dec_outs, dim=2)
+        # Generate predictions from each segment using corresponding projectors,
+        # concatenating the outputs from all projectors
+        dec_out = self.projectors(enc_out).flatten(-2)
 
         # Pass through the final linear layer
         dec_out = self.final(dec_out)
 
         # Additional projectors after final
-        final_outs = []
-        for projector in self.additional_projectors:
-            final_outs.append(projector(dec_out).permute(0, 2, 1))
-
-        dec_out = torch.cat(final_outs, dim=1)
+        dec_out = self.additional_projectors(dec_out).flatten(-2).permute(0, 2, 1)
 
         if self.use_norm:
             dec_out = dec_out * (stdev[:, 0, :].unsqueeze(1).repeat(1, self.h, 1))
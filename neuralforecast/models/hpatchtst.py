@@ -15,6 +15,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 
 from ..common._base_windows import BaseWindows
+from ..common._modules import GaussianSmoothing, SlopeEmbedding, SmoothResidualDecomp, GroupedLinear
 
 from ..losses.pytorch import MAE
 
@@ -216,19 +217,12 @@ class DataEmbedding_inverted(nn.Module):
         self.position_encoding = PositionalEncoding(d_model, max_len)
         self.dropout = nn.Dropout(p=dropout)
         self.layer_norm = nn.LayerNorm(d_model)
-
+        self.slope_embedding = SlopeEmbedding()
 
     def calculate_slope_embedding(self, x):
         # x: [Batch, Variate, Time]
-        # For each time step, calculate slope based on previous time steps
-        batch_size, variate_size, time_size = x.size()
-        slopes = torch.zeros(batch_size, variate_size, time_size).to(x.device)
-
-        # Loop through time steps to calculate slope from position 0 to current
-        for t in range(1, time_size):  # Starting from t=1 since t=0 has no previous points
-            slopes[:, :, t] = (x[:, :, t] - x[:, :, 0]) / t  # Calculate slope from point 0 to t
-
-        return slopes
+        # For each time step, calculate slope from position 0 to current
+        return self.slope_embedding(x)
 
     def forward(self, x, x_mark=None):
         x = x.permute(0, 2, 1)
@@ -345,6 +339,12 @@ class HPatchTST_backbone(nn.Module):
         self.individual = individual
         self.enc_embedding = DataEmbedding_inverted(input_size, hidden_size)
 
+        # Decomposition into smoothed data and smoothed residuals
+        self.decomposition = SmoothResidualDecomp(kernel_size=3, smooth_sigma=2.75, residual_sigma=1.75)
+
+        # Gaussian filters of `gaussian_filter`, built once for each kernel size and sigma
+        self.gaussian_filters = nn.ModuleDict()
+
         # Two separate encoders: one for smoothed data and one for residuals
         self.encoder_smooth = nn.Linear(hidden_size, hidden_size)
         self.encoder_residual = nn.Linear(hidden_size, hidden_size)
@@ -369,33 +369,16 @@ class HPatchTST_backbone(nn.Module):
             z = z.permute(0, 2, 1)
             z = self.revin_layer(z, "norm")
 
-        print("xx1")
-        # Smoothed data (e.g., Gaussian filter)
-        smoothed_x_enc = self.gaussian_filter(z, kernel_size=3, sigma=2.75)
-
-        residual_x_enc = z - smoothed_x_enc
-
-        print("xx2")
-        # Save min and max values before smoothing residuals
-        min_vals_residual = residual_x_enc.min(dim=1, keepdim=True)[0]
-        max_vals_residual = residual_x_enc.max(dim=1, keepdim=True)[0]
+        # Smoothed data and smoothed residuals, rescaled to the original min-max range of the residuals
+        smoothed_x_enc, residual_x_enc = self.decomposition(z)
 
-        print("xx3")
-        # Apply Gaussian filter to residuals
-        residual_x_enc = self.gaussian_filter(residual_x_enc, kernel_size=3, sigma=1.75)
+        # Both streams through the shared embedding at once, as series of the same windows since the
+        # positional encoding depends on the position in the batch, then encoding with separate layers
+        enc_out = self.enc_embedding(torch.cat([smoothed_x_enc, residual_x_enc], dim=2))
+        enc_smooth_out, enc_residual_out = enc_out.chunk(2, dim=1)
+        enc_smooth_out = self.encoder_smooth(enc_smooth_out).permute(0, 2, 1)
+        enc_residual_out = self.encoder_residual(enc_residual_out).permute(0, 2, 1)
 
-        # Rescale residuals back to the original min-max range
-        residual_x_enc = (residual_x_enc - residual_x_enc.min(dim=1, keepdim=True)[0]) / \
-                         (residual_x_enc.max(dim=1, keepdim=True)[0] - residual_x_enc.min(dim=1, keepdim=True)[
-                             0] + 1e-5) * \
-                         (max_vals_residual - min_vals_residual) + min_vals_residual
-
-        print("xx4")
-        # Encoding with separate layers
-        enc_smooth_out = self.encoder_smooth(self.enc_embedding(smoothed_x_enc)).permute(0, 2, 1)
-        enc_residual_out = self.encoder_residual(self.enc_embedding(residual_x_enc)).permute(0, 2, 1)
-
-        print("xx5")
         # Summing the outputs of both encoders
         z = enc_smooth_out + enc_residual_out
         z = z
@@ -408,7 +391,6 @@ class HPatchTST_backbone(nn.Module):
         )  # z: [bs x nvars x patch_num x patch_len]
         z = z.permute(0, 1, 3, 2)  # z: [bs x nvars x patch_len x patch_num]
 
-        print("xx6")
         # model
         z = self.backbone(z)  # z: [bs x nvars x hidden_size x patch_num]
         z = self.head(z)  # z: [bs x nvars x h]
@@ -433,27 +415,10 @@ class HPatchTST_backbone(nn.Module):
         Returns:
             torch.Tensor: The smoothed tensor.
         """
-        # Create a 1D Gaussian kernel
-        kernel = torch.arange(kernel_size, dtype=torch.float32) - (kernel_size - 1) / 2.0
-        kernel = torch.exp(-0.5 * (kernel / sigma) ** 2)
-        kernel = kernel / kernel.sum()  # Normalize the kernel to ensure sum is 1
-
-        # Ensure the kernel is expanded for each feature (group)
-        kernel = kernel.view(1, 1, -1).to(input_tensor.device)
-
-        # Apply Gaussian filter for each feature across the sequence dimension
-        num_features = input_tensor.size(2)
-        smoothed_tensor = []
-        for i in range(num_features):
-            # Select the i-th feature (sequence length along the dimension 1)
-            feature_tensor = input_tensor[:, :, i].unsqueeze(1)  # [batch_size, 1, seq_len]
-            smoothed_feature = F.conv1d(feature_tensor, kernel, padding=(kernel_size - 1) // 2)
-            smoothed_tensor.append(smoothed_feature)
-
-        # Concatenate along the feature dimension (dim=2)
-        smoothed_tensor = torch.cat(smoothed_tensor, dim=1).permute(0, 2, 1)
-
-        return smoothed_tensor
+        key = f"{kernel_size}_{sigma}".replace(".", "_")
+        if key not in self.gaussian_filters:
+            self.gaussian_filters[key] = GaussianSmoothing(kernel_size, sigma).to(input_tensor.device)
+        return self.gaussian_filters[key](input_tensor)
 
     def create_pretrain_head(self, head_nf, vars, dropout):
         return nn.Sequential(nn.Dropout(dropout), nn.Conv1d(head_nf, vars, 1))
@@ -471,32 +436,21 @@ class Flatten_Head(nn.Module):
         self.n_vars = n_vars
         self.c_out = c_out
 
+        self.flatten = nn.Flatten(start_dim=-2)
         if self.individual:
-            self.linears = nn.ModuleList()
-            self.dropouts = nn.ModuleList()
-            self.flattens = nn.ModuleList()
-            for i in range(self.n_vars):
-                self.flattens.append(nn.Flatten(start_dim=-2))
-                self.linears.append(nn.Linear(nf, h * c_out))
-                self.dropouts.append(nn.Dropout(head_dropout))
+            # one linear layer per variable, with stacked weights
+            self.linears = GroupedLinear(self.n_vars, nf, h * c_out)
         else:
-            self.flatten = nn.Flatten(start_dim=-2)
             self.linear = nn.Linear(nf, h * c_out)
-            self.dropout = nn.Dropout(head_dropout)
+        self.dropout = nn.Dropout(head_dropout)
 
     def forward(self, x):  # x: [bs x nvars x hidden_size x patch_num]
+        x = self.flatten(x)  # x: [bs x nvars x hidden_size * patch_num]
         if self.individual:
-            x_out = []
-            for i in range(self.n_vars):
-                z = self.flattens[i](x[:, i, :, :])  # z: [bs x hidden_size * patch_num]
-                z = self.linears[i](z)  # z: [bs x h]
-                z = self.dropouts[i](z)
-                x_out.append(z)
-            x = torch.stack(x_out, dim=1)  # x: [bs x nvars x h]
+            x = self.linears(x)  # x: [bs x nvars x h]
         else:
-            x = self.flatten(x)
             x = self.linear(x)
-            x = self.dropout(x)
+        x = self.dropout(x)
         return x
 
 
@@ -1019,6 +973,7 @@ class HPatchTST(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `bucket_by_length`: bool=False, if True training batches group series of similar length and are only padded to their longest serie.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `optimizer`: Subclass of 'torch.optim.Optimizer', optional, user specified optimizer instead of the default choice (Adam).<br>
     `optimizer_kwargs`: dict, optional, list of parameters used by the user specified `optimizer`.<br>
@@ -1078,6 +1033,7 @@ class HPatchTST(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        bucket_by_length: bool = False,
         optimizer=None,
         optimizer_kwargs=None,
         lr_scheduler=None,
@@ -1107,6 +1063,7 @@ class HPatchTST(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            bucket_by_length=bucket_by_length,
             random_seed=random_seed,
             optimizer=optimizer,
             optimizer_kwargs=optimizer_kwargs,
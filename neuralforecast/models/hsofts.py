@@ -10,7 +10,14 @@ import torch.nn.functional as F
 
 from ..losses.pytorch import MAE
 from ..common._base_multivariate import BaseMultivariate
-from ..common._modules import TransEncoder, TransEncoderLayer
+from ..common._modules import (
+    TransEncoder,
+    TransEncoderLayer,
+    GaussianSmoothing,
+    SlopeEmbedding,
+    SmoothResidualDecomp,
+    GroupedLinear,
+)
 
 from neuralforecast.models.kan import KAN
 
@@ -51,19 +58,12 @@ class DataEmbedding_inverted(nn.Module):
         self.position_encoding = PositionalEncoding(d_model, max_len)
         self.dropout = nn.Dropout(p=dropout)
         self.layer_norm = nn.LayerNorm(d_model)
-
+        self.slope_embedding = SlopeEmbedding()
 
     def calculate_slope_embedding(self, x):
         # x: [Batch, Variate, Time]
-        # For each time step, calculate slope based on previous time steps
-        batch_size, variate_size, time_size = x.size()
-        slopes = torch.zeros(batch_size, variate_size, time_size).to(x.device)
-
-        # Loop through time steps to calculate slope from position 0 to current
-        for t in range(1, time_size):  # Starting from t=1 since t=0 has no previous points
-            slopes[:, :, t] = (x[:, :, t] - x[:, :, 0]) / t  # Calculate slope from point 0 to t
-
-        return slopes
+        # For each time step, calculate slope from position 0 to current
+        return self.slope_embedding(x)
 
     def forward(self, x, x_mark=None):
         x = x.permute(0, 2, 1)
@@ -272,20 +272,27 @@ class HSOFTS(BaseMultivariate):
         # Architecture: Data Embedding
         self.enc_embedding = DataEmbedding_inverted(input_size, hidden_size)
 
+        # Decomposition into smoothed data and smoothed residuals
+        self.decomposition = SmoothResidualDecomp(kernel_size=3, smooth_sigma=2.75, residual_sigma=1.75)
+
+        # Gaussian smoothing of the frequency normalization, with one kernel per sample
+        self.frequency_smoothing = GaussianSmoothing(kernel_size=9)
+
+        # Gaussian filters of `gaussian_filter`, built once for each kernel size and sigma
+        self.gaussian_filters = nn.ModuleDict()
+
         # Two separate encoders: one for smoothed data and one for residuals
         self.encoder_smooth = nn.Linear(hidden_size, hidden_size)
         self.encoder_residual = nn.Linear(hidden_size, hidden_size)
 
         # Projectors for each segment
-        self.projectors = nn.ModuleList([nn.Linear(hidden_size, h, bias=True) for _ in range(self.projectors_num)])
+        self.projectors = GroupedLinear(self.projectors_num, hidden_size, h, shared_input=True)
 
         # Final Linear layer
         self.final = nn.Linear(h * self.projectors_num, h, bias=True)
 
         # Additional projectors after final
-        self.additional_projectors = nn.ModuleList(
-            [nn.Linear(h, h // self.projectors_num, bias=True) for _ in range(self.projectors_num)]
-        )
+        self.additional_projectors = GroupedLinear(self.projectors_num, h, h // self.projectors_num, shared_input=True)
 
     def forecast(self, x_enc):
         # Normalization
@@ -294,56 +301,27 @@ class HSOFTS(BaseMultivariate):
             stdev = torch.sqrt(torch.var(x_enc, dim=1, keepdim=True, unbiased=False) + 1e-5).detach()
             x_enc = (x_enc - means) / stdev
 
-        # Smoothed data (e.g., Gaussian filter)
-        smoothed_x_enc = self.gaussian_filter(x_enc, kernel_size=3, sigma=2.75)
-        '''
-        # Initialize smoothed output tensor
-        smoothed_x_enc = torch.zeros_like(x_enc)
-
-        # Apply Gaussian filter to each quarter
-        for i in range(4):
-            start = i * quarter_len
-            end = (i + 1) * quarter_len if i < 3 else seq_len  # The last quarter takes any remaining data
-            smoothed_x_enc[:, start:end, :] = self.gaussian_filter(x_enc[:, start:end, :], kernel_size=3,
-                                                                   sigma=sigmas[i])
-        '''
-        residual_x_enc = x_enc - smoothed_x_enc
-
-        # Save min and max values before smoothing residuals
-        min_vals_residual = residual_x_enc.min(dim=1, keepdim=True)[0]
-        max_vals_residual = residual_x_enc.max(dim=1, keepdim=True)[0]
-
-        # Apply Gaussian filter to residuals
-        residual_x_enc = self.gaussian_filter(residual_x_enc, kernel_size=3, sigma=1.75)
-
-        # Rescale residuals back to the original min-max range
-        residual_x_enc = (residual_x_enc - residual_x_enc.min(dim=1, keepdim=True)[0]) / \
-                         (residual_x_enc.max(dim=1, keepdim=True)[0] - residual_x_enc.min(dim=1, keepdim=True)[
-                             0] + 1e-5) * \
-                         (max_vals_residual - min_vals_residual) + min_vals_residual
-
-        # Encoding with separate layers
-        enc_smooth_out = self.encoder_smooth(self.enc_embedding(smoothed_x_enc))
-        enc_residual_out = self.encoder_residual(self.enc_embedding(residual_x_enc))
+        # Smoothed data and smoothed residuals, rescaled to the original min-max range of the residuals
+        smoothed_x_enc, residual_x_enc = self.decomposition(x_enc)
+
+        # Both streams through the shared embedding at once, as series of the same windows since the
+        # positional encoding depends on the position in the batch, then encoding with separate layers
+        enc_out = self.enc_embedding(torch.cat([smoothed_x_enc, residual_x_enc], dim=2))
+        enc_smooth_out, enc_residual_out = enc_out.chunk(2, dim=1)
+        enc_smooth_out = self.encoder_smooth(enc_smooth_out)
+        enc_residual_out = self.encoder_residual(enc_residual_out)
 
         # Summing the outputs of both encoders
         enc_out = enc_smooth_out + enc_residual_out
 
-        # Generating predictions from each segment using the projectors
-        dec_outs = []
-        for i, projector in enumerate(self.projectors):
-            dec_outs.append(projector(enc_out))
+        # Generating predictions from each segment using the projectors, concatenated
+        dec_out = self.projectors(enc_out).flatten(-2)
 
-        # Concatenate outputs and pass through the final layer
-        dec_out = torch.cat(dec_outs, dim=2)
+        # Pass through the final layer
         dec_out = self.final(dec_out)
 
         # Additional projectors after the final
-        final_outs = []
-        for projector in self.additional_projectors:
-            final_outs.append(projector(dec_out).permute(0, 2, 1))
-
-        dec_out = torch.cat(final_outs, dim=1)
+        dec_out = self.additional_projectors(dec_out).flatten(-2).permute(0, 2, 1)
 
         # Reapply normalization
         if self.use_norm:
@@ -372,27 +350,10 @@ class HSOFTS(BaseMultivariate):
         Returns:
             torch.Tensor: The smoothed tensor.
         """
-        # Create a 1D Gaussian kernel
-        kernel = torch.arange(kernel_size, dtype=torch.float32) - (kernel_size - 1) / 2.0
-        kernel = torch.exp(-0.5 * (kernel / sigma) ** 2)
-        kernel = kernel / kernel.sum()  # Normalize the kernel to ensure sum is 1
-
-        # Ensure the kernel is expanded for each feature (group)
-        kernel = kernel.view(1, 1, -1).to(input_tensor.device)
-
-        # Apply Gaussian filter for each feature across the sequence dimension
-        num_features = input_tensor.size(2)
-        smoothed_tensor = []
-        for i in range(num_features):
-            # Select the i-th feature (sequence length along the dimension 1)
-            feature_tensor = input_tensor[:, :, i].unsqueeze(1)  # [batch_size, 1, seq_len]
-            smoothed_feature = F.conv1d(feature_tensor, kernel, padding=(kernel_size - 1) // 2)
-            smoothed_tensor.append(smoothed_feature)
-
-        # Concatenate along the feature dimension (dim=2)
-        smoothed_tensor = torch.cat(smoothed_tensor, dim=1).permute(0, 2, 1)
-
-        return smoothed_tensor
+        key = f"{kernel_size}_{sigma}".replace(".", "_")
+        if key not in self.gaussian_filters:
+            self.gaussian_filters[key] = GaussianSmoothing(kernel_size, sigma).to(input_tensor.device)
+        return self.gaussian_filters[key](input_tensor)
 
     def estimate_frequency(self, data):
         # Estimate frequency using FFT (Fast Fourier Transform)
@@ -410,12 +371,10 @@ class HSOFTS(BaseMultivariate):
         # Calculate scaling factors based on how far each sequence is from the target frequency
         scaling_factors = frequencies / target_frequency
 
-        # Apply Gaussian filter with inverse scaling factor (stronger smoothing for higher frequency sequences)
-        length = data.size(1)
-        for i in range(data.size(0)):
-            sigma = 1.0 / scaling_factors[i].item() if scaling_factors[i].numel() == 1 else 1.0 / scaling_factors[i][
-                0].item()  # Handle the case of multi-element tensors
-            data[i, :, :] = self.gaussian_filter(data[i:i + 1, :, :], kernel_size=9, sigma=sigma)
+        # Apply Gaussian filter with inverse scaling factor (stronger smoothing for higher frequency sequences),
+        # using the scaling factor of the first feature of each sequence
+        sigma = 1.0 / scaling_factors.reshape(data.size(0), -1)[:, 0]
+        data = self.frequency_smoothing(data, sigma=sigma)
 
         return data
 
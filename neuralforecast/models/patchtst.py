@@ -15,6 +15,7 @@ import torch.nn as nn
 import torch.nn.functional as F
 
 from ..common._base_windows import BaseWindows
+from ..common._modules import GroupedLinear
 
 from ..losses.pytorch import MAE
 
@@ -353,32 +354,21 @@ class Flatten_Head(nn.Module):
         self.n_vars = n_vars
         self.c_out = c_out
 
+        self.flatten = nn.Flatten(start_dim=-2)
         if self.individual:
-            self.linears = nn.ModuleList()
-            self.dropouts = nn.ModuleList()
-            self.flattens = nn.ModuleList()
-            for i in range(self.n_vars):
-                self.flattens.append(nn.Flatten(start_dim=-2))
-                self.linears.append(nn.Linear(nf, h * c_out))
-                self.dropouts.append(nn.Dropout(head_dropout))
+            # one linear layer per variable, with stacked weights
+            self.linears = GroupedLinear(self.n_vars, nf, h * c_out)
         else:
-            self.flatten = nn.Flatten(start_dim=-2)
             self.linear = nn.Linear(nf, h * c_out)
-            self.dropout = nn.Dropout(head_dropout)
+        self.dropout = nn.Dropout(head_dropout)
 
     def forward(self, x):  # x: [bs x nvars x hidden_size x patch_num]
+        x = self.flatten(x)  # x: [bs x nvars x hidden_size * patch_num]
         if self.individual:
-            x_out = []
-            for i in range(self.n_vars):
-                z = self.flattens[i](x[:, i, :, :])  # z: [bs x hidden_size * patch_num]
-                z = self.linears[i](z)  # z: [bs x h]
-                z = self.dropouts[i](z)
-                x_out.append(z)
-            x = torch.stack(x_out, dim=1)  # x: [bs x nvars x h]
+            x = self.linears(x)  # x: [bs x nvars x h]
         else:
-            x = self.flatten(x)
             x = self.linear(x)
-            x = self.dropout(x)
+        x = self.dropout(x)
         return x
 
 
@@ -901,6 +891,7 @@ class PatchTST(BaseWindows):
     `random_seed`: int, random_seed for pytorch initializer and numpy generators.<br>
     `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
+    `bucket_by_length`: bool=False, if True training batches group series of similar length and are only padded to their longest serie.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `optimizer`: Subclass of 'torch.optim.Optimizer', optional, user specified optimizer instead of the default choice (Adam).<br>
     `optimizer_kwargs`: dict, optional, list of parameters used by the user specified `optimizer`.<br>
@@ -960,6 +951,7 @@ class PatchTST(BaseWindows):
         random_seed: int = 1,
         num_workers_loader: int = 0,
         drop_last_loader: bool = False,
+        bucket_by_length: bool = False,
         optimizer=None,
         optimizer_kwargs=None,
         lr_scheduler=None,
@@ -989,6 +981,7 @@ class PatchTST(BaseWindows):
             scaler_type=scaler_type,
             num_workers_loader=num_workers_loader,
             drop_last_loader=drop_last_loader,
+            bucket_by_length=bucket_by_length,
             random_seed=random_seed,
             optimizer=optimizer,
             optimizer_kwargs=optimizer_kwargs,
@@ -5,11 +5,19 @@ __all__ = ['TimeSeriesLoader', 'BaseTimeSeriesDataset', 'TimeSeriesDataset', 'Lo
            'TimeSeriesDataModule']
 
 # %% ../nbs/tsdataset.ipynb 4
+import datetime
+import json
+import os
+import queue
+import threading
 import warnings
+from collections import OrderedDict
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Sequence, Union
 
+import fsspec
 import numpy as np
 import pandas as pd
 import pytorch_lightning as pl
@@ -35,15 +43,46 @@ class TimeSeriesLoader(DataLoader):
     `shuffle`: (bool, optional): set to `True` to have the data reshuffled at every epoch (default: `False`).<br>
     `sampler`: (Sampler or Iterable, optional): defines the strategy to draw samples from the dataset.<br>
                 Can be any `Iterable` with `__len__` implemented. If specified, `shuffle` must not be specified.<br>
+    `prefetch_batches`: (int, optional): batches loaded ahead by a background thread when `num_workers=0` (default: 0).<br>
     """
 
-    def __init__(self, dataset, **kwargs):
+    def __init__(self, dataset, prefetch_batches=0, **kwargs):
         if "collate_fn" in kwargs:
             kwargs.pop("collate_fn")
         kwargs_ = {**kwargs, **dict(collate_fn=self._collate_fn)}
+        self.prefetch_batches = prefetch_batches
         DataLoader.__init__(self, dataset=dataset, **kwargs_)
 
+    def __iter__(self):
+        if (
+            self.prefetch_batches == 0
+            or self.num_workers > 0
+            or self.batch_sampler is None
+        ):
+            return super().__iter__()
+        # The batches are drawn from the sampler as they are consumed, in the
+        # calling thread, so the random draws of the sampler don't race with the
+        # ones of the model and only the reads run in the background thread
+        requests = queue.Queue()
+        iterator = iter(
+            DataLoader(
+                self.dataset,
+                batch_sampler=iter(requests.get, None),
+                collate_fn=self.collate_fn,
+                pin_memory=self.pin_memory,
+            )
+        )
+        # drawn after creating the iterator, in the same order of random draws
+        # as the iterator of this loader
+        return _PrefetchIterator(
+            iterator, self.batch_sampler, requests, self.prefetch_batches
+        )
+
     def _collate_fn(self, batch):
+        if isinstance(batch, Mapping):
+            # already collated by the dataset's __getitems__
+            return batch
+
         elem = batch[0]
         elem_type = type(elem)
 
@@ -63,6 +102,7 @@ class TimeSeriesLoader(DataLoader):
                     temporal=self.collate_fn([d["temporal"] for d in batch]),
                     temporal_cols=elem["temporal_cols"],
                     y_idx=elem["y_idx"],
+                    idx=np.array([d["idx"] for d in batch]),
                 )
 
             return dict(
@@ -71,10 +111,69 @@ class TimeSeriesLoader(DataLoader):
                 temporal=self.collate_fn([d["temporal"] for d in batch]),
                 temporal_cols=elem["temporal_cols"],
                 y_idx=elem["y_idx"],
+                idx=np.array([d["idx"] for d in batch]),
             )
 
         raise TypeError(f"Unknown {elem_type}")
 
+
+class _PrefetchIterator:
+    # Iterates `iterator` in a background thread keeping up to `n_batches` read
+    # ahead. `iterator` reads the batches put in `requests`, which are drawn from
+    # `batch_sampler` by the calling thread when a batch is consumed.
+
+    def __init__(self, iterator, batch_sampler, requests, n_batches):
+        self._batches = iter(batch_sampler)
+        self._requests = requests
+        self._queue = queue.Queue()
+        self._done = False
+        self._thread = threading.Thread(
+            target=self._produce, args=(iterator,), daemon=True
+        )
+        self._thread.start()
+        for _ in range(n_batches):
+            self._request()
+
+    def _request(self):
+        if self._done:
+            return
+        try:
+            self._requests.put(next(self._batches))
+        except StopIteration:
+            self._stop()
+
+    def _stop(self):
+        # ends the iterator of the background thread after the requested batches
+        if not self._done:
+            self._done = True
+            self._requests.put(None)
+
+    def _produce(self, iterator):
+        try:
+            for batch in iterator:
+                self._queue.put((True, batch))
+        except Exception as e:
+            self._queue.put((False, e))
+            return
+        self._queue.put((False, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        is_batch, value = self._queue.get()
+        if is_batch:
+            self._request()
+            return value
+        self._stop()
+        if value is not None:
+            raise value
+        raise StopIteration
+
+    def __del__(self):
+        # the consumer can stop early (e.g. at max_steps)
+        self._stop()
+
 # %% ../nbs/tsdataset.ipynb 7
 class BaseTimeSeriesDataset(Dataset):
 
@@ -116,7 +215,10 @@ class BaseTimeSeriesDataset(Dataset):
     ) -> torch.Tensor:
         if isinstance(x, np.ndarray):
             x = torch.from_numpy(x)
-        return x.to(dtype, copy=False).clone()
+        if x.dtype != dtype:
+            # the conversion already returns a copy
+            return x.to(dtype)
+        return x.clone()
 
     @staticmethod
     def _ensure_available_mask(data: np.ndarray, temporal_cols):
@@ -159,6 +261,8 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         static=None,
         static_cols=None,
         sorted=False,
+        padded_buckets: int = 0,
+        copy: bool = True,
     ):
         super().__init__(
             temporal_cols=temporal_cols,
@@ -169,9 +273,12 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             static_cols=static_cols,
             sorted=sorted,
         )
-        self.temporal = self._as_torch_copy(temporal)
+        # temporal is used as is if not copied, append and trim build a new one
+        self.temporal = self._as_torch_copy(temporal) if copy else temporal
         self.indptr = indptr
         self.n_groups = self.indptr.size - 1
+        self.padded_buckets = padded_buckets
+        self._build_padded_store()
 
     def __getitem__(self, idx):
         if isinstance(idx, int):
@@ -191,11 +298,172 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
                 static=static,
                 static_cols=self.static_cols,
                 y_idx=self.y_idx,
+                idx=idx,
             )
 
             return item
         raise ValueError(f"idx must be int, got {type(idx)}")
 
+    def __getitems__(self, idxs):
+        # Batched __getitem__ used by the DataLoader, returns the collated batch
+        # with a single allocation for the temporal data instead of one per serie.
+        pad_size = getattr(idxs, "pad_size", self.max_size)
+        idxs = np.asarray(idxs, dtype=np.int64)
+        batch = dict(
+            temporal=self._padded_temporal(idxs, pad_size),
+            temporal_cols=self.temporal_cols,
+            y_idx=self.y_idx,
+            idx=idxs,
+        )
+        if self.static is not None:
+            batch["static"] = self.static[idxs]
+            batch["static_cols"] = self.static_cols
+        return batch
+
+    def _build_padded_store(self):
+        # Channel-major, left padded copies of the series [n, C, bucket_size].
+        # Series are sorted by size and split in `padded_buckets` buckets, each one
+        # padded to the size of its longest serie. 0 disables the store.
+        self._padded_store = None
+        if not self.padded_buckets:
+            return
+        sizes = np.diff(self.indptr)
+        buckets = np.array_split(np.argsort(sizes, kind="stable"), self.padded_buckets)
+        buckets = [bucket for bucket in buckets if bucket.size]
+        self._bucket_idx = np.empty(self.n_groups, dtype=np.int64)
+        self._bucket_pos = np.empty(self.n_groups, dtype=np.int64)
+        for i, bucket in enumerate(buckets):
+            self._bucket_idx[bucket] = i
+            self._bucket_pos[bucket] = np.arange(bucket.size)
+        self._padded_store = [
+            self._scatter_temporal(bucket, sizes[bucket].max()) for bucket in buckets
+        ]
+
+    def _scatter_temporal(self, idxs, size):
+        # Left padded [B, C, size] temporal of the series in idxs, built with a
+        # single allocation. Longer series keep their last values.
+        ends = self.indptr[idxs + 1].astype(np.int64)
+        sizes = np.minimum(ends - self.indptr[idxs], size)
+        if sizes.sum() >= 256 * len(idxs):
+            # Long series: one block copy per serie is cheaper than a scatter
+            temporal = torch.zeros(
+                size=(len(idxs), len(self.temporal_cols), size), dtype=torch.float32
+            )
+            for i, (end, serie_size) in enumerate(zip(ends, sizes)):
+                temporal[i, :, size - serie_size :] = self.temporal[
+                    end - serie_size : end
+                ].permute(1, 0)
+            return temporal
+
+        # Short series: scatter all rows into a time-major buffer and transpose it
+        offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        rows = np.repeat(ends - sizes, sizes) + offsets
+        positions = np.repeat(np.arange(len(idxs)) * size + size - sizes, sizes)
+        positions += offsets
+        temporal = torch.zeros(
+            size=(len(idxs) * size, len(self.temporal_cols)), dtype=torch.float32
+        )
+        temporal.index_copy_(
+            0, torch.from_numpy(positions), self.temporal[torch.from_numpy(rows)]
+        )
+        return temporal.view(len(idxs), size, -1).permute(0, 2, 1).contiguous()
+
+    def _padded_temporal(self, idxs, size):
+        store = getattr(self, "_padded_store", None)
+        if store is None:
+            return self._scatter_temporal(idxs, size)
+
+        bucket_idxs = self._bucket_idx[idxs]
+        bucket_pos = torch.from_numpy(self._bucket_pos[idxs])
+        if len(store) == 1 and store[0].shape[-1] == size:
+            return store[0][bucket_pos]
+        temporal = torch.zeros(
+            size=(len(idxs), len(self.temporal_cols), size), dtype=torch.float32
+        )
+        for i in np.unique(bucket_idxs):
+            in_bucket = bucket_idxs == i
+            width = min(store[i].shape[-1], size)
+            temporal[torch.from_numpy(in_bucket), :, size - width :] = store[i][
+                bucket_pos[in_bucket], :, -width:
+            ]
+        return temporal
+
+    def valid_windows(
+        self,
+        input_size: int,
+        h: int,
+        val_size: int = 0,
+        test_size: int = 0,
+        step_size: int = 1,
+        start_padding_enabled: bool = False,
+    ):
+        """Index of the training windows with available data.
+
+        Windows are enumerated as in `BaseWindows`: each serie is left padded to
+        `max_size`, its last `val_size + test_size` values are removed and it is padded
+        with `h` zeros on the right (and `input_size - 1` on the left if
+        `start_padding_enabled`). A window is valid if it has at least one available
+        value in its input and, if `h > 0`, in its output.
+
+        The index is cached by the arguments, so it is computed once per dataset.
+
+        **Returns:**<br>
+        `indptr`: np.ndarray, the windows of serie `i` are `windows[indptr[i] : indptr[i + 1]]`.<br>
+        `windows`: np.ndarray, position of each valid window in units of `step_size`.
+        """
+        key = (input_size, h, val_size, test_size, step_size, start_padding_enabled)
+        cache = self.__dict__.setdefault("_valid_windows_cache", {})
+        if key not in cache:
+            cache[key] = self._compute_valid_windows(*key)
+        return cache[key]
+
+    def _compute_valid_windows(
+        self, input_size, h, val_size, test_size, step_size, start_padding_enabled
+    ):
+        window_size = input_size + h
+        left_padding = input_size - 1 if start_padding_enabled else 0
+        cutoff = val_size + test_size
+        sizes = np.diff(self.indptr).astype(np.int64)
+        train_sizes = np.maximum(sizes - cutoff, 0)
+        frame_size = left_padding + self.max_size - cutoff + h
+        windows_per_serie = max((frame_size - window_size) // step_size + 1, 0)
+
+        # Only windows overlapping [serie_start, serie_start + train_size) of the
+        # padded frame can have available data
+        serie_starts = left_padding + self.max_size - sizes
+        first = np.maximum(-((window_size - 1 - serie_starts) // step_size), 0)
+        last = np.minimum(
+            (serie_starts + train_sizes - 1) // step_size, windows_per_serie - 1
+        )
+        counts = np.where(train_sizes > 0, np.maximum(last - first + 1, 0), 0)
+        series = np.repeat(np.arange(self.n_groups), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        windows = np.repeat(first, counts) + offsets
+
+        # Number of available values before each position of the frame
+        available_idx = self.temporal_cols.get_loc("available_mask")
+        available_mask = self.temporal[:, available_idx].numpy() > 0
+        cumsum = np.append(0, np.cumsum(available_mask, dtype=np.int64))
+        series_offsets = self.indptr[:-1].astype(np.int64)[series]
+        series_starts = serie_starts[series]
+        series_sizes = train_sizes[series]
+
+        def n_available(positions):
+            positions = np.clip(positions - series_starts, 0, series_sizes)
+            return cumsum[series_offsets + positions]
+
+        starts = windows * step_size
+        insample_end = starts + input_size
+        valid = n_available(insample_end) > n_available(starts)
+        if h > 0:
+            valid &= n_available(starts + window_size) > n_available(insample_end)
+
+        n_valid = np.bincount(series[valid], minlength=self.n_groups)
+        indptr = np.append(0, np.cumsum(n_valid))
+        return indptr, windows[valid].astype(np.int32)
+
     def __repr__(self):
         return f"TimeSeriesDataset(n_data={self.temporal.shape[0]:,}, n_groups={self.n_groups:,})"
 
@@ -206,6 +474,50 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             self.indptr, other.indptr
         )
 
+    def __getstate__(self):
+        # the append buffer is a cache of the last append, don't serialize it
+        state = self.__dict__.copy()
+        state.pop("_append_buffer", None)
+        # memory-mapped temporal that wasn't modified is reopened from its file,
+        # so worker processes share its pages instead of receiving a copy
+        mmap_file = self._mmap_path()
+        state.pop("_mmap_file", None)
+        state.pop("_mmap_modified", None)
+        if mmap_file is not None:
+            state["_mmap_file"] = mmap_file
+            del state["temporal"]
+            # the padded store is a copy of temporal, rebuilt when unpickling
+            state.pop("_padded_store", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "temporal" not in state:
+            self.temporal = self._open_temporal(self._mmap_file)
+            self._build_padded_store()
+
+    def _mmap_path(self):
+        """File the temporal is memory-mapped from.
+
+        None if the temporal isn't memory-mapped or was marked as modified since it
+        was loaded.
+        """
+        path = self.__dict__.get("_mmap_file")
+        if path is None or self.__dict__.get("_mmap_modified", False):
+            return None
+        if not os.path.exists(path):
+            return None
+        return path
+
+    def _mark_modified(self):
+        """Mark the temporal as written in place.
+
+        The writes to a memory-mapped temporal don't reach its file, so whoever
+        modifies `temporal` in place must call it to stop pickling the dataset by
+        its stale file.
+        """
+        self._mmap_modified = True
+
     def align(
         self, df: DataFrame, id_col: str, time_col: str, target_col: str
     ) -> "TimeSeriesDataset":
@@ -233,8 +545,16 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         )
         return dataset
 
-    def append(self, futr_dataset: "TimeSeriesDataset") -> "TimeSeriesDataset":
-        """Add future observations to the dataset. Returns a copy"""
+    def append(
+        self, futr_dataset: "TimeSeriesDataset", reuse_buffer: bool = False
+    ) -> "TimeSeriesDataset":
+        """Add future observations to the dataset. Returns a copy
+
+        If `reuse_buffer` is True the temporal of the returned dataset is kept in
+        this dataset and the next append with the same sizes writes into it instead
+        of allocating a new one. The dataset returned by the previous append shares
+        that temporal, so it is overwritten and must not be used anymore.
+        """
         if self.indptr.size != futr_dataset.indptr.size:
             raise ValueError(
                 "Cannot append `futr_dataset` with different number of groups."
@@ -242,21 +562,44 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         # Define and fill new temporal with updated information
         len_temporal, col_temporal = self.temporal.shape
         len_futr = futr_dataset.temporal.shape[0]
-        new_temporal = torch.empty(size=(len_temporal + len_futr, col_temporal))
         new_indptr = self.indptr + futr_dataset.indptr
         new_sizes = np.diff(new_indptr)
         new_min_size = np.min(new_sizes)
         new_max_size = np.max(new_sizes)
 
-        for i in range(self.n_groups):
-            curr_slice = slice(self.indptr[i], self.indptr[i + 1])
-            curr_size = curr_slice.stop - curr_slice.start
-            futr_slice = slice(futr_dataset.indptr[i], futr_dataset.indptr[i + 1])
-            new_temporal[new_indptr[i] : new_indptr[i] + curr_size] = self.temporal[
-                curr_slice
-            ]
-            new_temporal[new_indptr[i] + curr_size : new_indptr[i + 1]] = (
-                futr_dataset.temporal[futr_slice]
+        # Rows of the current and future observations in the new temporal
+        curr_indptr = self.indptr.astype(np.int64)
+        futr_indptr = futr_dataset.indptr.astype(np.int64)
+        curr_rows = np.arange(len_temporal) + np.repeat(
+            futr_indptr[:-1], np.diff(curr_indptr)
+        )
+        futr_rows = np.arange(len_futr) + np.repeat(
+            curr_indptr[1:], np.diff(futr_indptr)
+        )
+
+        buffer = self.__dict__.get("_append_buffer") if reuse_buffer else None
+        if (
+            buffer is not None
+            and buffer["temporal"].shape == (len_temporal + len_futr, col_temporal)
+            and np.array_equal(buffer["indptr"], curr_indptr)
+            and np.array_equal(buffer["futr_indptr"], futr_indptr)
+        ):
+            new_temporal = buffer["temporal"]
+        else:
+            new_temporal = torch.empty(size=(len_temporal + len_futr, col_temporal))
+        new_temporal.index_copy_(
+            0, torch.from_numpy(curr_rows), self.temporal.to(new_temporal.dtype)
+        )
+        new_temporal.index_copy_(
+            0,
+            torch.from_numpy(futr_rows),
+            futr_dataset.temporal.to(new_temporal.dtype),
+        )
+        if reuse_buffer:
+            self._append_buffer = dict(
+                indptr=curr_indptr,
+                futr_indptr=futr_indptr,
+                temporal=new_temporal,
             )
 
         # Define new dataset
@@ -270,6 +613,7 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             y_idx=self.y_idx,
             static_cols=self.static_cols,
             sorted=self.sorted,
+            copy=False,
         )
 
     @staticmethod
@@ -293,21 +637,14 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
                                 must be lower than the shorter time series ({dataset.min_size})"
             )
 
-        # Define and fill new temporal with trimmed information
-        len_temporal, col_temporal = dataset.temporal.shape
-        total_trim = (left_trim + right_trim) * dataset.n_groups
-        new_temporal = torch.zeros(size=(len_temporal - total_trim, col_temporal))
-        new_indptr = [0]
-
-        acum = 0
-        for i in range(dataset.n_groups):
-            series_length = dataset.indptr[i + 1] - dataset.indptr[i]
-            new_length = series_length - left_trim - right_trim
-            new_temporal[acum : (acum + new_length), :] = dataset.temporal[
-                dataset.indptr[i] + left_trim : dataset.indptr[i + 1] - right_trim, :
-            ]
-            acum += new_length
-            new_indptr.append(acum)
+        # Gather the kept rows of every serie with a single index
+        indptr = dataset.indptr.astype(np.int64)
+        new_sizes = np.diff(indptr) - left_trim - right_trim
+        new_indptr = np.append(0, np.cumsum(new_sizes))
+        rows = np.arange(new_indptr[-1]) + np.repeat(
+            indptr[:-1] + left_trim - new_indptr[:-1], new_sizes
+        )
+        new_temporal = dataset.temporal[torch.from_numpy(rows)]
 
         new_max_size = dataset.max_size - left_trim - right_trim
         new_min_size = dataset.min_size - left_trim - right_trim
@@ -316,17 +653,48 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         updated_dataset = TimeSeriesDataset(
             temporal=new_temporal,
             temporal_cols=dataset.temporal_cols.copy(),
-            indptr=np.array(new_indptr, dtype=np.int32),
+            indptr=new_indptr.astype(np.int32),
             max_size=new_max_size,
             min_size=new_min_size,
             y_idx=dataset.y_idx,
             static=dataset.static,
             static_cols=dataset.static_cols,
             sorted=dataset.sorted,
+            copy=False,
         )
 
         return updated_dataset
 
+    @staticmethod
+    def subset_dataset(dataset, idxs):
+        """
+        Select series from a dataset.
+        Returns a dataset with the series `idxs`, in that order.
+        """
+        idxs = np.asarray(idxs)
+        indptr = dataset.indptr.astype(np.int64)
+        sizes = np.diff(indptr)[idxs]
+        new_indptr = np.append(0, np.cumsum(sizes))
+        rows = np.arange(new_indptr[-1]) + np.repeat(
+            indptr[idxs] - new_indptr[:-1], sizes
+        )
+        static = dataset.static
+        if static is not None:
+            static = static[torch.from_numpy(idxs)]
+        return TimeSeriesDataset(
+            temporal=dataset.temporal[torch.from_numpy(rows)],
+            temporal_cols=dataset.temporal_cols.copy(),
+            indptr=new_indptr.astype(np.int32),
+            max_size=int(sizes.max()),
+            min_size=int(sizes.min()),
+            y_idx=dataset.y_idx,
+            static=static,
+            static_cols=dataset.static_cols,
+            sorted=dataset.sorted,
+            padded_buckets=dataset.padded_buckets,
+            copy=False,
+        )
+
     @staticmethod
     def from_df(
         df,
@@ -335,6 +703,7 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
         id_col="unique_id",
         time_col="ds",
         target_col="y",
+        padded_buckets=0,
     ):
         # TODO: protect on equality of static_df + df indexes
         if isinstance(df, pd.DataFrame) and df.index.name == id_col:
@@ -369,7 +738,7 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
 
         # Add Available mask efficiently (without adding column to df)
         temporal, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
+            temporal, temporal_cols
         )
 
         dataset = TimeSeriesDataset(
@@ -382,12 +751,91 @@ class TimeSeriesDataset(BaseTimeSeriesDataset):
             min_size=min_size,
             sorted=sort_df,
             y_idx=0,
+            padded_buckets=padded_buckets,
         )
         ds = df[time_col].to_numpy()
         if sort_idxs is not None:
             ds = ds[sort_idxs]
         return dataset, indices, dates, ds
 
+    def save(self, path: str):
+        """Save the dataset to the directory `path`.
+
+        The temporal data, `indptr` and the static data are stored as raw `.npy`
+        arrays next to a `meta.json` with the columns and sizes, so the dataset can
+        be opened memory-mapped by `TimeSeriesDataset.load`.
+        """
+        fs, _, (local_path,) = fsspec.get_fs_token_paths(path)
+        fs.makedirs(path, exist_ok=True)
+        arrays = dict(temporal=self.temporal.numpy(), indptr=self.indptr)
+        if self.static is not None:
+            arrays["static"] = self.static.numpy()
+        for name, array in arrays.items():
+            if "file" in fs.protocol:
+                # the temporal may be memory-mapped from this same file, write a
+                # new file and replace it instead of truncating the mapped one
+                file = f"{local_path}/{name}.npy"
+                with open(f"{file}.tmp", "wb") as f:
+                    np.save(f, array)
+                os.replace(f"{file}.tmp", file)
+            else:
+                with fsspec.open(f"{path}/{name}.npy", "wb") as f:
+                    np.save(f, array)
+        if self.__dict__.get("_mmap_file") == f"{local_path}/temporal.npy":
+            # the file it is memory-mapped from has the modifications now
+            self._mmap_modified = False
+        meta = dict(
+            temporal_cols=self.temporal_cols.tolist(),
+            static_cols=None if self.static_cols is None else list(self.static_cols),
+            max_size=int(self.max_size),
+            min_size=int(self.min_size),
+            y_idx=int(self.y_idx),
+            sorted=bool(self.sorted),
+        )
+        with fsspec.open(f"{path}/meta.json", "w") as f:
+            json.dump(meta, f)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True, padded_buckets: int = 0):
+        """Load a dataset saved with `TimeSeriesDataset.save`.
+
+        If `mmap` is True and `path` is local, the temporal data is memory-mapped
+        (copy on write) instead of read, only the pages of the series in each batch
+        are read from disk and processes opening the same file share them.
+        """
+        with fsspec.open(f"{path}/meta.json", "r") as f:
+            meta = json.load(f)
+        fs, _, (local_path,) = fsspec.get_fs_token_paths(path)
+        mmap = mmap and "file" in fs.protocol
+
+        def read(name):
+            with fsspec.open(f"{path}/{name}.npy", "rb") as f:
+                return np.load(f)
+
+        if mmap:
+            temporal = TimeSeriesDataset._open_temporal(f"{local_path}/temporal.npy")
+        else:
+            temporal = torch.from_numpy(read("temporal"))
+        static = None
+        if meta["static_cols"] is not None:
+            static = read("static")
+            meta["static_cols"] = pd.Index(meta["static_cols"])
+        dataset = TimeSeriesDataset(
+            temporal=temporal,
+            indptr=read("indptr"),
+            static=static,
+            padded_buckets=padded_buckets,
+            copy=False,
+            **meta,
+        )
+        if mmap:
+            dataset._mmap_file = f"{local_path}/temporal.npy"
+        return dataset
+
+    @staticmethod
+    def _open_temporal(file):
+        return torch.from_numpy(np.load(file, mmap_mode="c"))
+
 # %% ../nbs/tsdataset.ipynb 9
 class _FilesDataset:
     def __init__(
@@ -409,6 +857,93 @@ class _FilesDataset:
         self.min_size = min_size
 
 # %% ../nbs/tsdataset.ipynb 10
+def _scan_directory(directory, time_col, cached=None):
+    # Row count, last time and columns of the parquet files of a serie directory.
+    # `cached` is a previous scan, whose files that weren't modified are reused.
+    import pyarrow.parquet as pq
+
+    dir_path = Path(directory)
+    if not dir_path.is_dir():
+        raise ValueError(f"paths must be directories, {directory} is not.")
+    cached = {(f["file"], f["mtime"]): f for f in cached or []}
+
+    scan = []
+    for file in dir_path.glob("*.parquet"):
+        file, mtime = str(file), file.stat().st_mtime_ns
+        if (file, mtime) in cached:
+            scan.append(cached[file, mtime])
+            continue
+        meta = pq.read_metadata(file)
+        rg = meta.row_group(0)
+        col2pos = {rg.column(i).path_in_schema: i for i in range(rg.num_columns)}
+        last_time = (
+            meta.row_group(meta.num_row_groups - 1)
+            .column(col2pos[time_col])
+            .statistics.max
+        )
+        rows = sum(meta.row_group(i).num_rows for i in range(meta.num_row_groups))
+        scan.append(
+            dict(
+                file=file,
+                mtime=mtime,
+                rows=rows,
+                last_time=last_time,
+                columns=set(col2pos),
+            )
+        )
+    return scan
+
+
+# types of the times stored as ISO text in the index of the scanned files
+_INDEX_TIME_TYPES = {"datetime": datetime.datetime, "date": datetime.date}
+
+
+def _to_index_entry(file_meta):
+    # JSON entry of a scanned file
+    last_time = file_meta["last_time"]
+    for name, time_type in _INDEX_TIME_TYPES.items():
+        if isinstance(last_time, time_type):
+            last_time = {name: last_time.isoformat()}
+            break
+    return {
+        **file_meta,
+        "last_time": last_time,
+        "columns": sorted(file_meta["columns"]),
+    }
+
+
+def _from_index_entry(entry):
+    last_time = entry["last_time"]
+    if isinstance(last_time, dict):
+        ((name, text),) = last_time.items()
+        last_time = _INDEX_TIME_TYPES[name].fromisoformat(text)
+    return {**entry, "last_time": last_time, "columns": set(entry["columns"])}
+
+
+class _LRUCache:
+    # Least recently used cache of arrays holding at most `max_bytes`.
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        if value.nbytes > self.max_bytes or key in self._data:
+            return
+        self._data[key] = value
+        self.nbytes += value.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+
 class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
 
     def __init__(
@@ -426,6 +961,9 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         static=None,
         static_cols=None,
         sorted=False,
+        num_threads: Optional[int] = None,
+        cache_bytes: int = 0,
+        prefetch_batches: int = 0,
     ):
         super().__init__(
             temporal_cols=temporal_cols,
@@ -444,25 +982,98 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         self.last_times = last_times
         self.indices = indices
         self.n_groups = len(files_ds)
+        # Reader: threads reading the series of a batch, bytes of decoded
+        # series kept in memory and batches loaded ahead by the loaders
+        self.num_threads = num_threads
+        self.cache_bytes = cache_bytes
+        self.prefetch_batches = prefetch_batches
+        self._cache = _LRUCache(cache_bytes)
+        self._executor = None
+
+    def __getstate__(self):
+        # the thread pool and the cache stay in the process that created them
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_cache"] = _LRUCache(self.cache_bytes)
+        return state
+
+    @property
+    def _item_temporal_cols(self):
+        if "available_mask" in self.temporal_cols:
+            return self.temporal_cols
+        return self.temporal_cols.append(pd.Index(["available_mask"]))
+
+    def _read_serie(self, idx):
+        # [T, C] float32 data of the serie, read with pyarrow without pandas
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = self.temporal_cols.tolist()
+        table = pq.read_table(self.files_ds[idx], columns=columns, use_threads=False)
+        data = np.ones(
+            (table.num_rows, len(self._item_temporal_cols)), dtype=np.float32
+        )
+        for j, col in enumerate(columns):
+            # nulls are read as NaN, like in pandas
+            data[:, j] = table.column(col).cast(pa.float32()).to_numpy()
+        return data
+
+    def _map(self, fn, items):
+        if self.num_threads == 1 or len(items) < 2:
+            return map(fn, items)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+        return self._executor.map(fn, items)
+
+    def _padded_temporal(self, idxs, size):
+        # Left padded [B, C, size] temporal of the series, cached series are
+        # copied and the rest are read concurrently into the batch tensor.
+        temporal = torch.zeros(
+            size=(len(idxs), len(self._item_temporal_cols), size), dtype=torch.float32
+        )
+
+        def fill(i, data):
+            n = min(len(data), size)
+            temporal[i, :, size - n :] = torch.from_numpy(data[len(data) - n :].T)
+
+        misses = []
+        for i, idx in enumerate(idxs):
+            data = self._cache.get(idx)
+            if data is None:
+                misses.append((i, idx))
+            else:
+                fill(i, data)
+
+        def read(miss):
+            data = self._read_serie(miss[1])
+            fill(miss[0], data)
+            return data
+
+        for (_, idx), data in zip(misses, self._map(read, misses)):
+            self._cache.put(idx, data)
+        return temporal
+
+    def __getitems__(self, idxs):
+        # Batched __getitem__ used by the DataLoader, returns the collated batch.
+        pad_size = getattr(idxs, "pad_size", self.max_size)
+        idxs = [int(idx) for idx in idxs]
+        batch = dict(
+            temporal=self._padded_temporal(idxs, pad_size),
+            temporal_cols=self._item_temporal_cols,
+            y_idx=self.y_idx,
+            idx=np.array(idxs),
+        )
+        if self.static is not None:
+            batch["static"] = self.static[idxs]
+            batch["static_cols"] = self.static_cols
+        return batch
 
     def __getitem__(self, idx):
         if not isinstance(idx, int):
             raise ValueError(f"idx must be int, got {type(idx)}")
 
-        temporal_cols = self.temporal_cols.copy()
-        data = pd.read_parquet(
-            self.files_ds[idx], columns=temporal_cols.tolist()
-        ).to_numpy()
-        data, temporal_cols = TimeSeriesDataset._ensure_available_mask(
-            data, temporal_cols
-        )
-        data = self._as_torch_copy(data)
-
-        # Pad the temporal data to the left
-        temporal = torch.zeros(
-            size=(len(temporal_cols), self.max_size), dtype=torch.float32
-        )
-        temporal[: len(temporal_cols), -len(data) :] = data.permute(1, 0)
+        temporal_cols = self._item_temporal_cols
+        temporal = self._padded_temporal([idx], self.max_size)[0]
 
         # Add static data if available
         static = None if self.static is None else self.static[idx, :]
@@ -473,6 +1084,7 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             static=static,
             static_cols=self.static_cols,
             y_idx=self.y_idx,
+            idx=idx,
         )
 
         return item
@@ -486,17 +1098,53 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         id_col="unique_id",
         time_col="ds",
         target_col="y",
+        num_threads=None,
+        cache_bytes=0,
+        prefetch_batches=0,
+        index_path=None,
     ):
         """We expect directories to be a list of directories of the form [unique_id=id_0, unique_id=id_1, ...]. Each directory should contain the timeseries corresponding to that unqiue_id,
         represented as a pandas or polars DataFrame. The timeseries can be entirely contained in one parquet file or split between multiple, but within each parquet files the timeseries should be sorted by time.
-        Static df should also be a pandas or polars DataFrame"""
-        import pyarrow as pa
-
+        Static df should also be a pandas or polars DataFrame.
+        The directories are scanned and batches are read with `num_threads` threads (None uses the `ThreadPoolExecutor` default), up to `cache_bytes` of
+        decoded series are kept in memory between epochs and the loaders read `prefetch_batches` batches ahead.
+        If `index_path` is given, the files metadata is stored in that JSON file and later calls only scan the directories with new or modified files.
+        """
         # Define indices if not given and then extract static features
         static, static_cols = TimeSeriesDataset._extract_static_features(
             static_df, sort_df, id_col
         )
 
+        # Row count, last time and columns of every file, reusing the index
+        index = {}
+        if index_path is not None and os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if index.get("time_col") != time_col:
+                index = {}
+        scanned = {
+            dir: [_from_index_entry(entry) for entry in entries]
+            for dir, entries in index.get("directories", {}).items()
+        }
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            scans = list(
+                executor.map(
+                    lambda dir: _scan_directory(dir, time_col, scanned.get(str(dir))),
+                    directories,
+                )
+            )
+        if index_path is not None:
+            index = dict(
+                time_col=time_col,
+                directories={
+                    str(dir): [_to_index_entry(file_meta) for file_meta in scan]
+                    for dir, scan in zip(directories, scans)
+                },
+            )
+            with open(f"{index_path}.tmp", "w") as f:
+                json.dump(index, f)
+            os.replace(f"{index_path}.tmp", index_path)
+
         max_size = 0
         min_size = float("inf")
         last_times = []
@@ -504,42 +1152,27 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
         expected_temporal = {target_col, *exogs}
         available_mask_seen = True
 
-        for dir in directories:
-            dir_path = Path(dir)
-            if not dir_path.is_dir():
-                raise ValueError(f"paths must be directories, {dir} is not.")
-            uid = dir_path.name.split("=")[-1]
+        for dir, scan in zip(directories, scans):
+            uid = Path(dir).name.split("=")[-1]
             total_rows = 0
             last_time = None
-            for file in dir_path.glob("*.parquet"):
-                meta = pa.parquet.read_metadata(file)
-                rg = meta.row_group(0)
-                col2pos = {
-                    rg.column(i).path_in_schema: i for i in range(rg.num_columns)
-                }
-
-                last_time_file = (
-                    meta.row_group(meta.num_row_groups - 1)
-                    .column(col2pos[time_col])
-                    .statistics.max
-                )
+            for file_meta in scan:
                 last_time = (
-                    max(last_time, last_time_file)
+                    max(last_time, file_meta["last_time"])
                     if last_time is not None
-                    else last_time_file
-                )
-                total_rows += sum(
-                    meta.row_group(i).num_rows for i in range(meta.num_row_groups)
+                    else file_meta["last_time"]
                 )
+                total_rows += file_meta["rows"]
+                columns = file_meta["columns"]
 
                 # Check all the temporal columns are present
-                missing_cols = expected_temporal - col2pos.keys()
+                missing_cols = expected_temporal - columns
                 if missing_cols:
                     raise ValueError(
-                        f"Temporal columns: {missing_cols} not found in the file: {file}."
+                        f"Temporal columns: {missing_cols} not found in the file: {file_meta['file']}."
                     )
 
-                if "available_mask" not in col2pos.keys():
+                if "available_mask" not in columns:
                     available_mask_seen = False
                 elif not available_mask_seen:
                     # If this is triggered the available_mask column is present in this file but has been missing from previous files.
@@ -575,10 +1208,85 @@ class LocalFilesTimeSeriesDataset(BaseTimeSeriesDataset):
             static=static,
             static_cols=static_cols,
             sorted=sort_df,
+            num_threads=num_threads,
+            cache_bytes=cache_bytes,
+            prefetch_batches=prefetch_batches,
         )
         return dataset
 
 # %% ../nbs/tsdataset.ipynb 13
+class _BatchIdxs(list):
+    # Indices of a batch, `pad_size` is the temporal size the batch is padded to.
+    pad_size: int
+
+
+class _LengthBucketBatchSampler(torch.utils.data.Sampler):
+    """Batch sampler that groups series of similar length.
+
+    The (shuffled) series are split in pools of `pool_batches` batches, each pool
+    is sorted by length and cut into batches, and the order of the batches is
+    shuffled. Every batch is padded only to its longest serie plus `min_padding`
+    (and at least to `min_size`), rounded so that the cut from `max_size` is a
+    multiple of `padding_step`.
+    """
+
+    def __init__(
+        self,
+        sizes,
+        batch_size,
+        max_size,
+        shuffle=True,
+        drop_last=False,
+        min_padding=0,
+        min_size=0,
+        padding_step=1,
+        pool_batches=50,
+    ):
+        self.sizes = np.asarray(sizes)
+        self.batch_size = batch_size
+        self.max_size = max_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.min_padding = min_padding
+        self.min_size = min_size
+        self.padding_step = max(padding_step, 1)
+        self.pool_batches = pool_batches
+
+    def __len__(self):
+        n_series = len(self.sizes)
+        if self.drop_last:
+            return n_series // self.batch_size
+        return -(-n_series // self.batch_size)
+
+    def _pad_size(self, idxs):
+        need = max(self.sizes[idxs].max() + self.min_padding, self.min_size)
+        need = min(self.max_size, need)
+        cut = self.padding_step * ((self.max_size - need) // self.padding_step)
+        return int(self.max_size - cut)
+
+    def __iter__(self):
+        if self.shuffle:
+            order = torch.randperm(len(self.sizes)).numpy()
+        else:
+            order = np.arange(len(self.sizes))
+        pool_size = self.batch_size * self.pool_batches
+        batches = []
+        for start in range(0, len(order), pool_size):
+            pool = order[start : start + pool_size]
+            pool = pool[np.argsort(self.sizes[pool], kind="stable")]
+            batches.extend(
+                np.array_split(pool, range(self.batch_size, len(pool), self.batch_size))
+            )
+        if self.drop_last:
+            batches = [batch for batch in batches if len(batch) == self.batch_size]
+        if self.shuffle:
+            batches = [batches[i] for i in torch.randperm(len(batches)).tolist()]
+        for batch in batches:
+            batch_idxs = _BatchIdxs(batch.tolist())
+            batch_idxs.pad_size = self._pad_size(batch)
+            yield batch_idxs
+
+
 class TimeSeriesDataModule(pl.LightningDataModule):
 
     def __init__(
@@ -589,6 +1297,8 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         num_workers=0,
         drop_last=False,
         shuffle_train=True,
+        bucket_by_length=False,
+        bucket_kwargs=None,
     ):
         super().__init__()
         self.dataset = dataset
@@ -597,14 +1307,37 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         self.num_workers = num_workers
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.bucket_by_length = bucket_by_length
+        self.bucket_kwargs = bucket_kwargs or {}
 
     def train_dataloader(self):
+        if self.bucket_by_length:
+            if hasattr(self.dataset, "indptr"):
+                batch_sampler = _LengthBucketBatchSampler(
+                    sizes=np.diff(self.dataset.indptr),
+                    batch_size=self.batch_size,
+                    max_size=self.dataset.max_size,
+                    shuffle=self.shuffle_train,
+                    drop_last=self.drop_last,
+                    **self.bucket_kwargs,
+                )
+                return TimeSeriesLoader(
+                    self.dataset,
+                    batch_sampler=batch_sampler,
+                    num_workers=self.num_workers,
+                    prefetch_batches=getattr(self.dataset, "prefetch_batches", 0),
+                )
+            warnings.warn(
+                f"bucket_by_length is not supported for {type(self.dataset).__name__}, "
+                "using the default batch sampler."
+            )
         loader = TimeSeriesLoader(
             self.dataset,
             batch_size=self.batch_size,
             num_workers=self.num_workers,
             shuffle=self.shuffle_train,
             drop_last=self.drop_last,
+            prefetch_batches=getattr(self.dataset, "prefetch_batches", 0),
         )
         return loader
 
@@ -615,6 +1348,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             num_workers=self.num_workers,
             shuffle=False,
             drop_last=self.drop_last,
+            prefetch_batches=getattr(self.dataset, "prefetch_batches", 0),
         )
         return loader
 
@@ -637,6 +1371,8 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         num_workers=0,
         drop_last=False,
         shuffle_train=True,
+        bucket_by_length=False,
+        bucket_kwargs=None,
     ):
         super(TimeSeriesDataModule, self).__init__()
         self.files_ds = dataset
@@ -645,6 +1381,8 @@ class _DistributedTimeSeriesDataModule(TimeSeriesDataModule):
         self.num_workers = num_workers
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
+        self.bucket_by_length = bucket_by_length
+        self.bucket_kwargs = bucket_kwargs or {}
 
     def setup(self, stage):
         import torch.distributed as dist
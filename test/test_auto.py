@@ -0,0 +1,176 @@
+#%% Test BaseAuto trial pruning
+import optuna
+import pandas as pd
+import pytest
+
+from neuralforecast import NeuralForecast
+from neuralforecast.auto import AutoMLP, AutoTSMixer
+from neuralforecast.losses.pytorch import MAE
+from neuralforecast.utils import AirPassengersDF, generate_series
+
+
+class _PruneAfterFirstTrial(optuna.pruners.BasePruner):
+    def prune(self, study, trial):
+        return trial.number > 0
+
+
+@pytest.mark.parametrize("scheduler", [None, _PruneAfterFirstTrial()])
+def test_optuna_pruning(scheduler):
+    def config(trial):
+        return {
+            "input_size": 24,
+            "hidden_size": trial.suggest_categorical("hidden_size", [8, 16]),
+            "max_steps": 20,
+            "val_check_steps": 5,
+            "enable_progress_bar": False,
+            "logger": False,
+        }
+
+    model = AutoMLP(
+        h=12,
+        loss=MAE(),
+        config=config,
+        num_samples=3,
+        backend="optuna",
+        scheduler=scheduler,
+    )
+    nf = NeuralForecast(models=[model], freq="ME")
+    nf.fit(AirPassengersDF)
+    study = nf.models[0].results
+    states = [trial.state for trial in study.trials]
+    steps = [list(trial.intermediate_values) for trial in study.trials]
+    # every validation loss is reported
+    assert steps[0] == [5, 10, 15, 20]
+    if scheduler is None:
+        assert states == [optuna.trial.TrialState.COMPLETE] * 3
+        assert steps[1:] == [[5, 10, 15, 20]] * 2
+    else:
+        # pruned trials stop training at the validation that pruned them
+        assert states[1:] == [optuna.trial.TrialState.PRUNED] * 2
+        assert steps[1:] == [[5]] * 2
+        assert study.best_trial.number == 0
+
+
+#%% Test BaseAuto reuses the best trial
+@pytest.mark.parametrize("refit_with_val", [False, True])
+def test_reuse_best_trial(monkeypatch, refit_with_val):
+    fits = []
+    fit_model = AutoMLP._fit_model
+
+    def counting_fit_model(self, **kwargs):
+        fits.append(kwargs["val_size"])
+        return fit_model(self, **kwargs)
+
+    monkeypatch.setattr(AutoMLP, "_fit_model", counting_fit_model)
+
+    def config(trial):
+        return {
+            "input_size": 24,
+            "hidden_size": trial.suggest_categorical("hidden_size", [8, 16]),
+            "max_steps": 10,
+            "enable_progress_bar": False,
+            "logger": False,
+        }
+
+    model = AutoMLP(
+        h=12,
+        loss=MAE(),
+        config=config,
+        num_samples=2,
+        backend="optuna",
+        refit_with_val=refit_with_val,
+    )
+    nf = NeuralForecast(models=[model], freq="ME")
+    nf.fit(AirPassengersDF)
+    # the refit without validation set trains on a different split
+    assert fits == [12, 12] + [0] * (not refit_with_val)
+    # without fidelities the standard search is the one that ran
+    assert nf.models[0].standard_seconds == nf.models[0].trial_seconds[0]
+    if not refit_with_val:
+        return
+    auto = nf.models[0]
+    best_trial = auto.results.best_trial
+    assert auto.model.val_size == 12
+    assert auto.model.metrics["ptl/val_loss"] == best_trial.value
+    fcsts = nf.predict()
+
+    # same model as training the best config again
+    auto.model = fit_model(
+        auto,
+        cls_model=auto.cls_model,
+        config=best_trial.user_attrs["ALL_PARAMS"],
+        dataset=nf.dataset,
+        val_size=12,
+        test_size=0,
+    )
+    pd.testing.assert_frame_equal(fcsts, nf.predict())
+
+
+#%% Test BaseAuto multi-fidelity search
+def test_multi_fidelity(monkeypatch):
+    fits = []
+    fit_model = AutoMLP._fit_model
+
+    def recording_fit_model(self, **kwargs):
+        fits.append((kwargs["dataset"].n_groups, kwargs.get("max_steps_fraction", 1)))
+        return fit_model(self, **kwargs)
+
+    monkeypatch.setattr(AutoMLP, "_fit_model", recording_fit_model)
+
+    df = generate_series(n_series=16, min_length=60, max_length=120, seed=0)
+
+    def config(trial):
+        return {
+            "input_size": 12,
+            "learning_rate": trial.suggest_float("learning_rate", 1e-4, 1e-1, log=True),
+            "max_steps": 8,
+            "enable_progress_bar": False,
+            "logger": False,
+        }
+
+    model = AutoMLP(
+        h=6,
+        loss=MAE(),
+        config=config,
+        num_samples=9,
+        backend="optuna",
+        fidelities=[(0.25, 0.5)],
+        refit_with_val=True,
+    )
+    nf = NeuralForecast(models=[model], freq="D")
+    nf.fit(df)
+    auto = nf.models[0]
+    n_subset = fits[0][0]
+    assert 4 <= n_subset < 16
+    # 9 configs on the subset for half the steps, the best 3 on the whole dataset
+    assert fits == [(n_subset, 0.5)] * 9 + [(16, 1.0)] * 3
+    assert len(auto.trial_seconds) == 2
+    assert all(seconds > 0 for seconds in auto.trial_seconds)
+    # the standard search would train the 9 configs like the 3 of the last rung
+    assert auto.standard_seconds == pytest.approx(3 * auto.trial_seconds[-1])
+    assert len(auto.results.trials) == 3
+    assert auto.model.max_steps == 8
+
+
+def test_multi_fidelity_multivariate():
+    df = generate_series(n_series=4, min_length=60, max_length=60, seed=0)
+
+    def config(trial):
+        return {
+            "input_size": 12,
+            "n_series": 4,
+            "learning_rate": trial.suggest_float("learning_rate", 1e-4, 1e-1, log=True),
+            "max_steps": 4,
+            "enable_progress_bar": False,
+            "logger": False,
+        }
+
+    kwargs = dict(h=6, n_series=4, loss=MAE(), config=config, backend="optuna")
+    # the multivariate models need all the series
+    with pytest.raises(ValueError, match="series_fraction=1"):
+        AutoTSMixer(num_samples=3, fidelities=[(0.5, 0.5)], **kwargs)
+    model = AutoTSMixer(num_samples=3, fidelities=[(1.0, 0.5)], **kwargs)
+    nf = NeuralForecast(models=[model], freq="D")
+    nf.fit(df)
+    assert len(nf.models[0].trial_seconds) == 2
+    assert nf.predict()["AutoTSMixer"].notna().all()
@@ -0,0 +1,171 @@
+#%% Test the warm started refit cross validation
+import numpy as np
+import pandas as pd
+import pytorch_lightning as pl
+import pytest
+import torch
+
+from neuralforecast import NeuralForecast
+from neuralforecast.losses.pytorch import MAE
+from neuralforecast.models import LSTM, NHITS
+from neuralforecast.tsdataset import TimeSeriesDataset
+from neuralforecast.utils import AirPassengersPanel
+
+
+class AdamSteps(pl.Callback):
+    # Adam steps of the optimizer when each fit starts and number of batches
+    def __init__(self):
+        self.fits = []
+
+    def on_train_start(self, trainer, pl_module):
+        self.fits.append([None, 0])
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx):
+        if self.fits[-1][0] is None:
+            state = trainer.optimizers[0].state
+            steps = [int(s["step"]) for s in state.values()]
+            self.fits[-1][0] = steps[0] if steps else 0
+        self.fits[-1][1] += 1
+
+
+@pytest.mark.parametrize("model_cls", [NHITS, LSTM])
+def test_warm_start_cross_validation(model_cls):
+    df = AirPassengersPanel.drop(columns=["y_[lag12]"])
+    model = model_cls(
+        h=12,
+        input_size=24,
+        max_steps=5,
+        futr_exog_list=["trend"],
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        accelerator="cpu",
+        callbacks=[AdamSteps()],
+    )
+    nf = NeuralForecast(models=[model], freq="ME")
+    cv = nf.cross_validation(df, n_windows=4, step_size=3, refit=2, warm_start_steps=2)
+    model = nf.models[0]
+    callback = model.trainer_kwargs["callbacks"][0]
+    assert cv["cutoff"].nunique() == 4
+    assert not cv[type(model).__name__].isna().any()
+    # the second fit resumes the first one's optimizer for warm_start_steps
+    assert callback.fits == [[0, 5], [5, 2]]
+    assert not hasattr(model, "_warm_start_state")
+
+    # the extended dataset is the one of the last refit's train
+    last_cutoff = cv["cutoff"].unique()[2]
+    train = df[df["ds"] <= last_cutoff]
+    expected, uids, last_dates, ds = TimeSeriesDataset.from_df(train)
+    torch.testing.assert_close(nf.dataset.temporal, expected.temporal)
+    np.testing.assert_array_equal(nf.dataset.indptr, expected.indptr)
+    np.testing.assert_array_equal(nf.ds, ds)
+    np.testing.assert_array_equal(np.asarray(nf.last_dates), np.asarray(last_dates))
+
+
+def test_parallel_refit_cross_validation():
+    df = AirPassengersPanel.drop(columns=["y_[lag12]"])
+    models = [
+        NHITS(
+            h=12,
+            input_size=24,
+            max_steps=2,
+            futr_exog_list=["trend"],
+            logger=False,
+            enable_progress_bar=False,
+            enable_model_summary=False,
+            accelerator="cpu",
+        )
+    ]
+    cv_kwargs = dict(n_windows=3, step_size=4, refit=2)
+    nf = NeuralForecast(models=models, freq="ME")
+    cv = nf.cross_validation(df, n_jobs=2, **cv_kwargs)
+    assert nf._fitted and nf.dataset.n_groups == 2
+
+    # each group of windows between refits starts from the initial models
+    serial = NeuralForecast(models=models, freq="ME")
+    expected = serial.cross_validation(df, **cv_kwargs)
+    cutoffs = expected["cutoff"].unique()
+    first = expected[expected["cutoff"] < cutoffs[2]]
+    # while the serial refits continue from the previous weights
+    serial_last = expected[expected["cutoff"] == cutoffs[2]].reset_index(drop=True)
+    parallel_last = cv[cv["cutoff"] == cutoffs[2]].reset_index(drop=True)
+    assert not np.allclose(serial_last["NHITS"], parallel_last["NHITS"])
+    last = NeuralForecast(models=models, freq="ME").cross_validation(
+        df, n_windows=1, step_size=4
+    )
+    expected = pd.concat([first, last]).reset_index()
+    expected = expected.sort_values(["unique_id", "cutoff", "ds"], ignore_index=True)
+    pd.testing.assert_frame_equal(cv.reset_index(), expected)
+
+
+@pytest.mark.parametrize("local_scaler_type", [None, "standard"])
+@pytest.mark.parametrize("step_size", [1, 3])
+def test_no_refit_cross_validation_windows(local_scaler_type, step_size):
+    from neuralforecast.utils import generate_series
+
+    df = generate_series(20, min_length=8, max_length=40, seed=0)
+    df["y"] = df["y"].astype(np.float32)
+    model = NHITS(
+        h=4,
+        input_size=8,
+        loss=MAE(),
+        max_steps=1,
+        start_padding_enabled=True,
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        accelerator="cpu",
+    )
+    nf = NeuralForecast(models=[model], freq="D", local_scaler_type=local_scaler_type)
+    cv = nf.cross_validation(df, n_windows=5, step_size=step_size).reset_index()
+
+    # the windows of each serie are those of `backtest_splits` that fit in it
+    sizes = df.groupby("unique_id", observed=True).size()
+    expected = []
+    for serie, serie_df in df.groupby("unique_id", observed=True):
+        for window in range(5):
+            offset = 4 + step_size * (4 - window)
+            if offset >= sizes[serie]:
+                continue
+            cutoff = serie_df["ds"].iloc[-offset - 1]
+            test = serie_df.iloc[len(serie_df) - offset :].head(4)
+            expected.append(test.assign(cutoff=cutoff))
+    expected = pd.concat(expected, ignore_index=True)
+    pd.testing.assert_frame_equal(
+        cv[["unique_id", "ds", "cutoff"]], expected[["unique_id", "ds", "cutoff"]]
+    )
+    np.testing.assert_allclose(cv["y"], expected["y"], rtol=1e-5, atol=1e-6)
+    assert not cv["NHITS"].isna().any()
+
+    # the stored dataset gives the same windows
+    cv_stored = nf.cross_validation(n_windows=5, step_size=step_size).reset_index()
+    pd.testing.assert_frame_equal(
+        cv_stored.drop(columns="NHITS"), cv.drop(columns="NHITS")
+    )
+
+
+@pytest.mark.parametrize("local_scaler_type", [None, "robust"])
+def test_no_refit_cross_validation_exact_target(local_scaler_type):
+    from neuralforecast.utils import generate_series
+
+    df = generate_series(5, min_length=30, max_length=40, seed=0)
+    rng = np.random.default_rng(0)
+    df["y"] = rng.integers(10**9, 10**9 + 1000, size=len(df))
+    # unsorted input
+    df = df.sample(frac=1, random_state=0)
+    model = NHITS(
+        h=4,
+        input_size=8,
+        loss=MAE(),
+        max_steps=1,
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        accelerator="cpu",
+    )
+    nf = NeuralForecast(models=[model], freq="D", local_scaler_type=local_scaler_type)
+    cv = nf.cross_validation(df, n_windows=3, step_size=2).reset_index()
+    expected = cv[["unique_id", "ds"]].merge(df, on=["unique_id", "ds"], how="left")
+    # the target is the one of the input, not the one of the float32 dataset
+    assert cv["y"].dtype == np.int64
+    np.testing.assert_array_equal(cv["y"], expected["y"])
@@ -0,0 +1,218 @@
+#%% Test the exact quantiles of DistributionLoss
+import math
+
+import pytest
+import torch
+
+from torch.distributions import NegativeBinomial, Normal, Poisson
+
+from neuralforecast.losses.pytorch import GMM, NBMM, PMM, DistributionLoss, _betainc, poisson_icdf
+
+QUANTILES = [0.001, 0.05, 0.1, 0.3, 0.5, 0.7, 0.9, 0.95, 0.999]
+
+
+def _distr_args(distribution):
+    torch.manual_seed(0)
+    B, H = 5, 4
+    loc = 10 * torch.randn(B, H)
+    scale = torch.rand(B, H) + 0.1
+    if distribution == "Normal":
+        return (loc, scale)
+    if distribution == "StudentT":
+        df = 2 + torch.rand(B, H).pow(3) * 50
+        return (df, loc, scale)
+    return (torch.rand(B, H) * 30,)
+
+
+@pytest.mark.parametrize("distribution", ["Normal", "StudentT", "Poisson"])
+def test_exact_quantiles(distribution):
+    loss = DistributionLoss(distribution, quantiles=QUANTILES, num_samples=100_000)
+    distr_args = _distr_args(distribution)
+    mean, quants = loss.predict_quantiles(distr_args)
+    assert mean.shape == (5, 4, 1)
+    assert quants.shape == (5, 4, len(QUANTILES))
+    assert (quants.diff(dim=-1) >= 0).all()
+
+    distr = loss.get_distribution(distr_args)
+    q = torch.tensor(QUANTILES, dtype=torch.float64)
+    x = quants.double()
+    if distribution == "Normal":
+        cdf = distr.cdf(quants.movedim(-1, 0)).movedim(0, -1)
+        torch.testing.assert_close(cdf, q.expand_as(cdf).float(), atol=1e-5, rtol=0)
+    elif distribution == "StudentT":
+        df = distr.df.double().unsqueeze(-1)
+        t = (x - distr.loc.double().unsqueeze(-1)) / distr.scale.double().unsqueeze(-1)
+        upper = 0.5 * _betainc(df / 2, torch.full_like(t, 0.5), df / (df + t * t))
+        cdf = torch.where(t > 0, 1 - upper, upper)
+        torch.testing.assert_close(cdf, q.expand_as(cdf), atol=1e-5, rtol=0)
+    else:
+        # smallest count whose distribution function reaches the quantile
+        rate = distr.rate.double().unsqueeze(-1)
+        assert (x == x.round()).all()
+        assert (torch.special.gammaincc(x + 1, rate) >= q).all()
+        below = torch.special.gammaincc(x, rate)
+        assert ((x == 0) | (below < q)).all()
+
+    # close to the empirical quantiles
+    _, sample_mean, sample_quants = loss.sample(distr_args)
+    inner = slice(1, -1)
+    torch.testing.assert_close(
+        quants[..., inner], sample_quants[..., inner], atol=0.5, rtol=0.05
+    )
+    torch.testing.assert_close(mean, sample_mean, atol=0.5, rtol=0.05)
+
+
+def test_student_icdf_closed_form():
+    # df=2 has the closed form t = (2q - 1) / sqrt(2q(1 - q))
+    loss = DistributionLoss("StudentT", quantiles=QUANTILES)
+    df = torch.full((1, 1), 2.0)
+    _, quants = loss.predict_quantiles((df, torch.zeros(1, 1), torch.ones(1, 1)))
+    expected = [(2 * q - 1) / math.sqrt(2 * q * (1 - q)) for q in QUANTILES]
+    torch.testing.assert_close(
+        quants.flatten(), torch.tensor(expected), rtol=1e-5, atol=0
+    )
+
+
+def _mixture_args(loss_cls):
+    torch.manual_seed(0)
+    B, H, K = 5, 4, 3
+    if loss_cls is PMM:
+        return (torch.rand(B, H, K) * 30,)
+    if loss_cls is GMM:
+        return (10 * torch.randn(B, H, K), torch.rand(B, H, K) + 0.1)
+    return (torch.rand(B, H, K) * 10 + 0.5, torch.rand(B, H, K) * 0.8 + 0.1)
+
+
+@pytest.mark.parametrize("loss_cls", [PMM, GMM, NBMM])
+def test_mixture_quantiles(loss_cls):
+    loss = loss_cls(n_components=3, quantiles=QUANTILES, num_samples=100_000)
+    distr_args = _mixture_args(loss_cls)
+    mean, quants = loss.predict_quantiles(distr_args)
+    assert mean.shape == (5, 4, 1)
+    assert quants.shape == (5, 4, len(QUANTILES))
+    assert (quants.diff(dim=-1) >= 0).all()
+
+    q = torch.tensor(QUANTILES, dtype=torch.float64)
+    args = [arg.double().unsqueeze(-2) for arg in distr_args]
+    if loss_cls is GMM:
+        cdf = Normal(*args).cdf(quants.double().unsqueeze(-1)).mean(dim=-1)
+        torch.testing.assert_close(cdf, q.expand_as(cdf), atol=1e-5, rtol=0)
+    else:
+        # smallest count whose distribution function reaches the quantile
+        if loss_cls is PMM:
+            distr = Poisson(*args)
+        else:
+            distr = NegativeBinomial(total_count=args[0], probs=args[1])
+        counts = torch.arange(2000, dtype=torch.float64).view(-1, 1, 1, 1, 1)
+        cdf = distr.log_prob(counts).exp().mean(dim=-1).cumsum(dim=0)
+        expected = (cdf >= q).double().argmax(dim=0).double()
+        torch.testing.assert_close(quants.double(), expected, atol=0, rtol=0)
+
+    # close to the empirical quantiles
+    _, sample_mean, sample_quants = loss.sample(distr_args)
+    inner = slice(1, -1)
+    torch.testing.assert_close(
+        quants[..., inner], sample_quants[..., inner], atol=1.0, rtol=0.05
+    )
+    torch.testing.assert_close(mean, sample_mean, atol=0.5, rtol=0.05)
+
+    # sampling stays available behind the flag
+    loss.exact_quantiles = False
+    torch.manual_seed(1)
+    sample_mean, sample_quants = loss.predict_quantiles(distr_args)
+    torch.manual_seed(1)
+    _, expected_mean, expected_quants = loss.sample(distr_args)
+    torch.testing.assert_close(sample_quants, expected_quants)
+    torch.testing.assert_close(sample_mean, expected_mean)
+
+
+@pytest.mark.parametrize(
+    "loss",
+    [
+        DistributionLoss("Normal", quantiles=QUANTILES, exact_quantiles=False),
+        DistributionLoss("NegativeBinomial", quantiles=QUANTILES),
+        PMM(n_components=3, quantiles=QUANTILES, exact_quantiles=False),
+        GMM(n_components=3, quantiles=QUANTILES, exact_quantiles=False),
+        NBMM(n_components=3, quantiles=QUANTILES, exact_quantiles=False),
+    ],
+)
+def test_chunked_sampling(loss):
+    if isinstance(loss, DistributionLoss):
+        distr_args = loss.scale_decouple(torch.randn(5, 4, 2).tensor_split(2, dim=-1))
+        distr_args = tuple(arg.squeeze(-1) for arg in distr_args)
+    else:
+        distr_args = _mixture_args(type(loss))
+    window_bytes = 4 * loss.num_samples * 4
+
+    # within the budget, a single call to sample
+    loss.max_sample_bytes = 5 * window_bytes
+    torch.manual_seed(0)
+    mean, quants = loss.predict_quantiles(distr_args)
+    torch.manual_seed(0)
+    _, expected_mean, expected_quants = loss.sample(distr_args)
+    torch.testing.assert_close(mean, expected_mean, atol=0, rtol=0)
+    torch.testing.assert_close(quants, expected_quants, atol=0, rtol=0)
+
+    # chunks of two windows, sampled in order
+    loss.max_sample_bytes = 2 * window_bytes + 1
+    torch.manual_seed(0)
+    mean, quants = loss.predict_quantiles(distr_args)
+    torch.manual_seed(0)
+    chunks = [
+        loss.sample(tuple(arg[start : start + 2] for arg in distr_args))
+        for start in range(0, 5, 2)
+    ]
+    torch.testing.assert_close(mean, torch.cat([c[1] for c in chunks]), atol=0, rtol=0)
+    torch.testing.assert_close(quants, torch.cat([c[2] for c in chunks]), atol=0, rtol=0)
+    torch.manual_seed(0)
+    torch.testing.assert_close(loss.predict_quantiles(distr_args)[1], quants)
+
+
+def test_poisson_icdf_edge_cases():
+    rate = torch.tensor([[0.0, 3.0, 1e4, math.inf, math.nan]])
+    q = torch.tensor([0.0, 0.5, 1.0]).view(-1, 1, 1)
+    quants = poisson_icdf(Poisson(rate, validate_args=False), q)[:, 0]
+    inf, nan = math.inf, math.nan
+    expected = torch.tensor(
+        [[0, 0, 0, inf, nan], [0, 3, 0, inf, nan], [0, inf, inf, inf, nan]]
+    )
+    # median of Poisson(1e4)
+    k = torch.arange(9_900, 10_100, dtype=torch.float64)
+    expected[1, 2] = k[torch.special.gammaincc(k + 1, torch.tensor(1e4)) >= 0.5][0]
+    torch.testing.assert_close(quants, expected, equal_nan=True)
+
+
+def test_sampled_quantiles_opt_out():
+    # HINT samples through the 0 and 1 quantiles, infinite for Normal
+    loss = DistributionLoss("Normal", quantiles=[0.5], exact_quantiles=False)
+    loss.quantiles = torch.nn.Parameter(
+        torch.tensor([0.0, 0.5, 1.0]), requires_grad=False
+    )
+    _, quants = loss.predict_quantiles(_distr_args("Normal"))
+    assert torch.isfinite(quants).all()
+    assert (quants.diff(dim=-1) >= 0).all()
+
+
+#%% Test the quantile functions in float32, used where float64 isn't supported
+@pytest.mark.parametrize("distribution", ["StudentT", "Poisson"])
+def test_float32_quantiles(distribution, monkeypatch):
+    from neuralforecast.losses import pytorch
+
+    loss = DistributionLoss(distribution, quantiles=QUANTILES)
+    distr_args = _distr_args(distribution)
+    _, expected = loss.predict_quantiles(distr_args)
+    monkeypatch.setattr(pytorch, "_icdf_dtype", lambda device: torch.float32)
+    _, quants = loss.predict_quantiles(distr_args)
+    torch.testing.assert_close(quants, expected, rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.parametrize("loss_cls", [PMM, GMM, NBMM])
+def test_float32_mixture_quantiles(loss_cls, monkeypatch):
+    from neuralforecast.losses import pytorch
+
+    loss = loss_cls(n_components=3, quantiles=QUANTILES)
+    distr_args = _mixture_args(loss_cls)
+    _, expected = loss.predict_quantiles(distr_args)
+    monkeypatch.setattr(pytorch, "_icdf_dtype", lambda device: torch.float32)
+    _, quants = loss.predict_quantiles(distr_args)
+    torch.testing.assert_close(quants, expected, rtol=1e-3, atol=1e-4)
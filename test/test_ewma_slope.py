@@ -0,0 +1,35 @@
+#%% Test the vectorized EWMA and slope embedding against the time loops
+import pytest
+import torch
+
+from neuralforecast.common._modules import EWMA, SlopeEmbedding
+
+
+def _loop_ewma(data, alpha):
+    result = torch.zeros_like(data)
+    result[:, 0, :] = data[:, 0, :]
+    for t in range(1, data.size(1)):
+        result[:, t, :] = alpha * data[:, t, :] + (1 - alpha) * result[:, t - 1, :]
+    return result
+
+
+def _loop_slope(x):
+    slopes = torch.zeros_like(x)
+    for t in range(1, x.size(2)):
+        slopes[:, :, t] = (x[:, :, t] - x[:, :, 0]) / t
+    return slopes
+
+
+@pytest.mark.parametrize("alpha", [0.1, 0.5, 1.0])
+@pytest.mark.parametrize("time", [1, 7, 96])
+def test_ewma(alpha, time):
+    torch.manual_seed(0)
+    x = torch.randn(4, time, 3, dtype=torch.float64)
+    torch.testing.assert_close(EWMA(alpha)(x), _loop_ewma(x, alpha))
+
+
+@pytest.mark.parametrize("time", [1, 7, 512])
+def test_slope_embedding(time):
+    torch.manual_seed(0)
+    x = torch.randn(4, 3, time)
+    torch.testing.assert_close(SlopeEmbedding()(x), _loop_slope(x))
@@ -0,0 +1,100 @@
+#%% Test the shared Gaussian smoothing and decomposition against per-series loops
+import pytest
+import torch
+import torch.nn.functional as F
+
+from neuralforecast.common._modules import GaussianSmoothing, SmoothResidualDecomp
+
+
+def _loop_filter(data, kernel_size, sigma):
+    # reference: one conv1d per window and series
+    kernel = torch.arange(kernel_size, dtype=torch.float32) - (kernel_size - 1) / 2
+    kernel = torch.exp(-0.5 * (kernel / sigma) ** 2)
+    kernel = (kernel / kernel.sum()).view(1, 1, -1)
+    result = torch.zeros_like(data)
+    for i in range(data.size(0)):
+        for j in range(data.size(2)):
+            result[i, :, j] = F.conv1d(
+                data[i, :, j].view(1, 1, -1), kernel, padding=kernel_size // 2
+            ).view(-1)
+    return result
+
+
+def _loop_staging(data, sigmas):
+    # reference: every stage filtered independently, the last one takes the remainder
+    data = data.clone()
+    stage_size = data.size(1) // len(sigmas)
+    for i, sigma in enumerate(sigmas):
+        start = i * stage_size
+        end = data.size(1) if i == len(sigmas) - 1 else (i + 1) * stage_size
+        data[:, start:end] = _loop_filter(data[:, start:end], 3, sigma)
+    return data
+
+
+@pytest.mark.parametrize("kernel_size,sigma", [(3, 2.75), (3, 1.75), (9, 0.5)])
+def test_single_kernel(kernel_size, sigma):
+    torch.manual_seed(0)
+    x = torch.randn(4, 23, 5)
+    smoothing = GaussianSmoothing(kernel_size, sigma)
+    torch.testing.assert_close(smoothing(x), _loop_filter(x, kernel_size, sigma))
+    assert len(smoothing.state_dict()) == 0
+
+
+@pytest.mark.parametrize("input_size", [4, 5, 23, 96])
+def test_stages(input_size):
+    torch.manual_seed(0)
+    sigmas = [1.0, 0.5, 0.2, 0.1]
+    x = torch.randn(3, input_size, 7)
+    smoothing = GaussianSmoothing(3, sigmas)
+    torch.testing.assert_close(smoothing(x), _loop_staging(x, sigmas))
+
+
+def test_per_sample_sigma():
+    torch.manual_seed(0)
+    x = torch.randn(6, 30, 4)
+    sigma = torch.rand(6) + 0.2
+    expected = torch.cat(
+        [_loop_filter(x[i : i + 1], 9, s.item()) for i, s in enumerate(sigma)]
+    )
+    torch.testing.assert_close(GaussianSmoothing(9)(x, sigma=sigma), expected)
+
+
+def test_smooth_residual_decomp():
+    torch.manual_seed(0)
+    x = torch.randn(4, 48, 5)
+    smoothed, residual = SmoothResidualDecomp(3, 2.75, 1.75)(x)
+
+    # reference: the former decomposition of HSOFTS
+    expected_smoothed = _loop_filter(x, 3, 2.75)
+    expected = x - expected_smoothed
+    min_vals = expected.min(dim=1, keepdim=True)[0]
+    max_vals = expected.max(dim=1, keepdim=True)[0]
+    expected = _loop_filter(expected, 3, 1.75)
+    expected = (expected - expected.min(dim=1, keepdim=True)[0]) / (
+        expected.max(dim=1, keepdim=True)[0]
+        - expected.min(dim=1, keepdim=True)[0]
+        + 1e-5
+    ) * (max_vals - min_vals) + min_vals
+    torch.testing.assert_close(smoothed, expected_smoothed)
+    torch.testing.assert_close(residual, expected)
+
+
+#%% Test the Gaussian filters of the H* models are built once
+@pytest.mark.parametrize("model_name", ["HSOFTS", "HiTransformer", "HPatchTST"])
+def test_model_gaussian_filter(model_name):
+    from neuralforecast import models
+
+    kwargs = dict(h=4, input_size=16)
+    if model_name != "HPatchTST":
+        kwargs["n_series"] = 3
+    model = getattr(models, model_name)(**kwargs)
+    module = model.model if model_name == "HPatchTST" else model
+    state_dict = model.state_dict().keys()
+    torch.manual_seed(0)
+    x = torch.randn(2, 16, 3)
+    expected = _loop_filter(x, 3, 0.5)
+    for _ in range(2):
+        torch.testing.assert_close(module.gaussian_filter(x, 3, 0.5), expected)
+    assert list(module.gaussian_filters) == ["3_0_5"]
+    # the kernels are buffers out of the checkpoints
+    assert model.state_dict().keys() == state_dict
@@ -0,0 +1,52 @@
+#%% Test the grouped linear layers and heads against lists of nn.Linear
+import importlib
+
+import pytest
+import torch
+import torch.nn as nn
+
+from neuralforecast.common._modules import GroupedLinear
+
+
+@pytest.mark.parametrize("bias", [True, False])
+@pytest.mark.parametrize("shared_input", [True, False])
+def test_grouped_linear(bias, shared_input):
+    torch.manual_seed(0)
+    linears = nn.ModuleList([nn.Linear(8, 5, bias=bias) for _ in range(3)])
+    torch.manual_seed(0)
+    grouped = GroupedLinear(3, 8, 5, bias=bias, shared_input=shared_input)
+    # same initialization, and the state dict of the list is converted on load
+    state_dict = grouped.state_dict()
+    grouped.load_state_dict(linears.state_dict())
+    for name, value in grouped.state_dict().items():
+        torch.testing.assert_close(value, state_dict[name])
+
+    if shared_input:
+        x = torch.randn(4, 7, 8)
+        expected = torch.stack([linear(x) for linear in linears], dim=-2)
+    else:
+        x = torch.randn(4, 7, 3, 8)
+        expected = torch.stack(
+            [linear(x[..., g, :]) for g, linear in enumerate(linears)], dim=-2
+        )
+    torch.testing.assert_close(grouped(x), expected)
+
+
+@pytest.mark.parametrize("module", ["patchtst", "hpatchtst"])
+def test_individual_flatten_head(module):
+    Flatten_Head = importlib.import_module(f"neuralforecast.models.{module}").Flatten_Head
+    n_vars, hidden_size, patch_num, h = 4, 6, 3, 5
+    head = Flatten_Head(True, n_vars, hidden_size * patch_num, h, 1).eval()
+
+    # checkpoint of the former head, with one nn.Linear per variable
+    linears = nn.ModuleList(
+        [nn.Linear(hidden_size * patch_num, h) for _ in range(n_vars)]
+    )
+    head.load_state_dict({f"linears.{k}": v for k, v in linears.state_dict().items()})
+
+    x = torch.randn(2, n_vars, hidden_size, patch_num)
+    expected = torch.stack(
+        [linear(x[:, i].flatten(start_dim=-2)) for i, linear in enumerate(linears)],
+        dim=1,
+    )
+    torch.testing.assert_close(head(x), expected)
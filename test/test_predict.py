@@ -0,0 +1,144 @@
+#%% Test the trainer-free predict against Lightning's Trainer
+import numpy as np
+import pandas as pd
+import pytest
+
+from neuralforecast import NeuralForecast
+from neuralforecast.common._base_model import BaseModel
+from neuralforecast.common._base_windows import _predict_ensemble
+from neuralforecast.losses.pytorch import DistributionLoss
+from neuralforecast.models import LSTM, MLP, NHITS, TSMixer
+from neuralforecast.tsdataset import TimeSeriesDataset
+from neuralforecast.utils import AirPassengersPanel, AirPassengersStatic
+
+COMMON = dict(
+    max_steps=2,
+    logger=False,
+    enable_progress_bar=False,
+    enable_model_summary=False,
+    accelerator="cpu",
+)
+
+
+@pytest.fixture(scope="module")
+def nf():
+    df = AirPassengersPanel[AirPassengersPanel.ds < AirPassengersPanel.ds.values[-12]]
+    models = [
+        NHITS(h=12, input_size=24, futr_exog_list=["trend"], **COMMON),
+        NHITS(
+            h=12,
+            input_size=24,
+            loss=DistributionLoss("Normal", level=[80]),
+            inference_windows_batch_size=5,
+            alias="NHITSNormal",
+            **COMMON,
+        ),
+        LSTM(h=12, input_size=24, stat_exog_list=["airline1"], **COMMON),
+        TSMixer(h=12, input_size=24, n_series=2, **COMMON),
+    ]
+    nf = NeuralForecast(models=models, freq="ME")
+    nf.fit(df, static_df=AirPassengersStatic)
+    return nf
+
+
+@pytest.fixture(scope="module")
+def futr_df():
+    futr_df = AirPassengersPanel[
+        AirPassengersPanel.ds >= AirPassengersPanel.ds.values[-12]
+    ]
+    return futr_df.drop(columns="y")
+
+
+def test_trainer_free_predict_matches_trainer(nf):
+    for model in nf.models:
+        model.set_test_size(model.h)  # forecast the last h stored timestamps
+        expected = model.predict(nf.dataset, random_seed=1)
+        fcsts = model.predict(nf.dataset, random_seed=1, trainer_free=True)
+        model.set_test_size(0)
+        np.testing.assert_allclose(fcsts, expected, rtol=1e-6)
+        assert model.training
+        assert next(model.parameters()).device.type == "cpu"
+
+
+def test_trainer_free_predict_global(nf, futr_df, monkeypatch):
+    expected = nf.predict(futr_df=futr_df)
+    monkeypatch.setattr(BaseModel, "TRAINER_FREE_PREDICT", True)
+    monkeypatch.setattr(
+        "pytorch_lightning.Trainer.predict",
+        lambda *args, **kwargs: pytest.fail("Trainer used"),
+    )
+    fcsts = nf.predict(futr_df=futr_df)
+    pd.testing.assert_frame_equal(fcsts, expected, rtol=1e-6)
+    with pytest.raises(pytest.fail.Exception, match="Trainer used"):
+        nf.predict(futr_df=futr_df, trainer_free=False)
+
+
+def test_save_overwrite_loaded_dataset(nf, tmp_path):
+    path = str(tmp_path / "nf")
+    nf.save(path, model_index=[])
+    dataset = nf.dataset
+    # the dataset is memory-mapped from the directory it overwrites
+    nf.dataset = TimeSeriesDataset.load(f"{path}/dataset")
+    try:
+        nf.save(path, model_index=[], overwrite=True)
+    finally:
+        nf.dataset = dataset
+    saved = TimeSeriesDataset.load(f"{path}/dataset")
+    np.testing.assert_array_equal(saved.temporal.numpy(), dataset.temporal.numpy())
+
+
+#%% Test the models predicted together
+def test_predict_ensemble_matches_predict():
+    df = AirPassengersPanel.copy()
+    df["x"] = np.arange(len(df), dtype=np.float32)
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    common = dict(
+        h=12,
+        input_size=24,
+        max_steps=2,
+        scaler_type="robust",
+        logger=False,
+        enable_progress_bar=False,
+        enable_model_summary=False,
+        accelerator="cpu",
+    )
+    models = [
+        NHITS(hist_exog_list=["x"], **common),
+        MLP(
+            hist_exog_list=["x", "y_[lag12]"], inference_windows_batch_size=7, **common
+        ),
+        NHITS(loss=DistributionLoss("Normal", level=[80]), **common),
+    ]
+    for model in models:
+        model.fit(dataset)
+    assert len({model._shared_inference_key() for model in models}) == 1
+    expected = [model.predict(dataset, step_size=2, random_seed=1) for model in models]
+    fcsts = _predict_ensemble(models, dataset, step_size=2, random_seed=1)
+    for model_fcsts, model_expected in zip(fcsts, expected):
+        np.testing.assert_allclose(model_fcsts, model_expected, rtol=1e-6)
+
+
+def test_predict_ensemble_trainer_switch(monkeypatch):
+    df = AirPassengersPanel[AirPassengersPanel.ds < AirPassengersPanel.ds.values[-12]]
+    models = [
+        NHITS(h=12, input_size=24, **COMMON),
+        MLP(h=12, input_size=24, **COMMON),
+    ]
+    nf = NeuralForecast(models=models, freq="ME")
+    nf.fit(df)
+    calls = []
+
+    def predict_ensemble(models, **kwargs):
+        calls.append(len(models))
+        return _predict_ensemble(models, **kwargs)
+
+    monkeypatch.setattr("neuralforecast.core._predict_ensemble", predict_ensemble)
+    expected = nf.predict(trainer_free=False)
+    assert calls == []
+    monkeypatch.setattr(
+        "pytorch_lightning.Trainer.predict",
+        lambda *args, **kwargs: pytest.fail("Trainer used"),
+    )
+    fcsts = nf.predict(trainer_free=True)
+    assert calls == [2]
+    pd.testing.assert_frame_equal(fcsts, expected, rtol=1e-6)
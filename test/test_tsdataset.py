@@ -0,0 +1,465 @@
+#%% Test TimeSeriesDataset batched loading
+import json
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from neuralforecast.tsdataset import (
+    LocalFilesTimeSeriesDataset,
+    TimeSeriesDataset,
+    TimeSeriesLoader,
+    _LengthBucketBatchSampler,
+)
+
+
+@pytest.fixture
+def panel():
+    rng = np.random.default_rng(0)
+    sizes = [5, 17, 400, 60, 1, 330, 8]
+    df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "unique_id": i,
+                    "ds": np.arange(n),
+                    "y": rng.normal(size=n),
+                    "x": rng.normal(size=n),
+                }
+            )
+            for i, n in enumerate(sizes)
+        ]
+    )
+    static_df = pd.DataFrame(
+        {"unique_id": range(len(sizes)), "s": rng.normal(size=len(sizes))}
+    )
+    return df, static_df
+
+
+@pytest.mark.parametrize("padded_buckets", [0, 1, 3, 20])
+def test_getitems_matches_getitem(panel, padded_buckets):
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(
+        df, static_df=static_df, padded_buckets=padded_buckets
+    )
+    for idxs in ([3, 0, 6, 1, 5], [2, 5], [4]):
+        batch = dataset.__getitems__(idxs)
+        items = [dataset[i] for i in idxs]
+        torch.testing.assert_close(
+            batch["temporal"], torch.stack([item["temporal"] for item in items])
+        )
+        torch.testing.assert_close(
+            batch["static"], torch.stack([item["static"] for item in items])
+        )
+        np.testing.assert_array_equal(batch["idx"], idxs)
+
+    for batch in TimeSeriesLoader(dataset, batch_size=3, shuffle=True):
+        expected = torch.stack([dataset[int(i)]["temporal"] for i in batch["idx"]])
+        torch.testing.assert_close(batch["temporal"], expected)
+
+
+#%% Test the length bucketed batch sampler
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize("drop_last", [False, True])
+@pytest.mark.parametrize("padded_buckets", [0, 3])
+def test_length_bucketed_batches(panel, shuffle, drop_last, padded_buckets):
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(
+        df, static_df=static_df, padded_buckets=padded_buckets
+    )
+    sizes = np.diff(dataset.indptr)
+    sampler = _LengthBucketBatchSampler(
+        sizes,
+        batch_size=2,
+        max_size=dataset.max_size,
+        shuffle=shuffle,
+        drop_last=drop_last,
+        min_padding=11,
+        padding_step=3,
+        pool_batches=2,
+    )
+    loader = TimeSeriesLoader(dataset, batch_sampler=sampler)
+    batches = list(loader)
+    assert len(batches) == len(sampler)
+    seen = np.concatenate([batch["idx"] for batch in batches])
+    assert len(seen) == len(np.unique(seen))
+    assert len(seen) == (6 if drop_last else len(sizes))
+    for batch in batches:
+        pad_size = batch["temporal"].shape[-1]
+        assert pad_size >= min(dataset.max_size, sizes[batch["idx"]].max() + 11)
+        assert (dataset.max_size - pad_size) % 3 == 0
+        expected = torch.stack([dataset[int(i)]["temporal"] for i in batch["idx"]])
+        torch.testing.assert_close(batch["temporal"], expected[..., -pad_size:])
+        torch.testing.assert_close(
+            batch["static"],
+            torch.stack([dataset[int(i)]["static"] for i in batch["idx"]]),
+        )
+
+
+#%% Test append and trim_dataset
+def _series(dataset):
+    return [
+        dataset.temporal[dataset.indptr[i] : dataset.indptr[i + 1]]
+        for i in range(dataset.n_groups)
+    ]
+
+
+@pytest.mark.parametrize("reuse_buffer", [False, True])
+def test_append(panel, reuse_buffer):
+    df, _ = panel
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    futr_df = df.groupby("unique_id").tail(3).copy()
+    futr_df["ds"] += 1000
+    futr_dataset, *_ = TimeSeriesDataset.from_df(futr_df)
+    buffer_ptr = None
+    for step in range(3):
+        futr_dataset.temporal += 1
+        appended = dataset.append(futr_dataset, reuse_buffer=reuse_buffer)
+        np.testing.assert_array_equal(
+            appended.indptr, dataset.indptr + futr_dataset.indptr
+        )
+        assert appended.max_size == dataset.max_size + 3
+        for new, curr, futr in zip(
+            _series(appended), _series(dataset), _series(futr_dataset)
+        ):
+            torch.testing.assert_close(new, torch.cat([curr, futr]))
+        if reuse_buffer and step > 0:
+            assert appended.temporal.data_ptr() == buffer_ptr
+        buffer_ptr = appended.temporal.data_ptr()
+        # in place changes of the dataset are picked up by the next append
+        dataset.temporal[0] += 1
+    if reuse_buffer:
+        # same number of rows but other series sizes, a new temporal is allocated
+        reversed_ = TimeSeriesDataset.subset_dataset(
+            dataset, np.arange(dataset.n_groups)[::-1]
+        )
+        reversed_._append_buffer = dataset._append_buffer
+        appended = reversed_.append(futr_dataset, reuse_buffer=True)
+        assert appended.temporal.data_ptr() != buffer_ptr
+        for new, curr, futr in zip(
+            _series(appended), _series(reversed_), _series(futr_dataset)
+        ):
+            torch.testing.assert_close(new, torch.cat([curr, futr]))
+
+
+def test_trim_dataset(panel):
+    df, static_df = panel
+    df = df[df["unique_id"] != 4]
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    trimmed = TimeSeriesDataset.trim_dataset(dataset, left_trim=1, right_trim=2)
+    assert trimmed.min_size == dataset.min_size - 3
+    assert trimmed.max_size == dataset.max_size - 3
+    for new, curr in zip(_series(trimmed), _series(dataset)):
+        torch.testing.assert_close(new, curr[1:-2])
+    with pytest.raises(Exception, match="must be lower"):
+        TimeSeriesDataset.trim_dataset(dataset, left_trim=dataset.min_size)
+
+
+def test_subset_dataset(panel):
+    df, static_df = panel
+    dataset, uids, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    idxs = np.array([5, 1, 3])
+    subset = TimeSeriesDataset.subset_dataset(dataset, idxs)
+    expected, *_ = TimeSeriesDataset.from_df(
+        df[df["unique_id"].isin(uids[idxs])],
+        static_df=static_df[static_df["unique_id"].isin(uids[idxs])],
+    )
+    # from_df sorts the series, compare them in the subset's order
+    order = np.argsort(np.argsort(uids[idxs]))
+    expected = TimeSeriesDataset.subset_dataset(expected, order)
+    torch.testing.assert_close(subset.temporal, expected.temporal)
+    torch.testing.assert_close(subset.static, expected.static)
+    np.testing.assert_array_equal(subset.indptr, expected.indptr)
+    assert (subset.max_size, subset.min_size) == (330, 17)
+
+
+#%% Test the on-disk dataset format
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_load(panel, tmp_path, mmap):
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    dataset.save(str(tmp_path / "dataset"))
+    loaded = TimeSeriesDataset.load(str(tmp_path / "dataset"), mmap=mmap)
+    torch.testing.assert_close(loaded.temporal, dataset.temporal)
+    torch.testing.assert_close(loaded.static, dataset.static)
+    np.testing.assert_array_equal(loaded.indptr, dataset.indptr)
+    pd.testing.assert_index_equal(loaded.temporal_cols, dataset.temporal_cols)
+    pd.testing.assert_index_equal(loaded.static_cols, dataset.static_cols)
+    for attr in ("max_size", "min_size", "y_idx", "sorted", "n_groups"):
+        assert getattr(loaded, attr) == getattr(dataset, attr)
+    idxs = [2, 0, 5]
+    torch.testing.assert_close(
+        loaded.__getitems__(idxs)["temporal"], dataset.__getitems__(idxs)["temporal"]
+    )
+
+    # a memory-mapped temporal is pickled by its file until it is modified
+    unpickled = pickle.loads(pickle.dumps(loaded))
+    torch.testing.assert_close(unpickled.temporal, dataset.temporal)
+    assert ("_mmap_file" in unpickled.__dict__) == mmap
+    loaded.temporal[0] += 1
+    loaded._mark_modified()
+    unpickled = pickle.loads(pickle.dumps(loaded))
+    torch.testing.assert_close(unpickled.temporal, loaded.temporal)
+    # copy on write, the file is unchanged
+    reloaded = TimeSeriesDataset.load(str(tmp_path / "dataset"), mmap=mmap)
+    torch.testing.assert_close(reloaded.temporal, dataset.temporal)
+
+
+def test_save_to_loaded_path(panel, tmp_path):
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    path = str(tmp_path / "dataset")
+    dataset.save(path)
+    loaded = TimeSeriesDataset.load(path)
+    # saving onto the file the temporal is memory-mapped from
+    loaded.save(path)
+    torch.testing.assert_close(loaded.temporal, dataset.temporal)
+    assert loaded._mmap_path() == loaded._mmap_file
+    loaded.temporal[0] += 1
+    loaded._mark_modified()
+    assert loaded._mmap_path() is None
+    loaded.save(path)
+    torch.testing.assert_close(TimeSeriesDataset.load(path).temporal, loaded.temporal)
+    assert loaded._mmap_path() == loaded._mmap_file
+    assert sorted(os.listdir(path)) == [
+        "indptr.npy",
+        "meta.json",
+        "static.npy",
+        "temporal.npy",
+    ]
+
+
+#%% Test the dataset shared by the Auto trials
+def test_auto_shared_dataset(panel):
+    from neuralforecast.common._base_auto import BaseAuto
+
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    dataset.padded_buckets = 2
+    dataset._build_padded_store()
+    with BaseAuto._shared_dataset(dataset) as (shared, nbytes):
+        path = shared._mmap_file
+        assert nbytes > dataset.temporal.numpy().nbytes
+        # only the file, indptr and metadata are sent to the trials
+        pickled = pickle.dumps(shared)
+        assert len(pickled) < dataset.temporal.numpy().nbytes / 2
+        unpickled = pickle.loads(pickled)
+        torch.testing.assert_close(unpickled.temporal, dataset.temporal)
+        idxs = [2, 0, 5]
+        torch.testing.assert_close(
+            unpickled.__getitems__(idxs)["temporal"],
+            dataset.__getitems__(idxs)["temporal"],
+        )
+        del shared, unpickled
+        # an already memory-mapped dataset is used as is
+        with BaseAuto._shared_dataset(
+            TimeSeriesDataset.load(os.path.dirname(path))
+        ) as (reused, reused_nbytes):
+            assert reused._mmap_file == path
+            assert reused_nbytes == nbytes
+    assert not os.path.exists(path)
+
+
+def test_auto_shared_scaled_dataset(panel, tmp_path):
+    from neuralforecast import NeuralForecast
+    from neuralforecast.common._base_auto import BaseAuto
+    from neuralforecast.models import MLP
+
+    df, static_df = panel
+    dataset, *_ = TimeSeriesDataset.from_df(df, static_df=static_df)
+    dataset.save(str(tmp_path / "dataset"))
+    loaded = TimeSeriesDataset.load(str(tmp_path / "dataset"))
+    nf = NeuralForecast(
+        models=[MLP(h=1, input_size=2)], freq=1, local_scaler_type="standard"
+    )
+    # the scaling is written in place, the file is stale
+    nf._scalers_fit_transform(loaded)
+    assert loaded._mmap_path() is None
+    with BaseAuto._shared_dataset(loaded) as (shared, nbytes):
+        assert shared._mmap_file != loaded._mmap_file
+        torch.testing.assert_close(shared.temporal, loaded.temporal)
+
+
+#%% Test the LocalFilesTimeSeriesDataset reader
+@pytest.fixture
+def files_dataset(panel, tmp_path):
+    df, static_df = panel
+    directories = []
+    for uid, serie in df.groupby("unique_id"):
+        directory = tmp_path / f"unique_id={uid}"
+        directory.mkdir()
+        # series split in two files
+        half = len(serie) // 2
+        if half > 0:
+            serie.iloc[:half].to_parquet(directory / "a.parquet", index=False)
+        serie.iloc[half:].to_parquet(directory / "b.parquet", index=False)
+        directories.append(str(directory))
+
+    def make(**kwargs):
+        return LocalFilesTimeSeriesDataset.from_data_directories(
+            directories, static_df=static_df, exogs=["x"], **kwargs
+        )
+
+    return make
+
+
+@pytest.mark.parametrize("num_threads", [1, 4])
+@pytest.mark.parametrize("cache_bytes", [0, 500, 10**6])
+def test_local_files_reader(panel, files_dataset, num_threads, cache_bytes):
+    df, _ = panel
+    dataset = files_dataset(num_threads=num_threads, cache_bytes=cache_bytes)
+    sizes = df.groupby("unique_id").size().to_numpy()
+    for _ in range(2):
+        for idxs in ([3, 0, 6, 1, 5], [2, 5], [4]):
+            batch = dataset.__getitems__(idxs)
+            assert batch["temporal_cols"].tolist() == ["y", "x", "available_mask"]
+            for i, idx in enumerate(idxs):
+                serie = df[df["unique_id"] == idx][["y", "x"]].to_numpy().T
+                expected = torch.zeros(3, dataset.max_size)
+                expected[:2, -sizes[idx] :] = torch.tensor(serie, dtype=torch.float32)
+                expected[2, -sizes[idx] :] = 1
+                torch.testing.assert_close(batch["temporal"][i], expected)
+                torch.testing.assert_close(
+                    dataset[idx]["temporal"], batch["temporal"][i]
+                )
+            torch.testing.assert_close(
+                batch["static"], torch.stack([dataset[i]["static"] for i in idxs])
+            )
+        assert dataset._cache.nbytes <= cache_bytes
+    if cache_bytes == 10**6:
+        assert len(dataset._cache._data) == len(sizes)
+    # the reader state isn't pickled
+    unpickled = pickle.loads(pickle.dumps(dataset))
+    assert unpickled._cache.nbytes == 0
+    torch.testing.assert_close(
+        unpickled.__getitems__([2, 5])["temporal"],
+        dataset.__getitems__([2, 5])["temporal"],
+    )
+
+
+def test_prefetch_loader(panel, files_dataset):
+    dataset = files_dataset(prefetch_batches=2)
+    expected = list(TimeSeriesLoader(dataset, batch_size=2))
+    loader = TimeSeriesLoader(dataset, batch_size=2, prefetch_batches=2)
+    for _ in range(2):
+        batches = list(loader)
+        assert len(batches) == len(expected)
+        for batch, expected_batch in zip(batches, expected):
+            torch.testing.assert_close(batch["temporal"], expected_batch["temporal"])
+    # stopping early doesn't block the loader
+    for i, _ in enumerate(loader):
+        if i == 1:
+            break
+    # the batches are drawn in the main thread, interleaving the random draws of
+    # the sampler and of the model is reproducible and matches no prefetching
+    def shuffled(prefetch_batches):
+        torch.manual_seed(0)
+        loader = TimeSeriesLoader(
+            dataset, batch_size=2, shuffle=True, prefetch_batches=prefetch_batches
+        )
+        return [(batch["idx"].tolist(), torch.rand(1).item()) for batch in loader]
+
+    assert shuffled(2) == shuffled(0)
+
+    # the batches are drawn from the sampler as they are consumed
+    drawn = []
+
+    class RecordingSampler(torch.utils.data.Sampler):
+        def __len__(self):
+            return 4
+
+        def __iter__(self):
+            for i in range(4):
+                drawn.append(i)
+                yield [i]
+
+    loader = TimeSeriesLoader(
+        dataset, batch_sampler=RecordingSampler(), prefetch_batches=2
+    )
+    for i, _ in enumerate(loader):
+        assert len(drawn) <= i + 3
+    assert drawn == [0, 1, 2, 3]
+
+
+def test_local_files_nulls(tmp_path):
+    directory = tmp_path / "unique_id=0"
+    directory.mkdir()
+    serie = pd.DataFrame(
+        {
+            "ds": pd.date_range("2000-01-01", periods=4),
+            "y": [1.0, None, 3.0, 4.0],
+            "x": pd.array([1, 2, None, 4], dtype="Int64"),
+            "z": pd.array([True, None, False, True], dtype="boolean"),
+        }
+    )
+    serie.to_parquet(directory / "a.parquet", index=False)
+    dataset = LocalFilesTimeSeriesDataset.from_data_directories(
+        [str(directory)], exogs=["x", "z"]
+    )
+    # nulls are read as NaN, like the pandas reader
+    expected = torch.tensor(
+        [
+            [1.0, np.nan, 3.0, 4.0],
+            [1.0, 2.0, np.nan, 4.0],
+            [1.0, np.nan, 0.0, 1.0],
+            [1.0, 1.0, 1.0, 1.0],
+        ]
+    )
+    torch.testing.assert_close(dataset[0]["temporal"], expected, equal_nan=True)
+    torch.testing.assert_close(
+        dataset.__getitems__([0])["temporal"][0], expected, equal_nan=True
+    )
+
+
+def test_local_files_index(panel, files_dataset, tmp_path, monkeypatch):
+    import pyarrow.parquet as pq
+
+    read_metadata = pq.read_metadata
+    calls = []
+    monkeypatch.setattr(
+        pq, "read_metadata", lambda file: calls.append(file) or read_metadata(file)
+    )
+    index_path = str(tmp_path / "index.json")
+    expected = files_dataset(num_threads=1)
+    n_files = len(calls)
+    dataset = files_dataset(num_threads=4, index_path=index_path)
+    assert len(calls) == 2 * n_files
+    # the second scan only reads the metadata of the modified files
+    df, _ = panel
+    serie = df[df["unique_id"] == 3]
+    serie = pd.concat([serie, serie.assign(ds=serie["ds"] + len(serie))])
+    serie.to_parquet(tmp_path / "unique_id=3" / "b.parquet", index=False)
+    updated = files_dataset(index_path=index_path)
+    assert calls[2 * n_files :] == [str(tmp_path / "unique_id=3" / "b.parquet")]
+
+    for ds in (dataset, updated):
+        pd.testing.assert_index_equal(ds.temporal_cols, expected.temporal_cols)
+        assert ds.min_size == expected.min_size
+        assert ds.max_size == expected.max_size
+    pd.testing.assert_index_equal(dataset.last_times, expected.last_times)
+    assert updated.last_times[3] == len(serie) - 1
+    assert updated[3]["temporal"][-1].sum() == len(serie) + len(serie) // 4
+
+
+def test_local_files_index_times(tmp_path):
+    directory = tmp_path / "unique_id=0"
+    directory.mkdir()
+    serie = pd.DataFrame({"ds": pd.date_range("2000-01-01", periods=4), "y": 1.0})
+    serie.to_parquet(directory / "a.parquet", index=False)
+    index_path = str(tmp_path / "index.json")
+    datasets = [
+        LocalFilesTimeSeriesDataset.from_data_directories(
+            [str(directory)], index_path=index_path
+        )
+        for _ in range(2)
+    ]
+    # the times are stored as text, not pickled
+    with open(index_path) as f:
+        index = json.load(f)
+    entry = index["directories"][str(directory)][0]
+    assert entry["last_time"] == {"datetime": "2000-01-04T00:00:00"}
+    for dataset in datasets:
+        assert dataset.last_times[0] == pd.Timestamp("2000-01-04")
@@ -0,0 +1,211 @@
+#%% Test BaseWindows train windows against the unfold-based reference
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from neuralforecast.models import NHITS
+from neuralforecast.tsdataset import (
+    TimeSeriesDataset,
+    TimeSeriesLoader,
+    _LengthBucketBatchSampler,
+)
+
+
+def _unfold_windows(model, batch):
+    window_size = model.input_size + model.h
+    temporal = batch["temporal"]
+    if model.val_size + model.test_size > 0:
+        temporal = temporal[:, :, : -model.val_size - model.test_size]
+    temporal = model.padder_train(temporal)
+    windows = temporal.unfold(dimension=-1, size=window_size, step=model.step_size)
+    windows_per_serie = windows.shape[2]
+    windows = windows.permute(0, 2, 3, 1).contiguous()
+    windows = windows.reshape(-1, window_size, temporal.shape[1])
+    mask_idx = batch["temporal_cols"].get_loc("available_mask")
+    available = windows[:, : model.input_size, mask_idx].sum(axis=1) > 0
+    sample = windows[:, model.input_size :, mask_idx].sum(axis=1) > 0
+    condition = available & sample
+    static = torch.repeat_interleave(batch["static"], windows_per_serie, dim=0)
+    return windows[condition], static[condition]
+
+
+@pytest.fixture
+def batch():
+    torch.manual_seed(0)
+    temporal = torch.randn(7, 4, 60)
+    mask = (torch.rand(7, 60) > 0.3).float()
+    mask[0] = 0
+    mask[1, :50] = 0
+    mask[2, -20:] = 0
+    temporal[:, 3] = mask
+    return dict(
+        temporal=temporal,
+        temporal_cols=pd.Index(["y", "a", "b", "available_mask"]),
+        static=torch.randn(7, 2),
+        static_cols=pd.Index(["s1", "s2"]),
+        y_idx=0,
+    )
+
+
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+@pytest.mark.parametrize("step_size", [1, 3])
+@pytest.mark.parametrize("val_size", [0, 5])
+@pytest.mark.parametrize("windows_batch_size", [None, 16])
+def test_train_windows_match_unfold(
+    batch, start_padding_enabled, step_size, val_size, windows_batch_size
+):
+    model = NHITS(
+        h=6,
+        input_size=12,
+        max_steps=1,
+        start_padding_enabled=start_padding_enabled,
+        step_size=step_size,
+        windows_batch_size=windows_batch_size,
+    )
+    model.val_size = val_size
+    expected_windows, expected_static = _unfold_windows(model, batch)
+    np.random.seed(1)
+    windows = model._create_windows(batch, step="train")
+    if windows_batch_size is not None:
+        np.random.seed(1)
+        w_idxs = np.random.choice(
+            len(expected_windows),
+            size=windows_batch_size,
+            replace=len(expected_windows) < windows_batch_size,
+        )
+        expected_windows = expected_windows[w_idxs]
+        expected_static = expected_static[w_idxs]
+    torch.testing.assert_close(windows["temporal"], expected_windows)
+    torch.testing.assert_close(windows["static"], expected_static)
+
+
+#%% Test the cached valid windows index of TimeSeriesDataset
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+@pytest.mark.parametrize("step_size", [1, 2, 5])
+@pytest.mark.parametrize("val_size, test_size", [(0, 0), (4, 3)])
+def test_valid_windows_index(start_padding_enabled, step_size, val_size, test_size):
+    rng = np.random.default_rng(0)
+    sizes = [5, 17, 40, 60, 1, 33]
+    df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "unique_id": i,
+                    "ds": np.arange(n),
+                    "y": rng.normal(size=n),
+                    "available_mask": (rng.random(n) > 0.4).astype(float),
+                }
+            )
+            for i, n in enumerate(sizes)
+        ]
+    )
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    batch = next(iter(TimeSeriesLoader(dataset, batch_size=len(sizes))))
+    model = NHITS(
+        h=6,
+        input_size=12,
+        max_steps=1,
+        start_padding_enabled=start_padding_enabled,
+        step_size=step_size,
+    )
+    model.val_size = val_size
+    model.test_size = test_size
+    temporal = batch["temporal"]
+    if val_size + test_size > 0:
+        temporal = temporal[:, :, : -val_size - test_size]
+    temporal = model.padder_train(temporal)
+    condition = model._train_windows_condition(temporal[:, -1, :])
+
+    indptr, windows = dataset.valid_windows(
+        input_size=12,
+        h=6,
+        val_size=val_size,
+        test_size=test_size,
+        step_size=step_size,
+        start_padding_enabled=start_padding_enabled,
+    )
+    for i in range(len(sizes)):
+        expected = np.nonzero(condition[i].numpy())[0]
+        np.testing.assert_array_equal(windows[indptr[i] : indptr[i + 1]], expected)
+    # the index is cached by its arguments
+    assert (
+        dataset.valid_windows(
+            input_size=12,
+            h=6,
+            val_size=val_size,
+            test_size=test_size,
+            step_size=step_size,
+            start_padding_enabled=start_padding_enabled,
+        )[1]
+        is windows
+    )
+
+
+#%% Test the train windows of length bucketed batches
+@pytest.mark.parametrize("start_padding_enabled", [False, True])
+@pytest.mark.parametrize("step_size", [1, 4])
+@pytest.mark.parametrize("use_index", [False, True])
+def test_bucketed_train_windows(start_padding_enabled, step_size, use_index):
+    rng = np.random.default_rng(0)
+    sizes = [5, 17, 40, 60, 1, 33, 90, 21, 44]
+    df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "unique_id": i,
+                    "ds": np.arange(n),
+                    "y": rng.normal(size=n),
+                    "available_mask": (rng.random(n) > 0.4).astype(float),
+                }
+            )
+            for i, n in enumerate(sizes)
+        ]
+    )
+    dataset, *_ = TimeSeriesDataset.from_df(df)
+    model = NHITS(
+        h=6,
+        input_size=12,
+        max_steps=1,
+        start_padding_enabled=start_padding_enabled,
+        step_size=step_size,
+        windows_batch_size=None,
+        bucket_by_length=True,
+    )
+    model.val_size = 3
+    if use_index:
+        model._trainer = SimpleNamespace(datamodule=SimpleNamespace(dataset=dataset))
+    sampler = _LengthBucketBatchSampler(
+        np.diff(dataset.indptr),
+        batch_size=3,
+        max_size=dataset.max_size,
+        **model._bucket_kwargs(),
+    )
+    n_bucketed = 0
+    for idxs in sampler:
+        bucketed = dataset.__getitems__(idxs)
+        n_bucketed += bucketed["temporal"].shape[-1] < dataset.max_size
+        full = dataset.__getitems__(list(idxs))
+        expected = _unfold_windows_no_static(model, full)
+        if len(expected) == 0:
+            with pytest.raises(Exception, match="No windows"):
+                model._create_windows(bucketed, step="train")
+            continue
+        windows = model._create_windows(bucketed, step="train")
+        torch.testing.assert_close(windows["temporal"], expected)
+    assert n_bucketed > 0
+
+
+def _unfold_windows_no_static(model, batch):
+    window_size = model.input_size + model.h
+    temporal = batch["temporal"][:, :, : -model.val_size]
+    temporal = model.padder_train(temporal)
+    windows = temporal.unfold(dimension=-1, size=window_size, step=model.step_size)
+    windows = windows.permute(0, 2, 3, 1).reshape(-1, window_size, temporal.shape[1])
+    mask_idx = batch["temporal_cols"].get_loc("available_mask")
+    available = windows[:, : model.input_size, mask_idx].sum(axis=1) > 0
+    sample = windows[:, model.input_size :, mask_idx].sum(axis=1) > 0
+    return windows[available & sample]
+